@@ -3,7 +3,7 @@
 This DAG orchestrates the following steps built by teammates (용재 외 팀원):
 1) s3_pull.py: Load raw dataset from S3 (weather-mlops-team-data/ml_dataset/...)
 2) data_cleaning.py: Preprocess/feature engineering
-3) Save processed dataset to S3: ml_dataset/weather_features_full.csv
+3) Save processed dataset to S3: ml_dataset/weather_features/year=YYYY/month=MM/ (typed Parquet)
 4) s3_pull_processed.py: Read processed dataset back from S3
 5) split.py: Split (train/val/test = 6:2:2) + scaling
 6) train.py: Train multiple models with W&B logging and save best model to S3
@@ -90,11 +90,11 @@ with DAG(
 
     @task(task_id="step2_preprocess_and_save")
     def preprocess_and_save():
-        """Preprocess raw data then save processed CSV to S3."""
+        """Preprocess raw data then save processed dataset (typed Parquet, year/month partitions) to S3."""
         _set_env(bucket=team_bucket, wandb_settings=wandb_settings)
         from src.data.s3_pull import get_s3_data
         from src.data import data_cleaning
-        from src.utils.utils import save_to_s3
+        from src.data.processed_dataset import PROCESSED_DATASET_PREFIX, save_processed_dataset
 
         raw_df = get_s3_data()
         df = data_cleaning.clean_weather_data(raw_df)
@@ -104,9 +104,13 @@ with DAG(
         df = data_cleaning.add_region_features(df)
         df = data_cleaning.add_comfort_score(df)
 
-        out_key = "ml_dataset/weather_features_full.csv"
-        save_to_s3(df, bucket=team_bucket, key=out_key)
-        return {"processed_key": out_key, "rows": int(df.shape[0]), "cols": int(df.shape[1])}
+        written = save_processed_dataset(df, bucket=team_bucket)
+        return {
+            "processed_prefix": PROCESSED_DATASET_PREFIX,
+            "partitions": len(written),
+            "rows": int(df.shape[0]),
+            "cols": int(df.shape[1]),
+        }
 
     @task(task_id="step3_verify_processed_read")
     def verify_processed():
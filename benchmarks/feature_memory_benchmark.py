@@ -0,0 +1,118 @@
+"""피처 데이터셋 dtype 스키마 메모리 벤치마크
+
+합성 원본 데이터를 data_cleaning 파이프라인으로 가공한 뒤,
+1) CSV로 읽었을 때(float64/int64/object)와 스키마 적용 후의 DataFrame 크기,
+2) 분할+원핫인코딩+스케일링 전체 과정의 최대 메모리(tracemalloc)를 비교합니다.
+
+실행:
+    python benchmarks/feature_memory_benchmark.py --rows 500000
+"""
+
+import argparse
+import io
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data import data_cleaning
+from src.features.schema import apply_feature_schema, frame_memory_mb
+from src.models.split import split_and_scale_data
+
+
+STATIONS = ["90", "100", "108", "112", "133", "143", "152", "156", "159", "168", "184", "201", "301"]
+
+
+def make_raw_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """KMA 원본과 같은 컬럼 구성의 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "STN": rng.choice(STATIONS, rows),
+        "datetime": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 630 * 24, rows), unit="h"),
+        "TA": rng.normal(14, 10, rows).round(1),
+        "PM10": rng.gamma(2.0, 20.0, rows).round(0),
+        "WS": rng.gamma(2.0, 1.5, rows).round(1),
+        "HM": rng.uniform(10, 100, rows).round(0),
+        "PS": rng.normal(1013, 8, rows).round(1),
+        "RN": np.where(rng.random(rows) < 0.9, -9.0, rng.gamma(1.0, 3.0, rows).round(1)),
+        "WD": rng.uniform(0, 360, rows).round(0),
+        "TD": rng.normal(5, 10, rows).round(1),
+        "CA": rng.integers(0, 11, rows).astype(float),
+        "VS": rng.uniform(100, 5000, rows).round(0),
+        "SS": rng.uniform(0, 1, rows).round(1),
+    })
+
+
+def build_feature_frame(raw_df: pd.DataFrame) -> pd.DataFrame:
+    df = data_cleaning.clean_weather_data(raw_df)
+    df = data_cleaning.add_time_features(df)
+    df = data_cleaning.add_temp_features(df)
+    df = data_cleaning.add_air_quality_features(df)
+    df = data_cleaning.add_region_features(df)
+    df = data_cleaning.add_comfort_score(df)
+    return df
+
+
+def legacy_split(df: pd.DataFrame):
+    """스키마 도입 전 split_and_scale_data와 같은 처리 (float64/object 기준)"""
+    target_col = "comfort_score"
+    exclude_cols = [target_col, "pm10", "datetime", "station_id"]
+    feature_cols = [col for col in df.columns if col not in exclude_cols]
+
+    X = df[feature_cols].copy()
+    X = X.replace([-99, -9], np.nan)
+    numeric_cols = X.select_dtypes(include=[np.number]).columns
+    X[numeric_cols] = X[numeric_cols].fillna(X[numeric_cols].mean())
+    X = pd.get_dummies(X, columns=["season", "temp_category", "pm10_grade", "region"], drop_first=True)
+    y = df[target_col].fillna(df[target_col].mean())
+
+    X_temp, X_test, y_temp, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train, X_val, y_train, y_val = train_test_split(X_temp, y_temp, test_size=0.25, random_state=42)
+    scaler = StandardScaler()
+    return scaler.fit_transform(X_train), scaler.transform(X_val), scaler.transform(X_test)
+
+
+def peak_mb(fn, *args, **kwargs) -> float:
+    tracemalloc.start()
+    fn(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피처 dtype 스키마 메모리 벤치마크")
+    parser.add_argument("--rows", type=int, default=300_000)
+    args = parser.parse_args()
+
+    features = build_feature_frame(make_raw_frame(args.rows))
+
+    # 기존 경로: CSV 저장 → read_csv (dtype 유실)
+    buffer = io.StringIO()
+    features.to_csv(buffer, index=False)
+    buffer.seek(0)
+    legacy_df = pd.read_csv(buffer, low_memory=False)
+    typed_df = apply_feature_schema(legacy_df)
+
+    legacy_frame_mb = frame_memory_mb(legacy_df)
+    typed_frame_mb = frame_memory_mb(typed_df)
+
+    legacy_peak = peak_mb(legacy_split, legacy_df)
+    typed_peak = peak_mb(split_and_scale_data, df=typed_df)
+
+    print(f"\n📊 행 수: {args.rows:,}")
+    print(f"DataFrame   legacy: {legacy_frame_mb:8.1f} MB | schema: {typed_frame_mb:8.1f} MB "
+          f"({legacy_frame_mb / typed_frame_mb:.1f}x)")
+    print(f"학습 준비 피크 legacy: {legacy_peak:8.1f} MB | schema: {typed_peak:8.1f} MB "
+          f"({legacy_peak / typed_peak:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""엔트리포인트별 import 시간 벤치마크 (python -X importtime)
+
+DAG 태스크와 배치 추론 컨테이너가 시작할 때 import하는 모듈을 각각 새 인터프리터에서
+import하고, -X importtime 출력으로 전체 시간과 패키지별 self 시간 합계 상위 항목을 보여줍니다.
+
+실행:
+    python benchmarks/import_time_benchmark.py --repeat 5
+    python benchmarks/import_time_benchmark.py --module src.models.train --top 10
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = [
+    "src.utils.model_utils",
+    "src.models.split",
+    "src.models.train",
+    "src.models.tune",
+    "src.data.s3_pull_processed",
+    "batch.jobs.infer",
+]
+
+# "import time:   self [us] | cumulative | imported package"
+_LINE_PATTERN = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module: str) -> Tuple[float, Dict[str, float]]:
+    """새 인터프리터에서 module을 import하고 (전체 ms, 최상위 패키지명별 self ms 합계) 반환"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [project_root, os.path.join(project_root, "services"), env.get("PYTHONPATH", "")]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else ""
+        raise RuntimeError(f"{module} import 실패: {last_line}")
+
+    packages: Dict[str, float] = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if not match:
+            continue
+        self_us, cumulative, indent, name = match.groups()
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0) + int(self_us) / 1000
+        if len(indent) == 1:  # 최상위 import (들여쓰기 없음)
+            total_us += int(cumulative)
+    return total_us / 1000, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔트리포인트 import 시간 벤치마크")
+    parser.add_argument("--module", action="append", help="측정할 모듈 (여러 번 지정 가능)")
+    parser.add_argument("--repeat", type=int, default=3, help="모듈별 반복 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=5, help="표시할 무거운 패키지 수")
+    args = parser.parse_args()
+
+    modules: List[str] = args.module or ENTRY_POINTS
+    print(f"\n⏱️ import 시간 (중앙값, {args.repeat}회)")
+    for module in modules:
+        try:
+            runs = [measure(module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"  {module:<32} ❌ {e}")
+            continue
+
+        total_ms = statistics.median(total for total, _ in runs)
+        packages = runs[-1][1]
+        heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        summary = ", ".join(f"{name} {ms:.0f}ms" for name, ms in heaviest)
+        print(f"  {module:<32} {total_ms:8.0f} ms  | {summary}")
+
+
+if __name__ == "__main__":
+    main()
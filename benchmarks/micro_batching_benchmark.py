@@ -0,0 +1,84 @@
+"""온라인 스코어링 마이크로배칭 벤치마크
+
+RandomForest 모델 번들에 한 행짜리 요청을 동시에 보내고, 요청마다 predict하는 경우
+(max_batch_rows=1)와 마이크로배칭하는 경우의 처리량/지연 분위수/predict 호출 수를 비교합니다.
+
+실행:
+    python benchmarks/micro_batching_benchmark.py --requests 500 --max-wait-ms 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.features.feature_builder import create_scoring_features
+from src.models.batching import MicroBatcher
+from src.models.predictor import ModelBundle
+
+
+FEATURE_COLUMNS = ["temperature", "humidity", "pm10", "hour", "is_rush_hour", "temp_comfort", "is_weekend"]
+
+
+def make_observations(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "station_id": rng.choice(["108", "112", "159", "201"], rows),
+        "datetime": pd.Timestamp("2025-10-01") + pd.to_timedelta(rng.integers(0, 24 * 7, rows), unit="h"),
+        "temperature": rng.normal(14, 10, rows).round(1),
+        "humidity": rng.uniform(20, 95, rows).round(0),
+        "pm10": rng.gamma(2.0, 20.0, rows).round(0),
+    })
+
+
+def make_bundle(n_estimators: int) -> ModelBundle:
+    features = create_scoring_features(make_observations(5000))
+    X = features[FEATURE_COLUMNS].astype(float)
+    y = 100 - (X["temperature"] - 20).abs() - X["pm10"] * 0.2 - X["is_rush_hour"] * 10
+    scaler = StandardScaler().fit(X)
+    model = RandomForestRegressor(n_estimators=n_estimators, max_depth=10, n_jobs=1, random_state=42)
+    model.fit(scaler.transform(X), y)
+    return ModelBundle(model=model, scaler=scaler, config={"model_name": "rf"}, feature_columns=FEATURE_COLUMNS)
+
+
+async def run(bundle: ModelBundle, observations: pd.DataFrame, max_batch_rows: int, max_wait_ms: float):
+    batcher = MicroBatcher(bundle.predict_observations, max_batch_rows=max_batch_rows,
+                           max_wait_ms=max_wait_ms, max_queue_size=len(observations))
+    await batcher.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(batcher.submit(observations.iloc[[i]]) for i in range(len(observations))))
+    elapsed = time.perf_counter() - start
+    await batcher.stop()
+    return elapsed, batcher.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마이크로배칭 벤치마크")
+    parser.add_argument("--requests", type=int, default=500, help="동시 요청 수 (요청당 1행)")
+    parser.add_argument("--max-batch-rows", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--trees", type=int, default=100)
+    args = parser.parse_args()
+
+    bundle = make_bundle(args.trees)
+    observations = make_observations(args.requests, seed=7)
+
+    print(f"\n⏱️ 동시 요청 {args.requests}건 (RandomForest {args.trees} trees)")
+    for label, max_rows in [("요청별 predict", 1), ("마이크로배칭", args.max_batch_rows)]:
+        elapsed, stats = asyncio.run(run(bundle, observations, max_rows, args.max_wait_ms))
+        request_ms = stats["request_ms"]
+        print(f"  {label:<14} {args.requests / elapsed:8.0f} req/s | predict {stats['batches']:4d}회 | "
+              f"p50 {request_ms['p50']}ms, p95 {request_ms['p95']}ms, p99 {request_ms['p99']}ms")
+
+
+if __name__ == "__main__":
+    main()
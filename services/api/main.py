@@ -2,20 +2,79 @@ import os
 import sys
 sys.path.append('/app')
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List, Optional, Union
+
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime, timedelta  # 👈 timedelta 추가!
+import pandas as pd
 import pytz
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.utils.mysql_utils import query_prediction_by_datetime
+from src.models.batching import BatcherOverloaded, MicroBatcher
+from src.models.predictor import ModelBundleHolder
+from src.features.engine import REGION_BY_FIRST_DIGIT, UNKNOWN
+from src.utils.mysql_utils import query_predictions_for_hour
 from dotenv import load_dotenv
 
+from .snapshot import PredictionSnapshotCache
+
 load_dotenv()
 
+KST = pytz.timezone('Asia/Seoul')
+MODEL_REFRESH_SECONDS = int(os.getenv("MODEL_REFRESH_SECONDS", "300"))
+REGIONS = [*REGION_BY_FIRST_DIGIT.values(), UNKNOWN]
+
+# 시간별 전체 관측소 예측 스냅샷 (시간당 DB 쿼리 한 번, 이후 요청은 메모리 조회)
+prediction_snapshots = PredictionSnapshotCache(
+    query_predictions_for_hour,
+    ttl_seconds=float(os.getenv("PREDICTION_SNAPSHOT_TTL_SECONDS", "300")),
+)
+
+# 챔피언 모델 (시작 시 한 번 로드, 백그라운드에서 S3 ETag가 바뀌면 교체)
+model_holder = ModelBundleHolder()
+
+
+def _predict_observations(observations: pd.DataFrame):
+    bundle = model_holder.bundle
+    if bundle is None:
+        raise RuntimeError("모델이 로드되지 않았습니다.")
+    return bundle.predict_observations(observations)
+
+
+# 동시에 들어온 /score 요청을 모아 predict 한 번으로 처리 (SCORE_BATCH_* 환경변수로 한도 설정)
+score_batcher = MicroBatcher.from_env(_predict_observations)
+
+
+async def _refresh_model_periodically():
+    while True:
+        await asyncio.sleep(MODEL_REFRESH_SECONDS)
+        try:
+            await asyncio.to_thread(model_holder.refresh)
+        except Exception as e:
+            print(f"⚠️ 모델 갱신 실패 (기존 모델 유지): {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await asyncio.to_thread(model_holder.refresh, True)
+    except Exception as e:
+        print(f"⚠️ 모델 로드 실패 (/score 사용 불가, 백그라운드에서 재시도): {e}")
+    await score_batcher.start()
+    refresher = asyncio.create_task(_refresh_model_periodically())
+    yield
+    refresher.cancel()
+    await score_batcher.stop()
+
+
 app = FastAPI(
     title="Weather Comfort Score API", 
     version="0.1.0",
-    description="batch_predict.py 기반 쾌적지수 예측 API"
+    description="batch_predict.py 기반 쾌적지수 예측 API",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -31,19 +90,38 @@ def root():
     return {
         "message": "Weather Comfort Score API v0.1.0 실행 중!",
         "description": "batch_predict.py 기반 쾌적지수 예측 API",
-        "endpoints": ["/predict/now", "/predict/morning", "/predict/evening", "/predict/hourly/{type}", "/health"]
+        "endpoints": ["/predict/now", "/predict/morning", "/predict/evening", "/predict/hourly/{type}",
+                      "/predictions/stations", "/predictions/region/{region}", "/predictions/map",
+                      "/score", "/health"]
     }
 
 @app.get("/health")
 def health():
+    bundle = model_holder.bundle
     return {
         "status": "healthy",
-        "api_version": "0.1.0"
+        "api_version": "0.1.0",
+        "model_loaded": bundle is not None,
+        "model_loaded_at": bundle.loaded_at.strftime("%Y-%m-%d %H:%M:%S") if bundle else None,
     }
 
+
+def _evaluate_score(comfort_score: float):
+    """쾌적지수 → (label, 평가 문구)"""
+    if comfort_score >= 80:
+        return "excellent", "최고로 쾌적합니다! 🌟"
+    elif comfort_score >= 60:
+        return "good", "쾌적합니다 😊"
+    elif comfort_score >= 40:
+        return "moderate", "보통입니다 😐"
+    elif comfort_score >= 20:
+        return "poor", "다소 불쾌합니다 😟"
+    else:
+        return "very_poor", "불쾌합니다 ⚠️"
+
 @app.get("/predict/{prediction_type}")
-def get_comfort_score(prediction_type: str):
-    """쾌적지수 예측 (시간대 제한 포함)"""
+def get_comfort_score(prediction_type: str, station_id: str = "108"):
+    """쾌적지수 예측 (시간대 제한 포함, 기본 관측소 108=서울)"""
     if prediction_type not in ["now", "morning", "evening"]:
         raise HTTPException(status_code=400, detail="prediction_type은 now, morning, evening 중 하나여야 합니다")
     
@@ -67,7 +145,7 @@ def get_comfort_score(prediction_type: str):
         
         # 현재 시간 데이터 조회
         current_hour_dt = current_time.replace(minute=0, second=0, microsecond=0)
-        data = query_prediction_by_datetime(current_hour_dt)
+        data = prediction_snapshots.get(current_hour_dt).by_station.get(station_id)
         
         if not data:
             raise HTTPException(
@@ -75,7 +153,7 @@ def get_comfort_score(prediction_type: str):
                 detail=f"예측 데이터가 준비되지 않았습니다. (시간: {current_hour_dt})"
             )
         
-        print(f"✅ DB 조회 성공: {current_hour_dt}")
+        print(f"✅ 예측 조회 성공: {current_hour_dt} (관측소 {station_id})")
         comfort_score = data['comfort_score']
         weather_data = {
             'temperature': data.get('temperature'),
@@ -94,21 +172,7 @@ def get_comfort_score(prediction_type: str):
             "evening": "🌆 퇴근길 예측 (17-22시)"
         }
         
-        if comfort_score >= 80:
-            label = "excellent"
-            evaluation = "최고로 쾌적합니다! 🌟"
-        elif comfort_score >= 60:
-            label = "good"
-            evaluation = "쾌적합니다 😊"
-        elif comfort_score >= 40:
-            label = "moderate"
-            evaluation = "보통입니다 😐"
-        elif comfort_score >= 20:
-            label = "poor"
-            evaluation = "다소 불쾌합니다 😟"
-        else:
-            label = "very_poor"
-            evaluation = "불쾌합니다 ⚠️"
+        label, evaluation = _evaluate_score(comfort_score)
         
         return {
             "title": titles[prediction_type],
@@ -127,7 +191,7 @@ def get_comfort_score(prediction_type: str):
         raise HTTPException(status_code=500, detail=f"예측 중 오류 발생: {str(e)}")
 
 @app.get("/predict/hourly/{prediction_type}")
-def get_hourly_data(prediction_type: str):
+def get_hourly_data(prediction_type: str, station_id: str = "108"):
     """시간별 데이터 가져오기 (최근 6시간)"""
     if prediction_type not in ["now", "morning", "evening"]:
         raise HTTPException(status_code=400, detail="prediction_type은 now, morning, evening 중 하나여야 합니다")
@@ -141,7 +205,7 @@ def get_hourly_data(prediction_type: str):
             target_time = current_time - timedelta(hours=i)
             target_hour_dt = target_time.replace(minute=0, second=0, microsecond=0)
             
-            data = query_prediction_by_datetime(target_hour_dt)
+            data = prediction_snapshots.get(target_hour_dt).by_station.get(station_id)
             if data:
                 hourly_list.append({
                     'time': target_hour_dt.strftime("%H시"),
@@ -162,6 +226,164 @@ def get_hourly_data(prediction_type: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"시간별 데이터 조회 오류: {str(e)}")
 
+def _prediction_item(data):
+    """DB 예측 행 → 응답 항목"""
+    label, evaluation = _evaluate_score(data['comfort_score'])
+    return {
+        "station_id": data.get('station_id'),
+        "region": data.get('region'),
+        "score": round(data['comfort_score'], 1),
+        "label": label,
+        "evaluation": evaluation,
+        "weather_data": {
+            'temperature': data.get('temperature'),
+            'humidity': data.get('humidity'),
+            'rainfall': data.get('rainfall'),
+            'pm10': data.get('pm10'),
+            'wind_speed': data.get('wind_speed'),
+            'pressure': data.get('pressure'),
+        },
+    }
+
+
+def _snapshot_for(prediction_time: Optional[datetime]):
+    """요청 시간(없으면 현재 KST 정시) → 해당 시간 스냅샷"""
+    if prediction_time is None:
+        prediction_time = datetime.now(KST)
+    elif prediction_time.tzinfo is not None:
+        prediction_time = prediction_time.astimezone(KST)
+    return prediction_snapshots.get(prediction_time)
+
+
+def _predictions_response(snapshot, rows, **extra):
+    return {
+        "prediction_time": snapshot.prediction_datetime.strftime("%Y-%m-%d %H:%M"),
+        "predictions": [_prediction_item(row) for row in rows],
+        "count": len(rows),
+        **extra,
+        "status": "success",
+    }
+
+
+@app.get("/predictions/stations")
+def get_station_predictions(ids: str = Query(..., description="쉼표로 구분한 관측소 ID (예: 108,159,143)"),
+                            prediction_time: Optional[datetime] = None):
+    """여러 관측소의 같은 시간 예측 (스냅샷 조회, 없는 관측소는 missing)"""
+    station_ids = [s.strip() for s in ids.split(",") if s.strip()]
+    if not station_ids:
+        raise HTTPException(status_code=400, detail="관측소 ID를 하나 이상 지정해야 합니다")
+    try:
+        snapshot = _snapshot_for(prediction_time)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"예측 조회 오류: {str(e)}")
+    rows = snapshot.stations(station_ids)
+    missing = [s for s in station_ids if s not in snapshot.by_station]
+    return _predictions_response(snapshot, rows, missing=missing)
+
+
+@app.get("/predictions/region/{region}")
+def get_region_predictions(region: str, prediction_time: Optional[datetime] = None):
+    """권역(central/southern/eastern/western/unknown) 전체 관측소 예측"""
+    if region not in REGIONS:
+        raise HTTPException(status_code=400, detail=f"region은 {', '.join(REGIONS)} 중 하나여야 합니다")
+    try:
+        snapshot = _snapshot_for(prediction_time)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"예측 조회 오류: {str(e)}")
+    return _predictions_response(snapshot, snapshot.region(region), region=region)
+
+
+@app.get("/predictions/map")
+def get_map_predictions(prediction_time: Optional[datetime] = None):
+    """전국 지도용 전체 관측소 예측 (스냅샷 한 번 조회)"""
+    try:
+        snapshot = _snapshot_for(prediction_time)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"예측 조회 오류: {str(e)}")
+    rows = list(snapshot.by_station.values())
+    return _predictions_response(
+        snapshot, rows, regions={region: len(ids) for region, ids in snapshot.by_region.items()},
+    )
+
+
+class Observation(BaseModel):
+    """스코어링할 원시 관측값 (datetime이 없으면 현재 정시, 시간대가 없으면 KST)"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    station_id: str = "108"
+    observed_at: Optional[datetime] = Field(default=None, alias="datetime")
+    temperature: Optional[float] = None
+    humidity: Optional[float] = None
+    rainfall: Optional[float] = None
+    pm10: Optional[float] = None
+    wind_speed: Optional[float] = None
+    pressure: Optional[float] = None
+    wind_direction: Optional[float] = None
+    dew_point: Optional[float] = None
+    cloud_amount: Optional[float] = None
+    visibility: Optional[float] = None
+    sunshine: Optional[float] = None
+
+
+def _observations_frame(observations: List[Observation]) -> pd.DataFrame:
+    now = datetime.now(KST).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    records = []
+    for obs in observations:
+        record = obs.model_dump()
+        observed_at = record.pop("observed_at")
+        if observed_at is None:
+            observed_at = now
+        elif observed_at.tzinfo is not None:
+            observed_at = observed_at.astimezone(KST).replace(tzinfo=None)
+        record["datetime"] = observed_at
+        records.append(record)
+    return pd.DataFrame.from_records(records)
+
+
+@app.post("/score")
+async def score(payload: Union[Observation, List[Observation]]):
+    """원시 관측값 1건 또는 여러 건을 챔피언 모델로 바로 스코어링 (DB 조회 없음)"""
+    observations = payload if isinstance(payload, list) else [payload]
+    if not observations:
+        raise HTTPException(status_code=400, detail="관측값이 비어 있습니다.")
+
+    bundle = model_holder.bundle
+    if bundle is None:
+        raise HTTPException(status_code=503, detail="모델이 아직 로드되지 않았습니다.")
+
+    frame = _observations_frame(observations)
+    try:
+        scores = await score_batcher.submit(frame)
+    except BatcherOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스코어링 중 오류 발생: {str(e)}")
+
+    predictions = []
+    for (_, row), comfort_score in zip(frame.iterrows(), scores):
+        comfort_score = float(comfort_score)
+        label, evaluation = _evaluate_score(comfort_score)
+        predictions.append({
+            "station_id": row["station_id"],
+            "prediction_time": row["datetime"].strftime("%Y-%m-%d %H:%M"),
+            "score": round(comfort_score, 1),
+            "label": label,
+            "evaluation": evaluation,
+        })
+
+    return {
+        "predictions": predictions,
+        "count": len(predictions),
+        "model_name": bundle.model_name,
+        "model_version": bundle.experiment_name,
+        "status": "success",
+    }
+
+@app.get("/metrics/scoring")
+def scoring_metrics():
+    """/score 마이크로배칭 지표 (대기/predict/요청 지연 히스토그램, 배치 행 수)"""
+    return score_batcher.stats()
+
 @app.get("/api/welcome")
 def get_welcome_message():
     """시간대별 환영 메시지"""
@@ -0,0 +1,115 @@
+"""시간별 전체 관측소 예측 스냅샷 캐시
+
+관측소/권역/전국 지도 요청마다 DB를 조회하지 않고, 시간(정시)마다 전체 관측소 예측을
+쿼리 한 번으로 읽어 메모리에 보관한다. 이후 같은 시간의 요청은 캐시 조회만 한다.
+
+- 예측이 있는 시간: ttl_seconds 동안 재사용 (배치 UPSERT 반영 주기)
+- 예측이 없는 시간: empty_ttl_seconds 후 다시 조회 (배치가 늦게 도착하는 경우)
+- 최근 max_hours개 시간만 보관 (오래된 시간부터 제거)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+Loader = Callable[[datetime], List[Dict[str, Any]]]
+
+
+@dataclass
+class HourSnapshot:
+    """한 시간대의 전체 관측소 예측 (관측소 ID → 행, 권역 → 관측소 ID 목록)"""
+
+    prediction_datetime: datetime
+    by_station: Dict[str, Dict[str, Any]]
+    by_region: Dict[str, List[str]] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_rows(cls, prediction_datetime: datetime, rows: Iterable[Dict[str, Any]]) -> "HourSnapshot":
+        by_station, by_region = {}, {}
+        for row in rows:
+            station_id = str(row.get("station_id"))
+            by_station[station_id] = row
+            by_region.setdefault(row.get("region") or "unknown", []).append(station_id)
+        return cls(prediction_datetime, by_station, by_region)
+
+    def stations(self, station_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        return [self.by_station[s] for s in station_ids if s in self.by_station]
+
+    def region(self, region: str) -> List[Dict[str, Any]]:
+        return self.stations(self.by_region.get(region, []))
+
+
+class PredictionSnapshotCache:
+    """시간 → HourSnapshot 캐시 (스레드 안전, 같은 시간 동시 요청은 DB 조회 한 번)"""
+
+    def __init__(self, loader: Loader, ttl_seconds: float = 300, empty_ttl_seconds: float = 30,
+                 max_hours: int = 48):
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.empty_ttl_seconds = empty_ttl_seconds
+        self.max_hours = max_hours
+        self._snapshots: "OrderedDict[datetime, HourSnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[datetime, threading.Lock] = {}  # 조회 중인 시간 → 시간별 락
+        self.stats = {"hits": 0, "loads": 0}
+
+    def _fresh(self, snapshot: HourSnapshot) -> bool:
+        ttl = self.ttl_seconds if snapshot.by_station else self.empty_ttl_seconds
+        return time.monotonic() - snapshot.loaded_at < ttl
+
+    def _cached(self, hour: datetime) -> Optional[HourSnapshot]:
+        """캐시된 최신 스냅샷 (호출 측에서 self._lock 보유)"""
+        snapshot = self._snapshots.get(hour)
+        if snapshot is not None and self._fresh(snapshot):
+            self._snapshots.move_to_end(hour)
+            self.stats["hits"] += 1
+            return snapshot
+        return None
+
+    def get(self, prediction_datetime: datetime) -> HourSnapshot:
+        """해당 시간 스냅샷 (없거나 만료되었으면 전체 관측소를 한 번에 다시 조회)
+
+        캐시 확인/저장만 전역 락 안에서 하고, DB 조회는 시간별 락 안에서 한다.
+        같은 시간의 동시 미스는 한 번만 조회하고, 다른 시간 조회나 캐시 적중은 기다리지 않는다.
+        """
+        hour = prediction_datetime.replace(minute=0, second=0, microsecond=0, tzinfo=None)
+        with self._lock:
+            snapshot = self._cached(hour)
+            if snapshot is not None:
+                return snapshot
+            hour_lock = self._load_locks.setdefault(hour, threading.Lock())
+
+        with hour_lock:
+            with self._lock:  # 먼저 락을 잡은 요청이 이미 조회했으면 그 결과 사용
+                snapshot = self._cached(hour)
+                if snapshot is not None:
+                    return snapshot
+
+            snapshot = HourSnapshot.from_rows(hour, self.loader(hour))
+
+            with self._lock:
+                self.stats["loads"] += 1
+                self._snapshots[hour] = snapshot
+                self._snapshots.move_to_end(hour)
+                while len(self._snapshots) > self.max_hours:
+                    self._snapshots.popitem(last=False)
+                if self._load_locks.get(hour) is hour_lock:
+                    del self._load_locks[hour]
+            return snapshot
+
+    def invalidate(self, prediction_datetime: Optional[datetime] = None):
+        """특정 시간(없으면 전체) 스냅샷 삭제"""
+        with self._lock:
+            if prediction_datetime is None:
+                self._snapshots.clear()
+            else:
+                hour = prediction_datetime.replace(minute=0, second=0, microsecond=0, tzinfo=None)
+                self._snapshots.pop(hour, None)
+
+
+__all__ = ["HourSnapshot", "PredictionSnapshotCache"]
@@ -1,53 +1,77 @@
+import os
 import sys
 sys.path.append('/app')
 
 from airflow import DAG
+from airflow.datasets import Dataset
 from airflow.operators.python import PythonOperator
 from datetime import datetime, timedelta
-import pandas as pd
 
+from batch.jobs.operators import FusedBatchInferenceOperator
+from batch.jobs.predict_marker import predict_dataset_uri
 
+
+# true(기본): fetch → infer → upsert를 한 프로세스에서 실행 / false: 세 태스크로 분리
+FUSED_MODE = os.getenv('BATCH_INFERENCE_FUSED', 'true').lower() == 'true'
+
+# dataset(기본): weather_data_pipeline이 예측 입력을 발행하면 바로 실행 / cron: 매시간 15분 고정 실행
+TRIGGER_MODE = os.getenv('BATCH_INFERENCE_TRIGGER', 'dataset').lower()
+SCHEDULE = [Dataset(predict_dataset_uri())] if TRIGGER_MODE == 'dataset' else '15 * * * *'
+
+
+# 태스크 간 데이터는 Parquet 산출물로 전달하고, XCom에는 참조(uri/행 수/스키마 해시)만 저장
 def fetch_task(**context):
     """Task 1: S3에서 최신 parquet 데이터 로드"""
+    from batch.jobs.artifacts import ArtifactStore, run_path_from_context
     from batch.jobs.fetch import get_latest_parquet_from_s3
     
     print("S3에서 최신 데이터 로드 중...")
     df = get_latest_parquet_from_s3()
     
-    context['task_instance'].xcom_push(key='raw_data', value=df.to_json())
+    ref = ArtifactStore().write_frame(df, run_path_from_context(context), 'raw_data')
+    context['task_instance'].xcom_push(key='raw_data', value=ref)
     print(f"데이터 로드 완료: {len(df)} 건")
 
 
 def inference_task(**context):
     """Task 2: 모델 추론"""
+    from batch.jobs.artifacts import ArtifactStore, run_path_from_context
     from batch.jobs.infer import batch_predict
     
-    raw_data_json = context['task_instance'].xcom_pull(
+    store = ArtifactStore()
+    raw_data_ref = context['task_instance'].xcom_pull(
         task_ids='fetch_data', 
         key='raw_data'
     )
-    df = pd.read_json(raw_data_json)
+    df = store.read_frame(raw_data_ref)
     
     print("배치 추론 시작...")
     result_df = batch_predict(df)
     
-    context['task_instance'].xcom_push(key='predictions', value=result_df.to_json())
+    ref = store.write_frame(result_df, run_path_from_context(context), 'predictions')
+    context['task_instance'].xcom_push(key='predictions', value=ref)
     print(f"추론 완료: {len(result_df)} 건")
 
 
 def upsert_task(**context):
     """Task 3: MySQL에 저장"""
+    from batch.jobs.artifacts import ArtifactStore, run_path_from_context
     from batch.jobs.upsert import upsert_predictions
     
-    predictions_json = context['task_instance'].xcom_pull(
+    store = ArtifactStore()
+    predictions_ref = context['task_instance'].xcom_pull(
         task_ids='inference', 
         key='predictions'
     )
-    result_df = pd.read_json(predictions_json)
+    result_df = store.read_frame(predictions_ref)
     
     print("DB 저장 중...")
     upsert_predictions(result_df)
     print(f"DB 저장 완료: {len(result_df)} 건")
+    
+    # 이번 실행의 중간 산출물 정리
+    deleted = store.delete_run(run_path_from_context(context))
+    print(f"중간 산출물 정리: {deleted} 개")
 
 
 default_args = {
@@ -64,24 +88,29 @@ with DAG(
     'batch_inference_pipeline',
     default_args=default_args,
     description='날씨 comfort score 배치 추론',
-    schedule_interval='15 * * * *',  # 매시간 15분에 실행
+    schedule=SCHEDULE,  # 예측 입력 발행 시 실행 (BATCH_INFERENCE_TRIGGER=cron이면 매시간 15분)
     catchup=False,
     tags=['inference', 'weather', 'batch'],
 ) as dag:
     
-    fetch = PythonOperator(
-        task_id='fetch_data',
-        python_callable=fetch_task,
-    )
-    
-    infer = PythonOperator(
-        task_id='inference',
-        python_callable=inference_task,
-    )
-    
-    upsert = PythonOperator(
-        task_id='upsert_to_db',
-        python_callable=upsert_task,
-    )
-    
-    fetch >> infer >> upsert
\ No newline at end of file
+    if FUSED_MODE:
+        FusedBatchInferenceOperator(
+            task_id='fetch_infer_upsert',
+        )
+    else:
+        fetch = PythonOperator(
+            task_id='fetch_data',
+            python_callable=fetch_task,
+        )
+        
+        infer = PythonOperator(
+            task_id='inference',
+            python_callable=inference_task,
+        )
+        
+        upsert = PythonOperator(
+            task_id='upsert_to_db',
+            python_callable=upsert_task,
+        )
+        
+        fetch >> infer >> upsert
@@ -2,9 +2,10 @@
 Airflow DAG for weekly master training dataset Rolling Window cleanup.
 
 This DAG runs weekly to:
-1. Apply Rolling Window (21 months = 630 days) to master CSV
-2. Remove old data, duplicates, and sort records
-3. Validate cleanup completion
+1. Apply Rolling Window (21 months = 630 days) to the partitioned master dataset
+   by deleting whole expired daily partitions
+2. Compact (dedup + sort) only partitions that received late or duplicate writes
+3. Validate cleanup completion from the object listing
 
 Note: Hourly data is accumulated by weather_data_pipeline DAG.
 This DAG only performs cleanup.
@@ -50,19 +51,12 @@ dag = DAG(
     tags=['master-data', 'rolling-window', 'cleanup', 'weekly']
 )
 
-def apply_rolling_window(**context):
-    """
-    Apply Rolling Window (21 months = 630 days) to master CSV.
-    Removes old data, duplicates, and sorts records.
-    """
+def _get_master_store():
+    """Build the partitioned master dataset store for the weekly tasks."""
     from src.utils.config import S3Config
-    from jobs.s3_client import S3StorageClient, WeatherDataS3Handler
-    from datetime import datetime, timedelta
-    import pandas as pd
+    from src.storage.partitioned_store import PartitionedParquetStore
+    from jobs.s3_client import S3StorageClient
 
-    print("=== Applying Rolling Window to master CSV ===")
-
-    # Initialize S3 handler
     s3_config = S3Config.from_env()
     s3_client = S3StorageClient(
         bucket_name=s3_config.bucket_name,
@@ -71,88 +65,50 @@ def apply_rolling_window(**context):
         region_name=s3_config.region_name,
         endpoint_url=s3_config.endpoint_url
     )
-    weather_handler = WeatherDataS3Handler(s3_client)
-
-    # Load existing master CSV
-    master_key = "weather_pm10_integrated_full.csv"
-    try:
-        existing_df = weather_handler.load_csv_from_s3(master_key)
-        print(f"📂 Loaded master CSV: {len(existing_df)} records")
-    except Exception as e:
-        print(f"❌ Failed to load master CSV: {e}")
-        raise Exception(f"Master CSV not found: {e}")
-
-    records_before = len(existing_df)
-
-    # Convert datetime column
-    if 'datetime' in existing_df.columns:
-        existing_df['datetime'] = pd.to_datetime(existing_df['datetime'])
-
-        # Apply Rolling Window (21 months = 630 days)
-        retention_days = 630
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
-        cleaned_df = existing_df[existing_df['datetime'] >= cutoff_date]
-
-        records_after_cutoff = len(cleaned_df)
-        removed_by_cutoff = records_before - records_after_cutoff
+    return PartitionedParquetStore(s3_client)
 
-        print(f"🔄 Rolling Window (630 days) applied:")
-        print(f"   - Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"   - Records before: {records_before:,}")
-        print(f"   - Records after cutoff: {records_after_cutoff:,}")
-        print(f"   - Removed by cutoff: {removed_by_cutoff:,}")
 
-        # Remove duplicates (keep latest)
-        duplicate_columns = ['datetime', 'STN']
-        cleaned_df = cleaned_df.drop_duplicates(subset=duplicate_columns, keep='last')
-
-        records_after_dedup = len(cleaned_df)
-        removed_by_dedup = records_after_cutoff - records_after_dedup
-
-        print(f"🧹 Duplicates removed:")
-        print(f"   - Records after dedup: {records_after_dedup:,}")
-        print(f"   - Removed by dedup: {removed_by_dedup:,}")
-
-        # Sort by datetime and station
-        cleaned_df = cleaned_df.sort_values(duplicate_columns)
-        cleaned_df = cleaned_df.reset_index(drop=True)
-
-    else:
-        print("⚠️ Warning: 'datetime' column not found, skipping cleanup")
-        cleaned_df = existing_df
+def apply_rolling_window(**context):
+    """
+    Apply Rolling Window (21 months = 630 days) to the partitioned master dataset.
+    Expired daily partitions are deleted as a whole; only partitions that received
+    late or duplicate writes (more than one file) are deduplicated and sorted.
+    """
+    print("=== Applying Rolling Window to master dataset ===")
 
-    # Save cleaned master CSV
-    weather_handler.save_csv_to_s3(cleaned_df, master_key)
+    master_store = _get_master_store()
 
-    records_final = len(cleaned_df)
-    total_removed = records_before - records_final
+    retention_days = 630
+    result = master_store.apply_retention(retention_days=retention_days)
 
+    print(f"🔄 Rolling Window ({retention_days} days) applied:")
+    print(f"   - Cutoff date: {result['retention_cutoff']}")
+    print(f"   - Partitions before: {result['partitions_before']:,}")
+    print(f"   - Partitions dropped: {result['partitions_dropped']:,} ({result['files_dropped']:,} files)")
+    print(f"🧹 Partitions compacted (dedup + sort): {result['partitions_compacted']:,}")
+    print(f"   - Removed by dedup: {result['rows_deduplicated']:,}")
     print(f"✅ Rolling Window cleanup completed:")
-    print(f"   - Final records: {records_final:,}")
-    print(f"   - Total removed: {total_removed:,}")
-    print(f"   - Retention period: {retention_days} days (21 months)")
+    print(f"   - Partitions retained: {result['partitions_after']:,}")
+    print(f"   - Range: {result['oldest_partition']} to {result['newest_partition']}")
 
-    result = {
+    # The hourly feature table follows the same Rolling Window
+    from src.features.incremental import feature_store
+    feature_result = feature_store(master_store.s3_client).apply_retention(retention_days=retention_days)
+    print(f"🔄 Feature table: {feature_result['partitions_dropped']:,} partitions dropped, "
+          f"{feature_result['partitions_compacted']:,} compacted")
+
+    return {
         'status': 'success',
-        'records_before': records_before,
-        'records_after': records_final,
-        'records_removed': total_removed,
-        'removed_by_cutoff': removed_by_cutoff,
-        'removed_by_dedup': removed_by_dedup,
-        'retention_cutoff': cutoff_date.strftime('%Y-%m-%d %H:%M:%S'),
-        'csv_key': master_key
+        'retention_days': retention_days,
+        'dataset_prefix': master_store.prefix,
+        **result,
     }
 
-    return result
-
 def validate_cleanup(**context):
     """
     Validate that Rolling Window cleanup completed successfully.
+    Only the object listing is checked; no partition data is downloaded.
     """
-    from src.utils.config import S3Config
-    from jobs.s3_client import S3StorageClient, WeatherDataS3Handler
-    import pandas as pd
-
     print("=== Validating Rolling Window cleanup ===")
 
     # Get cleanup result from previous task
@@ -162,43 +118,29 @@ def validate_cleanup(**context):
     if not cleanup_result or cleanup_result.get('status') != 'success':
         raise ValueError("Rolling Window cleanup validation failed")
 
-    # Initialize S3 handler
-    s3_config = S3Config.from_env()
-    s3_client = S3StorageClient(
-        bucket_name=s3_config.bucket_name,
-        aws_access_key_id=s3_config.aws_access_key_id,
-        aws_secret_access_key=s3_config.aws_secret_access_key,
-        region_name=s3_config.region_name,
-        endpoint_url=s3_config.endpoint_url
-    )
-    weather_handler = WeatherDataS3Handler(s3_client)
-
-    # Verify master CSV exists and can be loaded
-    try:
-        master_df = weather_handler.load_csv_from_s3("weather_pm10_integrated_full.csv")
-        print(f"✅ Master CSV verified: {len(master_df):,} records, {len(master_df.columns)} columns")
-
-        # Verify datetime range
-        if 'datetime' in master_df.columns:
-            master_df['datetime'] = pd.to_datetime(master_df['datetime'])
-            date_min = master_df['datetime'].min()
-            date_max = master_df['datetime'].max()
-            print(f"📅 Date range: {date_min.strftime('%Y-%m-%d')} to {date_max.strftime('%Y-%m-%d')}")
-
-            # Check for duplicates
-            duplicate_count = master_df.duplicated(subset=['datetime', 'STN']).sum()
-            if duplicate_count > 0:
-                print(f"⚠️ Warning: Found {duplicate_count} duplicates (should be 0)")
-            else:
-                print(f"✅ No duplicates found")
-
-    except Exception as e:
-        raise ValueError(f"Failed to load master CSV: {e}")
+    master_store = _get_master_store()
+    partitions = master_store.list_partitions()
+
+    if not partitions:
+        raise ValueError("Master dataset has no partitions")
+
+    cutoff_date = datetime.fromisoformat(cleanup_result['retention_cutoff']).date()
+    expired = [p for p in partitions if p < cutoff_date]
+    if expired:
+        raise ValueError(f"Found {len(expired)} expired partitions (oldest: {min(expired)})")
+
+    # A partition with several files received writes after the cleanup ran
+    multi_file = {p.isoformat(): len(keys) for p, keys in partitions.items() if len(keys) > 1}
+    if multi_file:
+        print(f"⚠️ Warning: {len(multi_file)} partitions have more than one file: {multi_file}")
+    else:
+        print(f"✅ Every partition is compacted into a single file")
 
+    print(f"📅 Date range: {min(partitions).isoformat()} to {max(partitions).isoformat()}")
     print("🎉 Rolling Window cleanup completed successfully!")
     print(f"📊 Final stats:")
-    print(f"   - Records retained: {cleanup_result.get('records_after', 0):,}")
-    print(f"   - Records removed: {cleanup_result.get('records_removed', 0):,}")
+    print(f"   - Partitions retained: {len(partitions):,}")
+    print(f"   - Partitions dropped: {cleanup_result.get('partitions_dropped', 0):,}")
     print(f"   - Retention cutoff: {cleanup_result.get('retention_cutoff')}")
 
     return True
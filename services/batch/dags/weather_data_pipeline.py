@@ -6,7 +6,9 @@ This DAG runs every hour to:
 2. Parse and store raw data to S3
 3. Generate ML dataset with 34 engineered features
 4. Store ML dataset to S3 for real-time inference
-5. Append hourly data to master CSV for Rolling Window
+5. Publish the predict dataset (marker + Airflow Dataset event) so that
+   batch_inference_pipeline starts as soon as new features are available
+6. Append hourly data to the partitioned Parquet master dataset
 
 Schedule: Every hour at 10 minutes past the hour
 Author: MLOps Team
@@ -15,6 +17,8 @@ Author: MLOps Team
 from datetime import datetime, timedelta
 from pathlib import Path
 from airflow import DAG
+from airflow.datasets import Dataset
+from airflow.exceptions import AirflowSkipException
 from airflow.operators.python import PythonOperator
 from airflow.operators.dummy import DummyOperator
 import sys
@@ -28,6 +32,11 @@ PROJECT_ROOT = BASE_DIR.parents[2]
 for path in {JOBS_DIR, PROJECT_ROOT / "src"}:
     sys.path.append(str(path))
 
+from jobs.predict_marker import predict_dataset_uri
+
+# Updated whenever a new predict dataset is published (consumed by batch_inference_pipeline)
+PREDICT_DATASET = Dataset(predict_dataset_uri())
+
 # Default arguments for all tasks
 default_args = {
     'owner': 'mlops-team',
@@ -57,6 +66,7 @@ def fetch_kma_weather_data(**context):
     from jobs.weather_processor import WeatherDataProcessor
     from src.utils.config import KMAApiConfig, S3Config
     from jobs.s3_client import S3StorageClient, WeatherDataS3Handler
+    from jobs.artifacts import ArtifactStore, run_path_from_context
     from datetime import datetime
 
     print("=== Starting KMA API data fetch ===")
@@ -106,8 +116,9 @@ def fetch_kma_weather_data(**context):
             # Continue with other data types even if one fails
             fetched_data[data_type] = []
 
-    # Store fetched data in XCom for next task
-    return fetched_data
+    # Store parsed data as Parquet artifacts; XCom carries only the references
+    artifact_store = ArtifactStore(bucket=s3_config.bucket_name, s3_client=s3_client.s3)
+    return artifact_store.write_records(fetched_data, run_path_from_context(context), 'parsed')
 
 def generate_ml_dataset(**context):
     """
@@ -116,35 +127,27 @@ def generate_ml_dataset(**context):
     from jobs.feature_builder import create_ml_dataset
     from src.utils.config import S3Config
     from jobs.s3_client import S3StorageClient, WeatherDataS3Handler
+    from jobs.artifacts import ArtifactStore
     from datetime import datetime
 
     print("=== Starting ML dataset generation ===")
 
-    # Get fetched data from previous task
+    # Get artifact references from previous task
     ti = context['ti']
-    raw_data = ti.xcom_pull(task_ids='fetch_weather_data')
+    raw_data_refs = ti.xcom_pull(task_ids='fetch_weather_data')
 
-    if not raw_data:
+    if not raw_data_refs:
         print("❌ No weather data available for ML dataset generation")
         return
 
-    # Check if we have sufficient data
-    total_records = sum(len(data) for data in raw_data.values())
+    # Check if we have sufficient data (row counts come with the references)
+    total_records = sum(ref['rows'] for ref in raw_data_refs.values())
     print(f"Total records available: {total_records}")
 
     if total_records == 0:
         print("❌ No valid weather records to process")
         return
 
-    # Generate ML dataset with engineered features
-    df = create_ml_dataset(raw_data)
-
-    if df.empty:
-        print("❌ Generated ML dataset is empty")
-        return
-
-    print(f"✅ ML dataset generated: {len(df)} records, {len(df.columns)} features")
-
     # Initialize S3 handler
     s3_config = S3Config.from_env()
     s3_client = S3StorageClient(
@@ -155,12 +158,27 @@ def generate_ml_dataset(**context):
         endpoint_url=s3_config.endpoint_url
     )
     weather_handler = WeatherDataS3Handler(s3_client)
+    artifact_store = ArtifactStore(bucket=s3_config.bucket_name, s3_client=s3_client.s3)
+
+    # Generate ML dataset with engineered features
+    raw_data = artifact_store.read_records(raw_data_refs)
+    df = create_ml_dataset(raw_data)
+
+    if df.empty:
+        print("❌ Generated ML dataset is empty")
+        return
+
+    print(f"✅ ML dataset generated: {len(df)} records, {len(df.columns)} features")
 
     # Save ML dataset to S3
     timestamp = datetime.now()
     s3_key = weather_handler.save_ml_dataset(df, timestamp)
     print(f"✅ ML dataset saved to S3: {s3_key}")
 
+    # Save the same features as the inference input
+    predict_key = weather_handler.save_predict_dataset(df, timestamp)
+    print(f"✅ Predict dataset saved to S3: {predict_key}")
+
     # Log dataset summary
     print("=== Dataset Summary ===")
     print(f"Features: {list(df.columns)}")
@@ -168,26 +186,59 @@ def generate_ml_dataset(**context):
 
     return s3_key
 
-def append_to_master_csv(**context):
+def publish_predict_dataset(**context):
     """
-    Append hourly data to master CSV (without Rolling Window cleanup).
-    Rolling Window is applied weekly by master_data_update_dag.
+    Write the predict marker and emit the Airflow Dataset event.
+    Skipped (no event) when this run produced no ML dataset.
     """
     from src.utils.config import S3Config
-    from jobs.s3_client import S3StorageClient, WeatherDataS3Handler
+    from jobs.s3_client import S3StorageClient
+    from jobs.predict_marker import publish_predict_marker
+
+    ti = context['ti']
+    if not ti.xcom_pull(task_ids='generate_ml_dataset'):
+        raise AirflowSkipException("No new ML dataset in this run - predict dataset not published")
+
+    s3_config = S3Config.from_env()
+    s3_client = S3StorageClient(
+        bucket_name=s3_config.bucket_name,
+        aws_access_key_id=s3_config.aws_access_key_id,
+        aws_secret_access_key=s3_config.aws_secret_access_key,
+        region_name=s3_config.region_name,
+        endpoint_url=s3_config.endpoint_url
+    )
+    marker = publish_predict_marker(s3_client.s3, s3_config.bucket_name, run_id=context['run_id'])
+    s3_client.invalidate_listing_cache()
+    print(f"📣 Predict dataset published: {marker}")
+    return marker
+
+
+def append_to_master_dataset(**context):
+    """
+    Append hourly data to the partitioned Parquet master dataset.
+    Only the new rows are written (one small file per daily partition);
+    compaction and Rolling Window are applied weekly by master_data_update_dag.
+    Engineered features for the new (station, hour) keys are appended to the
+    hourly feature table in the same way (features are row-local).
+    """
+    from src.utils.config import S3Config
+    from src.storage.partitioned_store import PartitionedParquetStore
+    from src.features.incremental import append_new_features, feature_store
+    from jobs.s3_client import S3StorageClient
+    from jobs.artifacts import ArtifactStore
     import pandas as pd
 
-    print("=== Appending hourly data to master CSV ===")
+    print("=== Appending hourly data to master dataset ===")
 
-    # Get raw data from fetch task
+    # Get artifact references from fetch task
     ti = context['ti']
-    raw_data = ti.xcom_pull(task_ids='fetch_weather_data')
+    raw_data_refs = ti.xcom_pull(task_ids='fetch_weather_data')
 
-    if not raw_data:
-        print("⚠️ No raw data to append to master CSV")
+    if not raw_data_refs:
+        print("⚠️ No raw data to append to master dataset")
         return
 
-    # Initialize S3 handler
+    # Initialize S3 client
     s3_config = S3Config.from_env()
     s3_client = S3StorageClient(
         bucket_name=s3_config.bucket_name,
@@ -196,9 +247,13 @@ def append_to_master_csv(**context):
         region_name=s3_config.region_name,
         endpoint_url=s3_config.endpoint_url
     )
-    weather_handler = WeatherDataS3Handler(s3_client)
+    master_store = PartitionedParquetStore(s3_client)
+    artifact_store = ArtifactStore(bucket=s3_config.bucket_name, s3_client=s3_client.s3)
+    raw_data = artifact_store.read_records(
+        {data_type: raw_data_refs[data_type] for data_type in ('asos', 'pm10') if data_type in raw_data_refs}
+    )
 
-    # Convert parsed data to CSV format
+    # Convert parsed data to master dataset rows
     current_data = []
 
     asos_data = raw_data.get('asos', [])
@@ -255,24 +310,19 @@ def append_to_master_csv(**context):
     new_data_df = pd.DataFrame(current_data)
     print(f"New hourly data: {len(new_data_df)} records")
 
-    # Load existing master CSV
-    master_key = "weather_pm10_integrated_full.csv"
-    try:
-        existing_df = weather_handler.load_csv_from_s3(master_key)
-        print(f"Existing master data: {len(existing_df)} records")
+    # Write only the new rows (no download of the existing master data)
+    written_keys = master_store.append(new_data_df)
+    print(f"✅ Master dataset updated: {len(written_keys)} partition file(s) written")
+    for key in written_keys:
+        print(f"   - s3://{s3_client.bucket_name}/{key}")
 
-        # Simple append (no Rolling Window, no deduplication, no sorting)
-        updated_df = pd.concat([existing_df, new_data_df], ignore_index=True)
-    except Exception as e:
-        print(f"No existing master CSV found, creating new one: {e}")
-        updated_df = new_data_df
+    # Compute features only for the new keys and append them to the feature table
+    feature_result = append_new_features(feature_store(s3_client), new_data_df, include_labels=True)
+    print(f"✅ Feature table updated: {feature_result['rows_appended']} new row(s), "
+          f"{feature_result['keys_overwritten']} existing key(s) overwritten")
+    print(f"📝 Note: Compaction and Rolling Window run weekly (Sunday 2 AM)")
 
-    # Save updated master CSV
-    weather_handler.save_csv_to_s3(updated_df, master_key)
-    print(f"✅ Master CSV updated: {len(updated_df)} total records")
-    print(f"📝 Note: Rolling Window cleanup runs weekly (Sunday 2 AM)")
-
-    return master_key
+    return written_keys
 
 
 def validate_pipeline_success(**context):
@@ -281,6 +331,7 @@ def validate_pipeline_success(**context):
     """
     from src.utils.config import S3Config
     from jobs.s3_client import S3StorageClient, WeatherDataS3Handler
+    from jobs.artifacts import ArtifactStore, run_path_from_context
 
     print("=== Validating pipeline success ===")
 
@@ -302,6 +353,11 @@ def validate_pipeline_success(**context):
     )
     weather_handler = WeatherDataS3Handler(s3_client)
 
+    # Clean up this run's intermediate artifacts (all consumers have finished)
+    artifact_store = ArtifactStore(bucket=s3_config.bucket_name, s3_client=s3_client.s3)
+    deleted = artifact_store.delete_run(run_path_from_context(context))
+    print(f"🧹 Intermediate artifacts removed: {deleted}")
+
     # Get data inventory
     inventory = weather_handler.get_data_inventory()
     print(f"✅ S3 Data Inventory: {inventory}")
@@ -339,9 +395,16 @@ generate_ml_task = PythonOperator(
     dag=dag
 )
 
+publish_predict_task = PythonOperator(
+    task_id='publish_predict_dataset',
+    python_callable=publish_predict_dataset,
+    outlets=[PREDICT_DATASET],
+    dag=dag
+)
+
 append_master_task = PythonOperator(
-    task_id='append_to_master_csv',
-    python_callable=append_to_master_csv,
+    task_id='append_to_master_dataset',
+    python_callable=append_to_master_dataset,
     dag=dag
 )
 
@@ -358,3 +421,5 @@ end_task = DummyOperator(
 
 # Task dependencies
 start_task >> fetch_weather_task >> generate_ml_task >> append_master_task >> validate_task >> end_task
+# Inference is triggered by the Dataset event; it does not wait for the master dataset append
+generate_ml_task >> publish_predict_task
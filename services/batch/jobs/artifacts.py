@@ -0,0 +1,186 @@
+"""Airflow 태스크 간 중간 산출물(Parquet) 전달
+
+DataFrame이나 레코드 목록을 XCom(JSON)으로 넘기지 않고 S3(또는 공유 로컬 경로)에
+Parquet로 저장한 뒤, XCom에는 위치/행 수/스키마 해시만 담은 작은 참조(dict)를 넘긴다.
+
+참조 형식:
+    {"uri": "s3://bucket/tmp/airflow_artifacts/<dag_id>/<run_id>/<name>.parquet",
+     "rows": 123, "schema_hash": "9f2c..."}
+
+- 위치: AIRFLOW_ARTIFACT_DIR가 있으면 해당 로컬(공유 볼륨) 경로, 없으면 S3_BUCKET 버킷
+- 읽을 때 스키마 해시를 비교해 다른 실행/태스크의 파일을 잘못 읽는 경우를 막는다
+- 실행이 끝나면 delete_run으로 해당 DAG 실행의 산출물을 정리한다
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import re
+import shutil
+from typing import Any, Dict, List, Mapping, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.utils.logger_config import configure_logger
+from src.utils.s3_factory import get_env_s3_client
+
+
+ARTIFACT_PREFIX = os.getenv("AIRFLOW_ARTIFACT_PREFIX", "tmp/airflow_artifacts/")
+ARTIFACT_LOCAL_DIR = os.getenv("AIRFLOW_ARTIFACT_DIR")
+
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9._=-]+")
+
+
+def schema_hash(schema: pa.Schema) -> str:
+    """Arrow 스키마(컬럼명 + 타입) 해시 (pandas 메타데이터 제외)"""
+    text = schema.remove_metadata().to_string()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def run_path_from_context(context: Mapping[str, Any]) -> str:
+    """Airflow 태스크 context → '<dag_id>/<run_id>' 경로 (경로에 쓸 수 없는 문자는 '_')"""
+    ti = context["ti"]
+    return f"{ti.dag_id}/{_UNSAFE_PATH_CHARS.sub('_', ti.run_id)}"
+
+
+def _records_to_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """레코드 목록 → DataFrame (값 타입이 섞인 object 컬럼은 문자열로 통일)"""
+    df = pd.DataFrame.from_records(records)
+    for col in df.columns[df.dtypes == object]:
+        non_null = df[col].dropna()
+        if non_null.map(type).nunique() > 1:
+            df[col] = df[col].astype("string")
+    return df
+
+
+class ArtifactStore:
+    """S3 또는 로컬 디렉토리에 Parquet 중간 산출물 저장/로드"""
+
+    def __init__(self, bucket: Optional[str] = None, s3_client=None,
+                 local_dir: Optional[str] = ARTIFACT_LOCAL_DIR,
+                 prefix: str = ARTIFACT_PREFIX):
+        self.local_dir = local_dir
+        self.bucket = bucket or os.getenv("S3_BUCKET")
+        self.prefix = prefix if prefix.endswith("/") else f"{prefix}/"
+        self._s3 = s3_client
+        self._logger = configure_logger(self.__class__.__name__)
+
+        if not self.local_dir and not self.bucket:
+            raise ValueError("AIRFLOW_ARTIFACT_DIR 또는 S3 버킷(S3_BUCKET)이 필요합니다.")
+
+    @property
+    def s3(self):
+        if self._s3 is None:
+            self._s3 = get_env_s3_client()
+        return self._s3
+
+    def _uri(self, relative_key: str) -> str:
+        if self.local_dir:
+            return f"file://{os.path.join(self.local_dir, relative_key)}"
+        return f"s3://{self.bucket}/{self.prefix}{relative_key}"
+
+    @staticmethod
+    def _split_s3_uri(uri: str):
+        bucket, _, key = uri[len("s3://"):].partition("/")
+        return bucket, key
+
+    # ------------------------------------------------------------------
+    # DataFrame
+    # ------------------------------------------------------------------
+    def write_frame(self, df: pd.DataFrame, run_path: str, name: str) -> Dict[str, Any]:
+        """DataFrame을 Parquet로 저장하고 XCom용 참조 반환"""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        uri = self._uri(f"{run_path}/{name}.parquet")
+
+        if uri.startswith("file://"):
+            path = uri[len("file://"):]
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+            written_schema = pq.read_schema(path)
+        else:
+            buffer = io.BytesIO()
+            pq.write_table(table, buffer)
+            written_schema = pq.read_schema(pa.BufferReader(buffer.getvalue()))
+            bucket, key = self._split_s3_uri(uri)
+            self.s3.put_object(Bucket=bucket, Key=key, Body=buffer.getvalue(),
+                               ContentType="application/octet-stream")
+
+        # 해시는 파일에서 다시 읽힐 스키마 기준 (예: category 인덱스 타입은 저장 시 바뀜)
+        ref = {"uri": uri, "rows": table.num_rows, "schema_hash": schema_hash(written_schema)}
+        self._logger.info(f"산출물 저장: {uri} ({table.num_rows:,} 행)")
+        return ref
+
+    def read_frame(self, ref: Mapping[str, Any], columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """참조로 Parquet 산출물 로드 (스키마 해시 검증)"""
+        uri = ref["uri"]
+        if uri.startswith("file://"):
+            table = pq.read_table(uri[len("file://"):], memory_map=True)
+        else:
+            bucket, key = self._split_s3_uri(uri)
+            body = self.s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+            table = pq.read_table(pa.BufferReader(body))
+
+        expected = ref.get("schema_hash")
+        if expected and schema_hash(table.schema) != expected:
+            raise ValueError(f"산출물 스키마가 참조와 다릅니다: {uri}")
+        if columns:
+            table = table.select(columns)
+        return table.to_pandas()
+
+    # ------------------------------------------------------------------
+    # 레코드 목록 (data_type → list of dict)
+    # ------------------------------------------------------------------
+    def write_records(self, records_by_type: Mapping[str, List[Dict[str, Any]]],
+                      run_path: str, name: str) -> Dict[str, Dict[str, Any]]:
+        """data_type별 레코드 목록을 각각 Parquet로 저장하고 {data_type: 참조} 반환"""
+        return {
+            data_type: self.write_frame(_records_to_frame(records), run_path, f"{name}_{data_type}")
+            for data_type, records in records_by_type.items()
+        }
+
+    def read_records(self, refs: Mapping[str, Mapping[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """write_records 참조 → {data_type: 레코드 목록} (결측값은 None)"""
+        records_by_type = {}
+        for data_type, ref in refs.items():
+            if not ref.get("rows"):
+                records_by_type[data_type] = []
+                continue
+            df = self.read_frame(ref)
+            df = df.astype(object).where(df.notna(), None)
+            records_by_type[data_type] = df.to_dict("records")
+        return records_by_type
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+    def delete_run(self, run_path: str) -> int:
+        """DAG 실행 하나의 산출물 전체 삭제. 삭제한 파일 수 반환"""
+        if self.local_dir:
+            run_dir = os.path.join(self.local_dir, run_path)
+            if not os.path.isdir(run_dir):
+                return 0
+            count = sum(len(files) for _, _, files in os.walk(run_dir))
+            shutil.rmtree(run_dir, ignore_errors=True)
+            return count
+
+        paginator = self.s3.get_paginator("list_objects_v2")
+        keys = [
+            obj["Key"]
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=f"{self.prefix}{run_path}/")
+            for obj in page.get("Contents", [])
+        ]
+        for start in range(0, len(keys), 1000):
+            self.s3.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in keys[start:start + 1000]], "Quiet": True},
+            )
+        return len(keys)
+
+
+__all__ = ["ArtifactStore", "ARTIFACT_PREFIX", "schema_hash", "run_path_from_context"]
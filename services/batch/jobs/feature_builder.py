@@ -6,6 +6,8 @@ from typing import Dict, Any
 import pandas as pd
 import numpy as np
 
+from src.features.engine import compute_features
+
 
 def create_ml_dataset(raw_data: Dict[str, Any], include_labels: bool = False) -> pd.DataFrame:
     """
@@ -128,139 +130,108 @@ def create_ml_dataset(raw_data: Dict[str, Any], include_labels: bool = False) ->
         ])
 
 
-def add_engineered_features(df: pd.DataFrame, include_labels: bool = False) -> pd.DataFrame:
-    """기본 기상 데이터에 출퇴근 쾌적지수 관련 피처들을 추가합니다."""
+# 기상 필드 → 마스터 데이터셋(원본 KMA CSV)에서의 컬럼명
+ASOS_FIELD_ALIASES = {
+    "temperature": "TA",
+    "wind_speed": "WS",
+    "humidity": "HM",
+    "pressure": "PA",
+    "rainfall": "RN",
+    "wind_direction": "WD",
+    "dew_point": "TD",
+    "cloud_amount": "CA",
+    "visibility": "VS",
+    "sunshine": "SS",
+}
+
+BASE_COLUMNS = ["station_id", "datetime", *ASOS_FIELD_ALIASES, "pm10"]
+
+
+def _coalesced_numeric(df: pd.DataFrame, *columns: str) -> pd.Series:
+    """여러 후보 컬럼을 합친 숫자 컬럼 (앞 컬럼 값 우선, 없는 컬럼은 건너뜀)"""
+    values = np.full(len(df), np.nan)
+    for col in reversed(columns):
+        if col in df.columns:
+            candidate = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            values = np.where(np.isnan(candidate), values, candidate)
+    return pd.Series(values, index=df.index)
+
 
+def create_ml_dataset_from_frame(df: pd.DataFrame, include_labels: bool = False) -> pd.DataFrame:
+    """
+    마스터 데이터셋 DataFrame에서 바로 ML DataFrame을 만듭니다 (레코드 목록 변환 없이 벡터 연산).
+
+    create_ml_dataset({"asos": ..., "pm10": ...})와 같은 결과를 내며, 컬럼은 다음 규칙으로 합칩니다.
+    - 기상 필드: temperature 등 새 컬럼 값이 없으면 TA 등 원본 KMA 컬럼 값 사용
+    - pm10: pm10 값이 없으면 PM10 값 사용
+    - station_id: STN 컬럼이 있으면 STN, 없으면 station_id
+    - 기상 필드와 pm10이 모두 비어 있는 행은 제외
+    """
     if df.empty:
-        return df
+        return pd.DataFrame(columns=BASE_COLUMNS)
 
-    # 복사본 생성
-    df = df.copy()
-
-    # 1. 시간 기반 피처들
-    df['hour'] = df['datetime'].dt.hour
-    df['day_of_week'] = df['datetime'].dt.dayofweek  # 0=월요일, 6=일요일
-    df['month'] = df['datetime'].dt.month
-
-    # 출퇴근 시간 여부
-    df['is_rush_hour'] = df['hour'].isin([7, 8, 9, 18, 19, 20])
-    df['is_morning_rush'] = df['hour'].isin([7, 8, 9])
-    df['is_evening_rush'] = df['hour'].isin([18, 19, 20])
-
-    # 평일/주말
-    df['is_weekday'] = df['day_of_week'] < 5
-    df['is_weekend'] = df['day_of_week'] >= 5
-
-    # 계절 (3,4,5=봄, 6,7,8=여름, 9,10,11=가을, 12,1,2=겨울)
-    df['season'] = df['month'].map({
-        12: 'winter', 1: 'winter', 2: 'winter',
-        3: 'spring', 4: 'spring', 5: 'spring',
-        6: 'summer', 7: 'summer', 8: 'summer',
-        9: 'autumn', 10: 'autumn', 11: 'autumn'
-    })
+    merged_df = _base_frame(df)
 
-    # 2. 기온 기반 피처들
-    if 'temperature' in df.columns:
-        # 온도 구간 (None 값 처리)
-        df['temp_category'] = pd.cut(
-            df['temperature'].fillna(15),  # None 값을 기본값으로 대체
-            bins=[-999, 0, 10, 20, 30, 999],
-            labels=['very_cold', 'cold', 'mild', 'warm', 'hot']
-        )
+    # 기상 필드나 pm10 중 하나라도 값이 있는 행만 사용
+    has_values = merged_df[[*ASOS_FIELD_ALIASES, "pm10"]].notna().any(axis=1)
+    merged_df = merged_df[has_values & merged_df["datetime"].notna()]
+    if merged_df.empty:
+        return pd.DataFrame(columns=BASE_COLUMNS)
 
-        # 쾌적 온도 (20도 기준)
-        df['temp_comfort'] = 20 - (df['temperature'] - 20).abs()
+    merged_df = merged_df.sort_values(["datetime", "station_id"], kind="stable").reset_index(drop=True)
+    return add_engineered_features(merged_df, include_labels=include_labels)
 
-        # 극값 여부
-        df['temp_extreme'] = (df['temperature'] < 0) | (df['temperature'] > 30)
 
-        # 난방/냉방 필요
-        df['heating_needed'] = df['temperature'] < 10
-        df['cooling_needed'] = df['temperature'] > 25
+def create_scoring_features(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    온라인 스코어링용 피처 (입력 행 순서/개수 유지, 결측 행도 제외하지 않음).
 
-    # 3. 지역 기반 피처들 (관측소 코드 기반)
-    # 주요 도시 구분 (실제 기상청 관측소 코드 기준)
-    metro_stations = ['100', '101', '102', '104', '105', '108', '112', '119', '129', '133']
-    coastal_stations = ['102', '104', '115', '130', '131', '152', '156', '159', '168']
+    컬럼 합치기 규칙은 create_ml_dataset_from_frame과 같습니다.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=BASE_COLUMNS)
+    return add_engineered_features(_base_frame(df).reset_index(drop=True))
 
-    df['is_metro_area'] = df['station_id'].isin(metro_stations)
-    df['is_coastal'] = df['station_id'].isin(coastal_stations)
 
-    # 권역 구분 (관측소 번호 기반 간이 구분)
-    df['region'] = df['station_id'].astype(str).str[0].map({
-        '1': 'central',    # 100번대: 중부권
-        '2': 'south',      # 200번대: 남부권
-        '3': 'east',       # 300번대: 동부권
-        '9': 'west'        # 900번대: 서부권
-    }).fillna('other')
+def _base_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """station_id / datetime / 기상 필드 / pm10 기본 컬럼 (별칭 컬럼 합치기)"""
+    if "STN" in df.columns:
+        station_id = df["STN"].astype(str)
+    elif "station_id" in df.columns:
+        station_id = df["station_id"].astype(str)
+    else:
+        station_id = pd.Series("unknown", index=df.index)
 
-    # 4. 대기질 기반 피처들
-    if 'pm10' in df.columns:
-        # 미세먼지 등급 (환경부 기준, None 값 처리)
-        df['pm10_grade'] = pd.cut(
-            df['pm10'].fillna(50),  # None 값을 기본값으로 대체
-            bins=[0, 30, 80, 150, 999],
-            labels=['good', 'moderate', 'unhealthy', 'very_unhealthy']
-        )
+    merged_df = pd.DataFrame({
+        "station_id": station_id,
+        "datetime": pd.to_datetime(df["datetime"], utc=True, errors="coerce"),
+    })
+    for field, kma_column in ASOS_FIELD_ALIASES.items():
+        merged_df[field] = _coalesced_numeric(df, field, kma_column)
+    merged_df["pm10"] = _coalesced_numeric(df, "pm10", "PM10")
+    return merged_df
 
-        # 마스크 필요 여부
-        df['mask_needed'] = df['pm10'] > 50
 
-        # 야외활동 적합도
-        df['outdoor_activity_ok'] = df['pm10'] <= 80
+def add_engineered_features(df: pd.DataFrame, include_labels: bool = False) -> pd.DataFrame:
+    """기본 기상 데이터에 출퇴근 쾌적지수 관련 피처들을 추가합니다 (학습과 같은 피처 엔진 사용)."""
 
-    # 5. 종합 쾌적지수 계산 (학습용만)
-    if include_labels:
-        df['comfort_score'] = calculate_comfort_score(df)
+    if df.empty:
+        return df
 
-    return df
+    return compute_features(df, include_labels=include_labels)
 
 
 def calculate_comfort_score(df: pd.DataFrame) -> pd.Series:
     """기상 조건을 종합하여 출퇴근 쾌적지수를 계산합니다 (0-100점)."""
 
-    scores = pd.Series(50.0, index=df.index)  # 기본 점수 50점
-
-    # 기온 점수 (가장 중요한 요소, 50% 비중)
-    if 'temperature' in df.columns:
-        temp_score = df['temperature'].map(lambda x:
-            100 if pd.isna(x) else
-            90 if 15 <= x <= 22 else  # 최적 온도
-            70 if 10 <= x <= 25 else  # 적당한 온도
-            50 if 5 <= x <= 30 else   # 견딜만한 온도
-            20 if 0 <= x <= 35 else   # 불쾌한 온도
-            10  # 극한 온도
-        )
-        scores = scores * 0.5 + temp_score * 0.5
-
-    # 미세먼지 점수 (30% 비중)
-    if 'pm10' in df.columns:
-        pm10_score = df['pm10'].map(lambda x:
-            50 if pd.isna(x) else  # 데이터 없음은 중립
-            90 if x <= 15 else     # 매우 좋음
-            70 if x <= 35 else     # 좋음
-            50 if x <= 75 else     # 보통
-            30 if x <= 150 else    # 나쁨
-            10  # 매우 나쁨
-        )
-        scores = scores * 0.7 + pm10_score * 0.3
-
-    # 출퇴근 시간 보정 (-10점, 혼잡도 반영)
-    if 'is_rush_hour' in df.columns:
-        scores = scores - (df['is_rush_hour'] * 10)
-
-    # 주말 보정 (+5점, 여유로움)
-    if 'is_weekend' in df.columns:
-        scores = scores + (df['is_weekend'] * 5)
-
-    # 극한 날씨 보정 (-20점)
-    if 'temp_extreme' in df.columns:
-        scores = scores - (df['temp_extreme'] * 20)
-
-    # 점수 범위 조정 (0-100)
-    scores = np.clip(scores, 0, 100)
-
-    return scores
-
-
-__all__ = ["create_ml_dataset", "add_engineered_features", "calculate_comfort_score"]
\ No newline at end of file
+    scored = compute_features(df, groups=("label",))
+    return scored["comfort_score"]
+
+
+__all__ = [
+    "create_ml_dataset",
+    "create_ml_dataset_from_frame",
+    "create_scoring_features",
+    "add_engineered_features",
+    "calculate_comfort_score",
+]
\ No newline at end of file
@@ -5,27 +5,51 @@ sys.path.append('/app')
 import pandas as pd
 from io import BytesIO
 
+from batch.jobs.predict_marker import PREDICT_PREFIX, read_predict_marker
 from src.utils.utils import get_s3_client
 
 def get_latest_parquet_from_s3(bucket: str = None):
-    """S3에서 최신 parquet 파일 자동 로드"""
+    """S3에서 최신 parquet 파일 자동 로드
+
+    수집 DAG가 발행한 마커(_LATEST.json)가 있으면 마커의 키를 바로 읽고,
+    없으면 ml_dataset/predict/ 목록에서 가장 최근 parquet를 찾는다.
+    """
     if bucket is None:
         bucket = os.getenv('S3_BUCKET')
     
     s3_client = get_s3_client()
     
-    # ml_dataset/ 경로에서 최신 날짜 폴더 탐색
-    prefix = "ml_dataset/predict/"
+    marker = read_predict_marker(s3_client, bucket)
+    if marker:
+        latest_file = marker['key']
+        print(f"📂 마커 기준 parquet 파일: {latest_file} (발행: {marker.get('published_at')})")
+    else:
+        latest_file = _find_latest_parquet_key(s3_client, bucket, PREDICT_PREFIX)
+    
+    # S3에서 parquet 읽기
+    obj = s3_client.get_object(Bucket=bucket, Key=latest_file)
+    df = pd.read_parquet(BytesIO(obj['Body'].read()))
     
-    # 모든 파일 목록 가져오기
-    response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+    print(f"✅ 데이터 로드 완료: {df.shape}")
+    return df
+
+
+def _find_latest_parquet_key(s3_client, bucket: str, prefix: str) -> str:
+    """prefix 아래에서 가장 최근에 수정된 parquet 키"""
+    # 모든 파일 목록 가져오기 (1000개 초과 시 모든 페이지 순회)
+    paginator = s3_client.get_paginator('list_objects_v2')
+    objects = [
+        obj
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+        for obj in page.get('Contents', [])
+    ]
     
-    if 'Contents' not in response:
+    if not objects:
         raise FileNotFoundError(f"S3 경로에 파일이 없습니다: {prefix}")
     
     # parquet 파일만 필터링하고 최신순 정렬
     parquet_files = []
-    for obj in response.get('Contents', []):
+    for obj in objects:
         key = obj['Key']
         size = obj.get('Size', 0)  # 대문자 'Size'
         
@@ -40,11 +64,5 @@ def get_latest_parquet_from_s3(bucket: str = None):
     # 최신 파일 선택
     latest_file = sorted(parquet_files, reverse=True)[0][1]
     print(f"📂 최신 parquet 파일: {latest_file}")
-    
-    # S3에서 parquet 읽기
-    obj = s3_client.get_object(Bucket=bucket, Key=latest_file)
-    df = pd.read_parquet(BytesIO(obj['Body'].read()))
-    
-    print(f"✅ 데이터 로드 완료: {df.shape}")
-    return df
+    return latest_file
 
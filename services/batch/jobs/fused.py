@@ -0,0 +1,79 @@
+"""시간별 배치 추론을 한 프로세스에서 실행 (fetch → infer → upsert)
+
+세 태스크로 나누면 태스크마다 새 파이썬 프로세스가 pandas/boto3/sklearn을 다시 import하고
+S3/MySQL 클라이언트를 다시 만든다. 입력이 수백 행이라 이 시작 비용이 실제 작업보다 크므로,
+한 프로세스에서 공유 S3 클라이언트/모델/MySQL 연결로 세 단계를 이어서 실행하고 단계별 시간을 기록한다.
+
+실행:
+    python -m batch.jobs.fused
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from src.utils.logger_config import configure_logger
+
+
+_logger = configure_logger("fused_batch")
+
+
+@contextmanager
+def _stage(name: str, timings: Dict[str, float]):
+    """단계 실행 시간(초)을 timings[name]에 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round(time.perf_counter() - start, 3)
+        _logger.info(f"⏱️ {name}: {timings[name]:.3f}s")
+
+
+def run_hourly_batch(bucket: Optional[str] = None, experiment_name: Optional[str] = None,
+                     conn=None) -> Dict[str, Any]:
+    """최신 예측 입력 로드 → 챔피언 모델 추론 → MySQL UPSERT
+
+    Args:
+        bucket: S3 버킷 (기본: S3_BUCKET)
+        experiment_name: 모델 실험명 (기본: CHAMPION_MODEL)
+        conn: 재사용할 MySQL 연결 (None이면 새로 연결 후 닫음)
+
+    Returns:
+        dict: {"rows": 저장 건수, "timings": 단계별 초, "total_seconds": 합계}
+    """
+    timings: Dict[str, float] = {}
+    total_start = time.perf_counter()
+
+    with _stage("import", timings):
+        from batch.jobs.fetch import get_latest_parquet_from_s3
+        from batch.jobs.infer import batch_predict
+        from batch.jobs.load_model import load_model_from_s3
+        from batch.jobs.upsert import upsert_predictions
+        from src.utils.mysql_utils import get_mysql_connection
+
+    with _stage("fetch", timings):
+        df = get_latest_parquet_from_s3(bucket)
+
+    with _stage("load_model", timings):
+        model_bundle = load_model_from_s3(experiment_name, bucket)
+
+    with _stage("infer", timings):
+        result_df = batch_predict(df, model_bundle=model_bundle)
+
+    owns_connection = conn is None
+    with _stage("upsert", timings):
+        conn = conn or get_mysql_connection()
+        try:
+            upsert_predictions(result_df, conn=conn)
+        finally:
+            if owns_connection:
+                conn.close()
+
+    total_seconds = round(time.perf_counter() - total_start, 3)
+    _logger.info(f"✅ 배치 추론 완료: {len(result_df)} 건, 총 {total_seconds:.3f}s {timings}")
+    return {"rows": len(result_df), "timings": timings, "total_seconds": total_seconds}
+
+
+if __name__ == "__main__":
+    run_hourly_batch(bucket=os.getenv("S3_BUCKET"))
@@ -0,0 +1,28 @@
+"""배치 DAG용 Airflow 오퍼레이터"""
+
+from typing import Any, Optional
+
+from airflow.models import BaseOperator
+
+
+class FusedBatchInferenceOperator(BaseOperator):
+    """fetch → infer → upsert를 한 태스크(한 프로세스)에서 실행
+
+    단계별 시간과 저장 건수를 담은 작은 dict를 XCom으로 반환한다.
+    """
+
+    template_fields = ("bucket", "experiment_name")
+
+    def __init__(self, *, bucket: Optional[str] = None, experiment_name: Optional[str] = None,
+                 **kwargs: Any):
+        super().__init__(**kwargs)
+        self.bucket = bucket
+        self.experiment_name = experiment_name
+
+    def execute(self, context):
+        # DAG 파싱 시점에는 배치 모듈을 import하지 않음
+        from batch.jobs.fused import run_hourly_batch
+
+        summary = run_hourly_batch(bucket=self.bucket, experiment_name=self.experiment_name)
+        self.log.info("단계별 시간(초): %s", summary["timings"])
+        return summary
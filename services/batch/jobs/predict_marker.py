@@ -0,0 +1,57 @@
+"""예측 입력 데이터셋(ml_dataset/predict/) 발행 마커
+
+수집 DAG가 예측 입력을 저장한 뒤 `_LATEST.json` 마커를 쓰고 Airflow Dataset 이벤트를
+발행하면, 추론 DAG는 고정 시각(:15)을 기다리지 않고 바로 시작한다. 추론 쪽은 마커에 적힌
+키를 바로 읽으므로 prefix 전체를 목록 조회할 필요가 없다.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+
+PREDICT_PREFIX = "ml_dataset/predict/"
+PREDICT_DATA_KEY = f"{PREDICT_PREFIX}latest.parquet"
+PREDICT_MARKER_KEY = f"{PREDICT_PREFIX}_LATEST.json"
+
+
+def predict_dataset_uri(bucket: Optional[str] = None) -> str:
+    """Airflow Dataset URI (수집/추론 DAG가 같은 값을 쓰도록 한곳에서 생성)"""
+    bucket = bucket or os.getenv("S3_BUCKET") or os.getenv("S3_BUCKET_NAME", "weather-mlops-team-data")
+    return f"s3://{bucket}/{PREDICT_PREFIX}"
+
+
+def publish_predict_marker(s3_client, bucket: str, data_key: str = PREDICT_DATA_KEY,
+                           run_id: Optional[str] = None) -> Dict[str, Any]:
+    """예측 입력 객체의 ETag/크기를 마커로 기록 (boto3 클라이언트)"""
+    head = s3_client.head_object(Bucket=bucket, Key=data_key)
+    marker = {
+        "key": data_key,
+        "etag": head["ETag"].strip('"'),
+        "size": head["ContentLength"],
+        "published_at": datetime.now(tz=timezone.utc).isoformat(),
+        "run_id": run_id,
+    }
+    s3_client.put_object(Bucket=bucket, Key=PREDICT_MARKER_KEY, Body=json.dumps(marker).encode("utf-8"),
+                         ContentType="application/json")
+    return marker
+
+
+def read_predict_marker(s3_client, bucket: str) -> Optional[Dict[str, Any]]:
+    """마커 조회 (없으면 None)"""
+    try:
+        obj = s3_client.get_object(Bucket=bucket, Key=PREDICT_MARKER_KEY)
+    except s3_client.exceptions.NoSuchKey:
+        return None
+    return json.load(obj["Body"])
+
+
+__all__ = [
+    "PREDICT_PREFIX",
+    "PREDICT_DATA_KEY",
+    "PREDICT_MARKER_KEY",
+    "predict_dataset_uri",
+    "publish_predict_marker",
+    "read_predict_marker",
+]
@@ -1,49 +1,139 @@
 """S3 Storage Client and WeatherDataS3Handler"""
 
+import gzip
 import io
 import json
-import boto3
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 import pandas as pd
+from boto3.s3.transfer import TransferConfig
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import IO, Any, Iterator, List, Dict, Optional, Tuple
 
 from src.utils.logger_config import configure_logger
+from src.utils.s3_factory import get_shared_s3_client
+
+
+# 멀티파트 전송 기본값 (환경변수로 조정 가능)
+DEFAULT_PART_SIZE_MB = int(os.getenv("S3_PART_SIZE_MB", "8"))
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("S3_MAX_CONCURRENCY", "4"))
+
+# 버킷이 없을 때 생성할지 여부 (LocalStack 등 개발 환경에서만 켬)
+CREATE_BUCKET_IF_MISSING = os.getenv("S3_CREATE_BUCKET", "false").lower() in ("1", "true", "yes")
+
+# 목록 조회 결과 캐시 유지 시간 (초)
+LISTING_CACHE_TTL_SECONDS = float(os.getenv("S3_LISTING_CACHE_TTL_SECONDS", "30"))
+
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+
+def compression_from_key(key: str) -> Optional[str]:
+    """키 확장자로 압축 방식 추론 (.gz → gzip, .zst → zstd)"""
+    for suffix, compression in _COMPRESSION_SUFFIXES.items():
+        if key.endswith(suffix):
+            return compression
+    return None
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다 (pip install zstandard)") from e
+    return zstandard
+
+
+def _compressed_writer(fileobj: IO[bytes], compression: Optional[str]) -> IO[bytes]:
+    """fileobj 위에 스트리밍 압축 writer를 씌움"""
+    if compression is None:
+        return fileobj
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=6)
+    if compression == "zstd":
+        return _import_zstandard().ZstdCompressor(level=3).stream_writer(fileobj, closefd=False)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def _decompressed_reader(fileobj: IO[bytes], compression: Optional[str]) -> IO[bytes]:
+    """fileobj 위에 스트리밍 압축 해제 reader를 씌움"""
+    if compression is None:
+        return fileobj
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+    if compression == "zstd":
+        return _import_zstandard().ZstdDecompressor().stream_reader(fileobj)
+    raise ValueError(f"Unsupported compression: {compression}")
 
 
 class S3StorageClient:
     """저수준 S3 클라이언트 (LocalStack 및 AWS S3 호환)"""
 
+    # (bucket, prefix) → (조회 시각, 객체 정보 목록). 프로세스 내 모든 인스턴스가 공유
+    _listing_cache: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+    _listing_lock = threading.Lock()
+
+    # 존재가 확인된 (endpoint, bucket). 프로세스당 한 번만 head_bucket 호출
+    _verified_buckets = set()
+
     def __init__(self, bucket_name: str, aws_access_key_id: str,
                  aws_secret_access_key: str, region_name: str,
-                 endpoint_url: Optional[str] = None):
+                 endpoint_url: Optional[str] = None,
+                 part_size_mb: int = DEFAULT_PART_SIZE_MB,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 create_bucket: bool = CREATE_BUCKET_IF_MISSING):
         self.bucket_name = bucket_name
+        self.endpoint_url = endpoint_url
+        self.create_bucket = create_bucket
         self._logger = configure_logger(self.__class__.__name__)
 
-        self.s3 = boto3.client(
-            "s3",
+        # 대용량 객체는 part 단위 멀티파트 업로드/다운로드 (메모리 사용량 ≈ part 크기 × 동시성)
+        part_size = part_size_mb * 1024 * 1024
+        self.transfer_config = TransferConfig(
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
+            max_concurrency=max_concurrency,
+            use_threads=max_concurrency > 1,
+        )
+
+        # 프로세스 내에서 공유되는 클라이언트 (커넥션 풀/재시도 설정 포함)
+        self.s3 = get_shared_s3_client(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name,
             endpoint_url=endpoint_url,
         )
 
-        # 버킷 확인/생성
+        # 버킷 확인 (프로세스당 최초 1회)
         self._ensure_bucket_exists()
 
     def _ensure_bucket_exists(self):
-        """버킷이 없으면 생성"""
+        """버킷 존재 확인. create_bucket=True일 때만 없는 버킷을 생성"""
+        bucket_id = (self.endpoint_url, self.bucket_name)
+        if bucket_id in self._verified_buckets:
+            return
+
         try:
             self.s3.head_bucket(Bucket=self.bucket_name)
             self._logger.info(f"S3 버킷 확인: {self.bucket_name}")
-        except Exception:
+        except Exception as e:
+            if not self.create_bucket:
+                self._logger.warning(f"버킷 {self.bucket_name} 확인 실패 ({e}) - 생성하지 않음 (S3_CREATE_BUCKET=false)")
+                return
             self._logger.warning(f"버킷 {self.bucket_name} 없음 → 새로 생성")
             self.s3.create_bucket(Bucket=self.bucket_name)
 
+        self._verified_buckets.add(bucket_id)
+
     def put_object(self, key: str, body, content_type: str = "application/octet-stream"):
         """S3에 객체 저장"""
         if isinstance(body, str):
             body = body.encode("utf-8")
         self.s3.put_object(Bucket=self.bucket_name, Key=key, Body=body, ContentType=content_type)
+        self.invalidate_listing_cache(key)
         return key
 
     def get_object(self, key: str) -> bytes:
@@ -51,16 +141,156 @@ class S3StorageClient:
         obj = self.s3.get_object(Bucket=self.bucket_name, Key=key)
         return obj["Body"].read()
 
-    def list_objects(self, prefix: str = "") -> List[str]:
-        """S3 객체 목록 조회"""
-        resp = self.s3.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix)
-        if "Contents" not in resp:
-            return []
-        return [c["Key"] for c in resp["Contents"]]
+    def upload_fileobj(self, key: str, fileobj: IO[bytes],
+                       content_type: str = "application/octet-stream",
+                       compression: Optional[str] = None) -> str:
+        """파일 객체를 멀티파트 업로드 (compression 지정 시 임시 파일에 스트리밍 압축 후 업로드)"""
+        extra_args = {"ContentType": content_type}
+        self.invalidate_listing_cache(key)
+        if compression is None:
+            self.s3.upload_fileobj(fileobj, self.bucket_name, key,
+                                   ExtraArgs=extra_args, Config=self.transfer_config)
+            return key
+
+        with tempfile.TemporaryFile() as spool:
+            writer = _compressed_writer(spool, compression)
+            shutil.copyfileobj(fileobj, writer, length=1024 * 1024)
+            writer.close()
+            spool.seek(0)
+            self.s3.upload_fileobj(spool, self.bucket_name, key,
+                                   ExtraArgs=extra_args, Config=self.transfer_config)
+        return key
+
+    def upload_file(self, key: str, path: str, content_type: str = "application/octet-stream",
+                    compression: Optional[str] = None) -> str:
+        """로컬 파일을 멀티파트 업로드"""
+        with open(path, "rb") as f:
+            return self.upload_fileobj(key, f, content_type=content_type, compression=compression)
+
+    @contextmanager
+    def open_writer(self, key: str, content_type: str = "application/octet-stream",
+                    compression: Optional[str] = "auto", text: bool = False,
+                    encoding: str = "utf-8") -> Iterator[IO]:
+        """S3 객체에 스트리밍으로 쓰는 파일 객체
+
+        쓰는 내용은 (압축되어) 임시 파일에 저장되고, 블록을 빠져나갈 때 멀티파트로 업로드된다.
+        전체 페이로드를 메모리에 올리지 않는다.
+
+        Example:
+            with client.open_writer("data/x.csv.gz", text=True) as f:
+                df.to_csv(f, index=False)
+        """
+        if compression == "auto":
+            compression = compression_from_key(key)
+
+        with tempfile.TemporaryFile() as spool:
+            writer = _compressed_writer(spool, compression)
+            handle = io.TextIOWrapper(writer, encoding=encoding, newline="") if text else writer
+            yield handle
+
+            handle.flush()
+            if text:
+                handle.detach()
+            if writer is not spool:
+                writer.close()
+            spool.seek(0)
+            self.s3.upload_fileobj(spool, self.bucket_name, key,
+                                   ExtraArgs={"ContentType": content_type}, Config=self.transfer_config)
+            self.invalidate_listing_cache(key)
+            self._logger.info(f"스트리밍 업로드 완료: s3://{self.bucket_name}/{key}")
+
+    def download_file(self, key: str, path: str) -> str:
+        """S3 객체를 로컬 파일로 멀티파트(range GET) 다운로드"""
+        self.s3.download_file(self.bucket_name, key, path, Config=self.transfer_config)
+        return path
+
+    @contextmanager
+    def open_reader(self, key: str, compression: Optional[str] = "auto", text: bool = False,
+                    encoding: str = "utf-8", spool: bool = False) -> Iterator[IO]:
+        """S3 객체를 스트리밍으로 읽는 파일 객체 (pandas에 바로 전달 가능)
+
+        Args:
+            compression: "auto"면 키 확장자로 추론, None이면 압축 해제하지 않음
+            text: True면 텍스트 모드 (encoding 적용)
+            spool: True면 멀티파트 병렬 다운로드로 임시 파일에 받은 뒤 읽음
+                   (대용량 객체를 여러 번/임의 위치로 읽어야 할 때)
+
+        Example:
+            with client.open_reader("data/x.csv.gz") as f:
+                df = pd.read_csv(f)
+        """
+        if compression == "auto":
+            compression = compression_from_key(key)
+
+        if spool:
+            raw = tempfile.TemporaryFile()
+            self.s3.download_fileobj(self.bucket_name, key, raw, Config=self.transfer_config)
+            raw.seek(0)
+        else:
+            raw = self.s3.get_object(Bucket=self.bucket_name, Key=key)["Body"]
+
+        reader = _decompressed_reader(raw, compression)
+        handle = io.TextIOWrapper(reader, encoding=encoding) if text else reader
+        try:
+            yield handle
+        finally:
+            handle.close()
+            raw.close()
+
+    def iter_object_infos(self, prefix: str = "") -> Iterator[Dict[str, Any]]:
+        """list_objects_v2를 페이지 단위로 끝까지 순회 (Key, Size, LastModified, ETag)"""
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            yield from page.get("Contents", [])
+
+    def list_object_infos(self, prefix: str = "", use_cache: bool = True) -> List[Dict[str, Any]]:
+        """prefix 아래 모든 객체 정보 (모든 페이지, 짧은 TTL 메모리 캐시)
+
+        더 넓은 prefix(예: 버킷 전체)의 캐시가 살아 있으면 네트워크 호출 없이 그 결과를 걸러서 쓴다.
+        """
+        now = time.monotonic()
+        if use_cache:
+            with self._listing_lock:
+                for (bucket, cached_prefix), (fetched_at, infos) in self._listing_cache.items():
+                    if (bucket == self.bucket_name and prefix.startswith(cached_prefix)
+                            and now - fetched_at < LISTING_CACHE_TTL_SECONDS):
+                        if cached_prefix == prefix:
+                            return list(infos)
+                        return [info for info in infos if info["Key"].startswith(prefix)]
+
+        infos = list(self.iter_object_infos(prefix))
+        with self._listing_lock:
+            self._listing_cache[(self.bucket_name, prefix)] = (now, infos)
+        return list(infos)
+
+    def list_objects(self, prefix: str = "", use_cache: bool = True) -> List[str]:
+        """S3 객체 목록 조회 (페이지네이션 포함)"""
+        return [info["Key"] for info in self.list_object_infos(prefix, use_cache=use_cache)]
+
+    def invalidate_listing_cache(self, key: Optional[str] = None) -> None:
+        """key를 포함하는 prefix의 목록 캐시 제거 (key가 없으면 이 버킷 전체)"""
+        with self._listing_lock:
+            for cache_key in list(self._listing_cache):
+                bucket, cached_prefix = cache_key
+                if bucket == self.bucket_name and (key is None or key.startswith(cached_prefix)):
+                    del self._listing_cache[cache_key]
 
     def delete_object(self, key: str):
         """S3 객체 삭제"""
         self.s3.delete_object(Bucket=self.bucket_name, Key=key)
+        self.invalidate_listing_cache(key)
+
+    def delete_objects(self, keys: List[str]) -> int:
+        """여러 S3 객체 일괄 삭제 (요청당 최대 1000개)"""
+        for i in range(0, len(keys), 1000):
+            batch = keys[i:i + 1000]
+            self.s3.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
+            )
+        for key in keys:
+            self.invalidate_listing_cache(key)
+        return len(keys)
 
 
 class WeatherDataS3Handler:
@@ -133,29 +363,50 @@ class WeatherDataS3Handler:
             print(f"❌ 예측 데이터셋 로드 실패: {e}")
             return None
 
-    def save_csv_to_s3(self, df: pd.DataFrame, key: str) -> str:
-        """DataFrame을 CSV로 S3에 저장 (마스터 데이터용)"""
-        csv_buffer = io.StringIO()
-        df.to_csv(csv_buffer, index=False, encoding='utf-8')
-        csv_content = csv_buffer.getvalue()
+    def save_csv_to_s3(self, df: pd.DataFrame, key: str, compression: Optional[str] = "auto",
+                       chunksize: int = 100_000) -> str:
+        """DataFrame을 CSV로 S3에 저장 (마스터 데이터용)
 
-        self.s3_client.put_object(key, csv_content, content_type="text/csv")
+        CSV 문자열 전체를 메모리에 만들지 않고 chunksize 행 단위로 스트리밍 업로드한다.
+        키가 .gz/.zst로 끝나면 압축해서 저장한다.
+        """
+        with self.s3_client.open_writer(key, content_type="text/csv",
+                                        compression=compression, text=True) as f:
+            df.to_csv(f, index=False, chunksize=chunksize)
         print(f"마스터 CSV 저장: s3://{self.s3_client.bucket_name}/{key}")
         return key
 
-    def load_csv_from_s3(self, key: str) -> pd.DataFrame:
-        """S3에서 CSV를 로드하여 DataFrame으로 변환"""
-        csv_content = self.s3_client.get_object(key)
-        return pd.read_csv(io.StringIO(csv_content.decode('utf-8')))
+    def load_csv_from_s3(self, key: str, compression: Optional[str] = "auto", **read_csv_kwargs) -> pd.DataFrame:
+        """S3에서 CSV를 스트리밍으로 로드하여 DataFrame으로 변환"""
+        with self.s3_client.open_reader(key, compression=compression) as f:
+            return pd.read_csv(f, **read_csv_kwargs)
 
     def get_data_inventory(self) -> Dict[str, int]:
-        """S3 데이터 인벤토리 조회"""
+        """S3 데이터 인벤토리 조회 (버킷 전체 목록을 한 번만 순회)"""
+        keys = self.s3_client.list_objects()
+
         inventory = {
-            "raw_data": len(self.s3_client.list_objects(prefix="raw/")),
-            "processed_data": len(self.s3_client.list_objects(prefix="processed/")),
-            "train_datasets": len(self.s3_client.list_objects(prefix="ml_dataset/train/")),
-            "predict_datasets": len(self.s3_client.list_objects(prefix="ml_dataset/predict/")),
-            "master_data": len([k for k in self.s3_client.list_objects() if k.endswith('.csv')]),
-            "total": len(self.s3_client.list_objects())
+            "raw_data": 0,
+            "processed_data": 0,
+            "train_datasets": 0,
+            "predict_datasets": 0,
+            "master_data": 0,
+            "master_dataset_files": 0,
+            "total": len(keys),
         }
+        for key in keys:
+            if key.startswith("raw/"):
+                inventory["raw_data"] += 1
+            elif key.startswith("processed/"):
+                inventory["processed_data"] += 1
+            elif key.startswith("ml_dataset/train/"):
+                inventory["train_datasets"] += 1
+            elif key.startswith("ml_dataset/predict/"):
+                inventory["predict_datasets"] += 1
+            elif key.startswith("master/"):
+                inventory["master_dataset_files"] += 1
+            if key.endswith('.csv'):
+                inventory["master_data"] += 1
+
+        inventory["ml_datasets"] = inventory["train_datasets"] + inventory["predict_datasets"]
         return inventory
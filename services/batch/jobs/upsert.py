@@ -3,11 +3,18 @@ import pandas as pd
 from src.utils.mysql_utils import get_mysql_connection
 
 
-def upsert_predictions(result_df: pd.DataFrame):
-    """예측 결과를 MySQL에 저장 (UPSERT)"""
+def upsert_predictions(result_df: pd.DataFrame, conn=None):
+    """예측 결과를 MySQL에 저장 (UPSERT)
+
+    Args:
+        result_df: 예측 결과
+        conn: 재사용할 MySQL 연결. None이면 새로 연결하고 저장 후 닫음
+    """
     print("💾 MySQL 저장 시작")
     
-    conn = get_mysql_connection()
+    owns_connection = conn is None
+    if owns_connection:
+        conn = get_mysql_connection()
     
     try:
         with conn.cursor() as cursor:
@@ -26,7 +33,8 @@ def upsert_predictions(result_df: pd.DataFrame):
                         rainfall = VALUES(rainfall),
                         pm10 = VALUES(pm10),
                         wind_speed = VALUES(wind_speed),
-                        pressure = VALUES(pressure)
+                        pressure = VALUES(pressure),
+                        region = VALUES(region)
                 """
                 cursor.execute(sql, (
                     row.get('comfort_score'),
@@ -52,4 +60,5 @@ def upsert_predictions(result_df: pd.DataFrame):
         raise
 
     finally:
-        conn.close()
\ No newline at end of file
+        if owns_connection:
+            conn.close()
\ No newline at end of file
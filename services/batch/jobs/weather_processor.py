@@ -14,9 +14,11 @@ if project_root not in sys.path:
 
 from src.utils.logger_config import configure_logger
 from src.utils.config import KMAApiConfig, S3Config
+from src.storage.partitioned_store import PartitionedParquetStore
+from src.features.incremental import append_new_features, feature_store, master_rows_to_raw_data
 from jobs.kma_client import KMAApiClient
 from services.batch.jobs.s3_client import S3StorageClient, WeatherDataS3Handler
-from jobs.feature_builder import create_ml_dataset
+from jobs.feature_builder import create_ml_dataset, create_ml_dataset_from_frame
 from jobs import parsers
 
 _logger = configure_logger(__name__)
@@ -45,6 +47,8 @@ class WeatherDataProcessor:
             endpoint_url=s3_config.endpoint_url,  # LocalStack 사용 가능
         )
         self.weather_handler = WeatherDataS3Handler(self.s3_client)
+        self.master_store = PartitionedParquetStore(self.s3_client)
+        self.feature_store = feature_store(self.s3_client)
 
     def process_and_store_weather_data(
         self,
@@ -109,16 +113,24 @@ class WeatherDataProcessor:
     def update_master_training_dataset(
         self,
         new_data_df: pd.DataFrame,
-        master_key: str = "weather_pm10_integrated_full.csv",
-        retention_days: int = 630
+        retention_days: int = 630,
+        incremental: bool = True,
+        compact_min_files: int = 24
     ) -> Dict[str, str]:
         """
-        마스터 학습 데이터셋을 Rolling Window 방식으로 업데이트합니다.
+        마스터 학습 데이터셋(일 단위 파티션 Parquet)을 Rolling Window 방식으로 업데이트합니다.
+
+        새 데이터는 파티션 파일로만 추가하고, 보존 기간이 지난 파티션은 통째로 삭제합니다.
+        중복 제거/정렬(병합)은 파일이 compact_min_files개 이상 쌓인 파티션에만 적용되므로,
+        시간별 실행마다 오늘 파티션을 다시 읽고 쓰지 않고 하루치 파일이 모였을 때 한 번 병합합니다.
 
         Args:
             new_data_df: 새로 추가할 데이터 (현재 시간의 기상 데이터)
-            master_key: S3에 저장된 마스터 파일 키
             retention_days: 데이터 보존 기간 (일수, 기본 21개월/630일)
+            incremental: True면 새 (station, hour) 키의 피처만 계산해 피처 테이블
+                (ml_dataset/features_hourly)에 추가. False는 보존 기간 전체(최대 630일) 마스터를
+                읽어 ML 데이터셋을 재생성하는 전체 재빌드로, 백필/피처 정의 변경 시에만 사용
+            compact_min_files: 병합 대상 파티션의 최소 파일 수 (기본 24, 시간별 append 하루치)
 
         Returns:
             업데이트된 S3 키 정보
@@ -126,64 +138,38 @@ class WeatherDataProcessor:
         try:
             self._logger.info("마스터 학습 데이터셋 Rolling Window 업데이트 시작")
 
-            # 1. S3에서 기존 마스터 데이터 다운로드
-            try:
-                existing_df = self.weather_handler.load_csv_from_s3(master_key)
-                self._logger.info(f"기존 마스터 데이터 로드: {len(existing_df)} 레코드")
-            except Exception as e:
-                # 마스터 파일이 없는 경우 빈 DataFrame으로 시작
-                self._logger.warning(f"기존 마스터 데이터 없음, 새로 생성: {e}")
-                existing_df = pd.DataFrame()
-
-            # 2. 새 데이터와 기존 데이터 병합
-            if not existing_df.empty and not new_data_df.empty:
-                # datetime 컬럼이 있는지 확인 후 변환
-                if 'datetime' in existing_df.columns:
-                    existing_df['datetime'] = pd.to_datetime(existing_df['datetime'])
-                if 'datetime' in new_data_df.columns:
-                    new_data_df['datetime'] = pd.to_datetime(new_data_df['datetime'])
-
-                # 데이터 병합
-                merged_df = pd.concat([existing_df, new_data_df], ignore_index=True)
-            elif not new_data_df.empty:
-                merged_df = new_data_df.copy()
-                if 'datetime' in merged_df.columns:
-                    merged_df['datetime'] = pd.to_datetime(merged_df['datetime'])
-            else:
+            if new_data_df.empty:
                 self._logger.warning("새 데이터가 없어 업데이트를 건너뜁니다")
                 return {"status": "skipped", "reason": "no_new_data"}
 
-            # 3. Rolling Window 적용 (21개월치 데이터만 유지)
-            cutoff_date = datetime.now() - timedelta(days=retention_days)
-            before_count = len(merged_df)
-
-            if 'datetime' in merged_df.columns:
-                merged_df = merged_df[merged_df['datetime'] >= cutoff_date]
-
-            # 4. 중복 제거 (datetime + station_id 기준)
-            duplicate_columns = ['datetime']
-            if 'station_id' in merged_df.columns:
-                duplicate_columns.append('station_id')
-
-            merged_df = merged_df.drop_duplicates(subset=duplicate_columns, keep='last')
-            merged_df = merged_df.sort_values(['datetime', 'station_id'] if 'station_id' in merged_df.columns else ['datetime'])
-            merged_df = merged_df.reset_index(drop=True)
-
-            after_count = len(merged_df)
-            removed_count = before_count - after_count
-
-            self._logger.info(f"Rolling Window 적용 완료: {before_count} → {after_count} (-{removed_count} 레코드)")
-
-            # 5. S3에 업데이트된 마스터 데이터 업로드
-            updated_key = self.weather_handler.save_csv_to_s3(merged_df, master_key)
-
-            # 6. 업데이트된 데이터로 ML 학습용 데이터셋 생성
-            ml_training_key = None
-            if not merged_df.empty:
-                # 기존 데이터를 feature_builder 형식으로 변환
-                raw_data_for_ml = self._convert_csv_to_feature_format(merged_df)
-                if raw_data_for_ml:
-                    ml_dataset = create_ml_dataset(raw_data_for_ml, include_labels=True)  # 학습용: 정답 포함
+            # 1. 새 데이터만 파티션 파일로 추가
+            written_keys = self.master_store.append(new_data_df)
+            self._logger.info(f"새 데이터 추가: {len(new_data_df)} 레코드 → 파일 {len(written_keys)}개")
+
+            # 2. Rolling Window: 만료 파티션 삭제 + 파일이 충분히 쌓인 파티션만 병합
+            retention = self.master_store.apply_retention(retention_days=retention_days,
+                                                          compact_min_files=compact_min_files)
+            self._logger.info(
+                f"Rolling Window 적용 완료: 파티션 {retention['partitions_before']} → "
+                f"{retention['partitions_after']} (-{retention['partitions_dropped']} 파티션)"
+            )
+
+            # 3. ML 학습용 피처 갱신
+            if incremental:
+                # 피처는 행 단위 계산이므로 새 키만 계산해 추가해도 전체 재계산과 같음
+                feature_result = append_new_features(self.feature_store, new_data_df, include_labels=True)
+                self.feature_store.apply_retention(retention_days=retention_days,
+                                                   compact_min_files=compact_min_files)
+                ml_training_key = self.feature_store.prefix
+                records_after = None
+                self._logger.info(f"ML 피처 테이블 증분 갱신 완료: {feature_result['rows_appended']} 행 추가")
+            else:
+                merged_df = self.master_store.read()
+                records_after = len(merged_df)
+                ml_training_key = None
+                if not merged_df.empty:
+                    # 마스터 DataFrame에서 바로 피처 생성 (학습용: 정답 포함)
+                    ml_dataset = create_ml_dataset_from_frame(merged_df, include_labels=True)
                     if not ml_dataset.empty:
                         ml_training_key = self.weather_handler.save_ml_dataset(
                             ml_dataset,
@@ -193,12 +179,13 @@ class WeatherDataProcessor:
                         self._logger.info(f"ML 학습용 데이터셋 업데이트 완료: {ml_dataset.shape}")
 
             return {
-                "master_dataset": updated_key,
+                "master_dataset": self.master_store.prefix,
                 "ml_training_dataset": ml_training_key,
-                "records_before": before_count,
-                "records_after": after_count,
-                "records_removed": removed_count,
-                "retention_cutoff": cutoff_date.isoformat()
+                "records_added": len(new_data_df),
+                "records_after": records_after,
+                "partitions_dropped": retention["partitions_dropped"],
+                "partitions_compacted": retention["partitions_compacted"],
+                "retention_cutoff": retention["retention_cutoff"]
             }
 
         except Exception as e:
@@ -210,60 +197,7 @@ class WeatherDataProcessor:
     def _convert_csv_to_feature_format(self, df: pd.DataFrame) -> Dict[str, Any]:
         """CSV 형태의 데이터를 feature_builder가 기대하는 형식으로 변환 (9개 ASOS 필드 포함)"""
         try:
-            asos_records = []
-            pm10_records = []
-
-            for _, row in df.iterrows():
-                # ASOS 데이터 (9개 기상 필드 모두 매핑)
-                # 기존 CSV 컬럼명 → 새로운 필드명 매핑
-                station_id = str(row.get('STN', row.get('station_id', 'unknown')))
-                observed_at = row.get('datetime')
-
-                asos_record = {
-                    "station_id": station_id,
-                    "observed_at": observed_at,
-                    "category": "asos",
-                    # TA → temperature (기온)
-                    "temperature": row.get('temperature') if pd.notna(row.get('temperature')) else row.get('TA'),
-                    # WS → wind_speed (풍속)
-                    "wind_speed": row.get('wind_speed') if pd.notna(row.get('wind_speed')) else row.get('WS'),
-                    # HM → humidity (습도)
-                    "humidity": row.get('humidity') if pd.notna(row.get('humidity')) else row.get('HM'),
-                    # PA → pressure (기압)
-                    "pressure": row.get('pressure') if pd.notna(row.get('pressure')) else row.get('PA'),
-                    # RN → rainfall (강수량)
-                    "rainfall": row.get('rainfall') if pd.notna(row.get('rainfall')) else row.get('RN'),
-                    # WD → wind_direction (풍향)
-                    "wind_direction": row.get('wind_direction') if pd.notna(row.get('wind_direction')) else row.get('WD'),
-                    # TD → dew_point (이슬점)
-                    "dew_point": row.get('dew_point') if pd.notna(row.get('dew_point')) else row.get('TD'),
-                    # CA → cloud_amount (운량)
-                    "cloud_amount": row.get('cloud_amount') if pd.notna(row.get('cloud_amount')) else row.get('CA'),
-                    # VS → visibility (시정)
-                    "visibility": row.get('visibility') if pd.notna(row.get('visibility')) else row.get('VS'),
-                    # SS → sunshine (일조)
-                    "sunshine": row.get('sunshine') if pd.notna(row.get('sunshine')) else row.get('SS'),
-                }
-
-                # 하나라도 데이터가 있으면 추가
-                if any(pd.notna(v) for k, v in asos_record.items() if k not in ['station_id', 'observed_at', 'category']):
-                    asos_records.append(asos_record)
-
-                # PM10 데이터
-                if pd.notna(row.get('pm10')) or pd.notna(row.get('PM10')):
-                    pm10_value = row.get('pm10') or row.get('PM10')
-                    pm10_records.append({
-                        "station_id": station_id,
-                        "observed_at": observed_at,
-                        "category": "pm10",
-                        "value": pm10_value,
-                        "unit": "μg/m³"
-                    })
-
-            return {
-                "asos": asos_records,
-                "pm10": pm10_records
-            }
+            return master_rows_to_raw_data(df)
 
         except Exception as e:
             self._logger.error(f"데이터 형식 변환 실패: {e}")
@@ -366,9 +300,9 @@ def main():
 
                 if update_result.get("status") != "failed":
                     print(f"✅ 마스터 데이터셋 업데이트 완료:")
-                    print(f"   - 업데이트 전: {update_result.get('records_before', 0):,} 레코드")
+                    print(f"   - 추가된 레코드: {update_result.get('records_added', 0):,}")
                     print(f"   - 업데이트 후: {update_result.get('records_after', 0):,} 레코드")
-                    print(f"   - 제거된 레코드: {update_result.get('records_removed', 0):,} (오래된 데이터)")
+                    print(f"   - 삭제된 파티션: {update_result.get('partitions_dropped', 0):,} (오래된 데이터)")
                     if update_result.get('ml_training_dataset'):
                         print(f"   - ML 학습용 데이터셋도 업데이트됨")
                 else:
@@ -0,0 +1,121 @@
+"""S3 CSV 데이터셋의 로컬 Parquet 스냅샷 캐시
+
+같은 파이프라인 실행 안에서 여러 태스크(verify/split/train/tune)가 같은 CSV를
+반복해서 내려받고 파싱하지 않도록, 최초 1회만 CSV를 Parquet로 변환해 로컬에 저장한다.
+스냅샷 파일명에는 S3 ETag가 들어가므로 S3 객체가 바뀌면 자동으로 새 스냅샷을 만든다.
+"""
+
+import glob
+import hashlib
+import os
+import tempfile
+from typing import Dict, Optional, Sequence
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.utils.logger_config import configure_logger
+from src.utils.s3_factory import get_env_s3_client
+
+
+DEFAULT_CACHE_DIR = os.getenv(
+    "DATASET_CACHE_DIR", os.path.join(tempfile.gettempdir(), "weather_dataset_cache")
+)
+
+_logger = configure_logger("dataset_cache")
+
+
+def _snapshot_stem(bucket: str, key: str) -> str:
+    """bucket/key별 고정 접두어 (ETag를 제외한 부분)"""
+    digest = hashlib.sha1(f"{bucket}/{key}".encode("utf-8")).hexdigest()[:12]
+    name = os.path.splitext(os.path.basename(key))[0]
+    return f"{name}-{digest}"
+
+
+def snapshot_path(bucket: str, key: str, etag: str, cache_dir: Optional[str] = None) -> str:
+    """ETag 기준 스냅샷 파일 경로"""
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    etag = etag.strip('"')
+    return os.path.join(cache_dir, f"{_snapshot_stem(bucket, key)}-{etag}.parquet")
+
+
+def _remove_stale_snapshots(bucket: str, key: str, keep_path: str) -> None:
+    """같은 bucket/key의 이전 ETag 스냅샷 삭제"""
+    stem = _snapshot_stem(bucket, key)
+    for old_path in glob.glob(os.path.join(os.path.dirname(keep_path), f"{stem}-*.parquet")):
+        if old_path != keep_path:
+            os.remove(old_path)
+
+
+def _build_snapshot(s3_client, bucket: str, key: str, path: str,
+                    dtypes: Optional[Dict[str, str]] = None) -> None:
+    """S3 CSV를 스트리밍으로 파싱해 Parquet 스냅샷 작성 (원자적 rename)"""
+    response = s3_client.get_object(Bucket=bucket, Key=key)
+    df = pd.read_csv(response["Body"], dtype=dtypes, low_memory=False)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    _remove_stale_snapshots(bucket, key, path)
+    _logger.info(f"스냅샷 생성: s3://{bucket}/{key} → {path} ({len(df):,} 레코드)")
+
+
+def fetch_object_snapshot(bucket: str, key: str, etag: str, cache_dir: Optional[str] = None,
+                          s3_client=None) -> str:
+    """S3 객체(예: Parquet 파티션)를 ETag 기준 로컬 파일로 내려받고 경로 반환
+
+    목록 조회 결과의 ETag를 그대로 받으므로 HEAD 요청 없이 캐시 적중 여부를 판단한다.
+    """
+    path = snapshot_path(bucket, key, etag, cache_dir)
+    if os.path.exists(path):
+        return path
+
+    s3_client = s3_client or get_env_s3_client()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        s3_client.download_file(bucket, key, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    _remove_stale_snapshots(bucket, key, path)
+    return path
+
+
+def load_csv_snapshot(bucket: str, key: str, columns: Optional[Sequence[str]] = None,
+                      dtypes: Optional[Dict[str, str]] = None, cache_dir: Optional[str] = None,
+                      s3_client=None) -> pd.DataFrame:
+    """S3 CSV를 로컬 Parquet 스냅샷을 거쳐 로드
+
+    Args:
+        bucket: S3 버킷
+        key: CSV 객체 키
+        columns: 읽을 컬럼 (None이면 전체). Parquet 컬럼 단위로만 읽음
+        dtypes: CSV → Parquet 변환 시 적용할 명시적 dtype
+        cache_dir: 스냅샷 디렉토리 (기본: DATASET_CACHE_DIR 또는 임시 디렉토리)
+        s3_client: boto3 S3 클라이언트 (기본: 공유 클라이언트)
+
+    Returns:
+        DataFrame
+    """
+    s3_client = s3_client or get_env_s3_client()
+
+    etag = s3_client.head_object(Bucket=bucket, Key=key)["ETag"]
+    path = snapshot_path(bucket, key, etag, cache_dir)
+
+    if not os.path.exists(path):
+        _build_snapshot(s3_client, bucket, key, path, dtypes=dtypes)
+
+    table = pq.read_table(path, columns=list(columns) if columns else None, memory_map=True)
+    return table.to_pandas()
+
+
+__all__ = ["load_csv_snapshot", "fetch_object_snapshot", "snapshot_path", "DEFAULT_CACHE_DIR"]
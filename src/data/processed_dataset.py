@@ -0,0 +1,139 @@
+"""피처 엔지니어링 결과(처리 데이터셋)의 타입 보존 Parquet 저장/로드
+
+레이아웃:
+    ml_dataset/weather_features/year=YYYY/month=MM/data.parquet
+
+- 피처 스키마(src/features/schema.py)대로 category / datetime64 / float32 / uint8로 저장
+- 로드 시 year/month 경로로 파티션을 먼저 거르고, datetime 조건은 Parquet 통계 기반으로 pushdown
+"""
+
+import io
+import re
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.data.dataset_cache import fetch_object_snapshot
+from src.features.schema import DATETIME_COLUMN, apply_feature_schema
+from src.utils.logger_config import configure_logger
+from src.utils.s3_factory import get_env_s3_client
+
+
+PROCESSED_DATASET_PREFIX = "ml_dataset/weather_features/"
+
+_PARTITION_PATTERN = re.compile(r"year=(\d{4})/month=(\d{2})/")
+
+_logger = configure_logger("processed_dataset")
+
+
+def to_typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """저장용 dtype 정규화 (src/features/schema.py 스키마 적용)"""
+    return apply_feature_schema(df)
+
+
+def _partition_key(prefix: str, year: int, month: int) -> str:
+    return f"{prefix}year={year:04d}/month={month:02d}/data.parquet"
+
+
+def save_processed_dataset(df: pd.DataFrame, bucket: str,
+                           prefix: str = PROCESSED_DATASET_PREFIX, s3_client=None) -> List[str]:
+    """처리 데이터셋을 year/month 파티션 Parquet로 S3에 저장
+
+    데이터에 없는 기존 월 파티션은 삭제해 데이터셋 전체를 교체한다.
+
+    Returns:
+        작성된 S3 키 목록
+    """
+    s3_client = s3_client or get_env_s3_client()
+    typed = to_typed_frame(df).dropna(subset=[DATETIME_COLUMN])
+
+    written = []
+    months = typed[DATETIME_COLUMN].dt.to_period("M")
+    for period, part_df in typed.groupby(months, sort=True, observed=True):
+        key = _partition_key(prefix, period.year, period.month)
+        buffer = io.BytesIO()
+        part_df.sort_values(DATETIME_COLUMN).to_parquet(buffer, index=False, row_group_size=50_000)
+        s3_client.put_object(Bucket=bucket, Key=key, Body=buffer.getvalue(),
+                             ContentType="application/octet-stream")
+        written.append(key)
+
+    written_keys = set(written)
+    stale = [obj["Key"] for obj in _list_partition_objects(s3_client, bucket, prefix)
+             if obj["Key"] not in written_keys]
+    for key in stale:
+        s3_client.delete_object(Bucket=bucket, Key=key)
+
+    _logger.info(f"처리 데이터셋 저장: s3://{bucket}/{prefix} "
+                 f"({len(typed):,} 레코드, 파티션 {len(written)}개, 삭제 {len(stale)}개)")
+    return written
+
+
+def _list_partition_objects(s3_client, bucket: str, prefix: str) -> List[dict]:
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return [
+        obj
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+        for obj in page.get("Contents", [])
+        if obj["Key"].endswith(".parquet")
+    ]
+
+
+def _month_in_range(year: int, month: int, start: Optional[pd.Timestamp],
+                    end: Optional[pd.Timestamp]) -> bool:
+    month_start = pd.Timestamp(year=year, month=month, day=1)
+    if end is not None and month_start >= end:
+        return False
+    if start is not None and month_start + pd.offsets.MonthBegin(1) <= start:
+        return False
+    return True
+
+
+def load_processed_dataset(bucket: str, start=None, end=None,
+                           columns: Optional[Sequence[str]] = None,
+                           prefix: str = PROCESSED_DATASET_PREFIX,
+                           cache_dir: Optional[str] = None, s3_client=None) -> Optional[pd.DataFrame]:
+    """처리 데이터셋 로드 ([start, end) 구간, 컬럼 projection)
+
+    Returns:
+        DataFrame. Parquet 데이터셋이 아직 없으면 None
+    """
+    s3_client = s3_client or get_env_s3_client()
+    start_ts = pd.Timestamp(start) if start is not None else None
+    end_ts = pd.Timestamp(end) if end is not None else None
+
+    objects = _list_partition_objects(s3_client, bucket, prefix)
+    if not objects:
+        return None
+
+    # 1️⃣ 경로(year/month) 기준 파티션 pruning
+    selected: List[Tuple[str, str]] = []
+    for obj in objects:
+        match = _PARTITION_PATTERN.search(obj["Key"])
+        if match and not _month_in_range(int(match.group(1)), int(match.group(2)), start_ts, end_ts):
+            continue
+        selected.append((obj["Key"], obj["ETag"]))
+
+    # 2️⃣ ETag 기준 로컬 캐시 후 datetime 조건 pushdown
+    paths = [fetch_object_snapshot(bucket, key, etag, cache_dir=cache_dir, s3_client=s3_client)
+             for key, etag in selected]
+    if not paths:
+        return pd.DataFrame(columns=list(columns) if columns else None)
+
+    filters = []
+    if start_ts is not None:
+        filters.append((DATETIME_COLUMN, ">=", start_ts.to_pydatetime()))
+    if end_ts is not None:
+        filters.append((DATETIME_COLUMN, "<", end_ts.to_pydatetime()))
+
+    dataset = pq.ParquetDataset(paths, filters=filters or None, memory_map=True, partitioning=None)
+    table = dataset.read(columns=list(columns) if columns else None)
+    return apply_feature_schema(table.to_pandas(), copy=False)
+
+
+__all__ = [
+    "PROCESSED_DATASET_PREFIX",
+    "to_typed_frame",
+    "save_processed_dataset",
+    "load_processed_dataset",
+]
@@ -1,18 +1,13 @@
-import boto3
 import pandas as pd
 import os
-from io import StringIO
+
+from src.utils.s3_factory import get_env_s3_client
 
 def get_s3_data():
     """S3에서 날씨 및 미세먼지 데이터를 가져와서 DataFrame으로 반환"""
     
-    # S3 클라이언트 생성
-    s3_client = boto3.client(
-        's3',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION')
-    )
+    # S3 클라이언트 (프로세스 공유)
+    s3_client = get_env_s3_client()
     
     bucket_name = os.getenv('S3_BUCKET')
     
@@ -21,8 +16,8 @@ def get_s3_data():
         Bucket=bucket_name, 
         Key='ml_dataset/past_data/weather_pm10_integrated_full.csv'
     )
-    weather_content = weather_response['Body'].read().decode('utf-8')
-    weather_df = pd.read_csv(StringIO(weather_content), low_memory=False)
+    # 응답 본문 전체를 문자열로 디코딩하지 않고 스트림을 그대로 파싱
+    weather_df = pd.read_csv(weather_response['Body'], low_memory=False)
     
 
     return weather_df
\ No newline at end of file
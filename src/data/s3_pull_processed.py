@@ -1,28 +1,58 @@
-import boto3
 import pandas as pd
 import os
-from io import StringIO
-
-def get_processed_data():
-    """S3에서 날씨 및 미세먼지 데이터를 가져와서 DataFrame으로 반환"""
-    
-    # S3 클라이언트 생성
-    s3_client = boto3.client(
-        's3',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION')
-    )
-    
+
+from src.data.dataset_cache import load_csv_snapshot
+from src.data.processed_dataset import load_processed_dataset
+from src.features.schema import apply_feature_schema
+
+PROCESSED_DATA_KEY = 'ml_dataset/weather_features_full.csv'
+
+# CSV → Parquet 스냅샷 변환 시 명시적 dtype (관측소 ID는 문자열 유지)
+PROCESSED_DTYPES = {'station_id': 'str'}
+
+
+def get_processed_data(columns=None, start=None, end=None, cache_dir=None, s3_client=None):
+    """S3에서 피처 엔지니어링된 데이터를 가져와서 DataFrame으로 반환
+
+    year/month 파티션 Parquet 데이터셋(ml_dataset/weather_features/)을 우선 읽고,
+    날짜 구간이 주어지면 해당 월 파티션만 받아 datetime 조건을 pushdown 한다.
+    Parquet 데이터셋이 없으면 기존 CSV를 로컬 Parquet 스냅샷(S3 ETag 기준)으로 읽는다.
+    어느 경우든 피처 스키마(src/features/schema.py) dtype으로 반환한다.
+
+    Args:
+        columns: 읽을 컬럼 목록 (None이면 전체)
+        start: 시작 시각 (포함, None이면 처음부터)
+        end: 종료 시각 (제외, None이면 끝까지)
+        cache_dir: 로컬 스냅샷 디렉토리 (기본: DATASET_CACHE_DIR)
+        s3_client: boto3 S3 클라이언트 (기본: 공유 클라이언트)
+    """
     bucket_name = os.getenv('S3_BUCKET')
-    
-    # 날씨 데이터 가져오기
-    weather_response = s3_client.get_object(
-        Bucket=bucket_name, 
-        Key='ml_dataset/weather_features_full.csv'
+
+    weather_df = load_processed_dataset(bucket_name, start=start, end=end, columns=columns,
+                                        cache_dir=cache_dir, s3_client=s3_client)
+    if weather_df is not None:
+        return weather_df
+
+    has_range = start is not None or end is not None
+    # 구간 필터에 datetime이 필요하므로 projection에 없으면 함께 읽고 필터 후 제거
+    drop_datetime = has_range and columns is not None and 'datetime' not in columns
+    weather_df = load_csv_snapshot(
+        bucket_name,
+        PROCESSED_DATA_KEY,
+        columns=list(columns) + ['datetime'] if drop_datetime else columns,
+        dtypes=PROCESSED_DTYPES,
+        cache_dir=cache_dir,
+        s3_client=s3_client,
     )
-    weather_content = weather_response['Body'].read().decode('utf-8')
-    weather_df = pd.read_csv(StringIO(weather_content), low_memory=False)
-    
+    if has_range:
+        dt = pd.to_datetime(weather_df['datetime'], errors='coerce')
+        mask = pd.Series(True, index=weather_df.index)
+        if start is not None:
+            mask &= dt >= pd.Timestamp(start)
+        if end is not None:
+            mask &= dt < pd.Timestamp(end)
+        weather_df = weather_df[mask].reset_index(drop=True)
+        if drop_datetime:
+            weather_df = weather_df.drop(columns=['datetime'])
 
-    return weather_df
\ No newline at end of file
+    return apply_feature_schema(weather_df, copy=False)
@@ -0,0 +1,285 @@
+"""학습/추론 공용 피처 엔진
+
+학습 데이터(data_cleaning.py)와 추론 데이터(feature_builder.py)가 같은 피처 정의를 쓰도록
+모든 엔지니어링 피처를 여기서 한 번만 선언한다. 각 피처는 입력 컬럼을 NumPy 배열로 받아
+배치 단위로 계산한다 (행 단위 apply/map 없음).
+
+기준 의미(관측소 목록, 권역 이름, 0/1 정수 플래그, 등급 경계)는 학습 데이터셋(data_cleaning.py)을 따른다.
+
+엔진은 피처 값까지만 책임진다. 피처 → 모델 입력 변환은 학습(split.load_feature_matrix)과
+추론(preprocess.preprocess_for_prediction)이 src/features/schema.py를 공유한다:
+제외 컬럼/결측 표기값(MODEL_EXCLUDE_COLUMNS, MISSING_SENTINELS), 원핫인코딩(encode_categoricals).
+결측치 대체는 학습 세트 평균(ModelBundle.fill_values)을 쓴다.
+
+사용:
+    df = compute_features(df, include_labels=True)                # 전체 피처
+    df = compute_features(df, groups=("time",))                    # 일부 그룹만
+    df = compute_features(df, groups=("temperature",), columns={"temperature": "TA"})
+"""
+
+import hashlib
+import importlib
+import inspect
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# ---------------------------------------------------------------------------
+# 기준 상수 (data_cleaning.py)
+# ---------------------------------------------------------------------------
+MORNING_RUSH_HOURS = (7, 8, 9)
+EVENING_RUSH_HOURS = (18, 19, 20)
+
+# 월(1~12) → 계절 (인덱스 0은 사용하지 않음)
+SEASON_BY_MONTH = np.array([
+    None, "winter", "winter", "spring", "spring", "spring", "summer",
+    "summer", "summer", "autumn", "autumn", "autumn", "winter",
+], dtype=object)
+
+# 온도 구간: t < 0, < 10, < 20, < 30, 그 이상
+TEMP_CATEGORY_EDGES = (0, 10, 20, 30)
+TEMP_CATEGORY_LABELS = ("very_cold", "cold", "mild", "warm", "hot")
+
+# 환경부 미세먼지 등급 (µg/m³): <= 30, <= 80, <= 150, 그 초과
+PM10_GRADE_EDGES = (30, 80, 150)
+PM10_GRADE_LABELS = ("good", "moderate", "bad", "very_bad")
+
+METRO_STATIONS = ("108", "159", "143", "112", "156", "133", "152")
+COASTAL_STATIONS = ("90", "100", "136", "168", "184")
+
+# 관측소 번호 첫 자리 → 권역
+REGION_BY_FIRST_DIGIT = {"1": "central", "2": "southern", "3": "eastern", "4": "western"}
+UNKNOWN = "unknown"
+
+# 쾌적지수 점수표
+COMFORT_BASE_SCORE = 80.0
+PM10_SCORE_EDGES = (15, 35, 75, 150)
+PM10_SCORES = (90, 70, 50, 30, 10)
+MISSING_SCORE = 50
+
+
+# ---------------------------------------------------------------------------
+# 벡터 연산 헬퍼
+# ---------------------------------------------------------------------------
+def _bucketize(values: np.ndarray, edges: Sequence[float], labels: Sequence,
+               right: bool = False, missing=np.nan) -> np.ndarray:
+    """구간 라벨 (right=False: [a, b), right=True: (a, b]). NaN은 missing"""
+    index = np.searchsorted(np.asarray(edges, dtype=np.float64), values,
+                            side="left" if right else "right")
+    index = np.minimum(index, len(labels) - 1)
+    out = np.asarray(labels, dtype=object)[index]
+    out[np.isnan(values)] = missing
+    return out
+
+
+def _flag(mask: np.ndarray) -> np.ndarray:
+    return mask.astype(np.int64)
+
+
+def _temp_score(temp: np.ndarray) -> np.ndarray:
+    """기온 점수 (15~22℃ 최적 90점 ... 극한 10점, 결측 50점)"""
+    return np.select(
+        [np.isnan(temp),
+         (15 <= temp) & (temp <= 22),
+         (10 <= temp) & (temp <= 25),
+         (5 <= temp) & (temp <= 30),
+         (0 <= temp) & (temp <= 35)],
+        [MISSING_SCORE, 90, 70, 50, 20],
+        default=10,
+    ).astype(np.float64)
+
+
+def _comfort_score(temp, pm10, rush, weekend, extreme) -> np.ndarray:
+    """종합 쾌적지수 (기온 50%, 미세먼지 30%, 출퇴근/주말/극한기온 보정, 0~100)"""
+    pm10_score = _bucketize(pm10, PM10_SCORE_EDGES, PM10_SCORES, right=True,
+                            missing=MISSING_SCORE).astype(np.float64)
+    comfort = COMFORT_BASE_SCORE * 0.5 + _temp_score(temp) * 0.5
+    comfort = comfort * 0.7 + pm10_score * 0.3
+    comfort = comfort - rush * 10 + weekend * 5 - extreme * 20
+    return np.clip(comfort, 0, 100)
+
+
+def _region(stations: np.ndarray) -> np.ndarray:
+    first_digit = stations.astype("U1")
+    return np.select(
+        [first_digit == digit for digit in REGION_BY_FIRST_DIGIT],
+        list(REGION_BY_FIRST_DIGIT.values()),
+        default=UNKNOWN,
+    ).astype(object)
+
+
+def _season(month: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(month)
+    out = np.full(len(month), np.nan, dtype=object)
+    out[valid] = SEASON_BY_MONTH[month[valid].astype(np.int64)]
+    return out
+
+
+def _to_int64(values: np.ndarray) -> pd.arrays.IntegerArray:
+    """NaN을 허용하는 정수 컬럼 (Int64)"""
+    return pd.array(values, dtype="Int64")
+
+
+# ---------------------------------------------------------------------------
+# 피처 선언
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class Feature:
+    """피처 하나의 정의
+
+    Attributes:
+        name: 출력 컬럼명
+        group: 피처 그룹 (time / temperature / air_quality / region / label)
+        inputs: 필수 입력 컬럼 (원본 또는 앞서 계산된 피처). 없으면 피처를 건너뜀
+        compute: 입력 배열들 → 출력 배열
+        optional: 없으면 0으로 채우는 입력 (보정용 플래그)
+        finalize: 출력 배열 후처리 (예: Int64 변환)
+    """
+
+    name: str
+    group: str
+    inputs: Tuple[str, ...]
+    compute: Callable[..., np.ndarray]
+    optional: Tuple[str, ...] = ()
+    finalize: Optional[Callable[[np.ndarray], object]] = None
+
+
+FEATURES: Tuple[Feature, ...] = (
+    # 1. 시간
+    Feature("hour", "time", ("_hour",), lambda h: h, finalize=_to_int64),
+    Feature("day_of_week", "time", ("_day_of_week",), lambda d: d, finalize=_to_int64),
+    Feature("month", "time", ("_month",), lambda m: m, finalize=_to_int64),
+    Feature("is_morning_rush", "time", ("_hour",), lambda h: _flag(np.isin(h, MORNING_RUSH_HOURS))),
+    Feature("is_evening_rush", "time", ("_hour",), lambda h: _flag(np.isin(h, EVENING_RUSH_HOURS))),
+    Feature("is_rush_hour", "time", ("_hour",),
+            lambda h: _flag(np.isin(h, MORNING_RUSH_HOURS + EVENING_RUSH_HOURS))),
+    Feature("is_weekday", "time", ("_day_of_week",), lambda d: _flag(d < 5)),
+    Feature("is_weekend", "time", ("_day_of_week",), lambda d: _flag(d >= 5)),
+    Feature("season", "time", ("_month",), _season),
+    # 2. 기온
+    Feature("temp_category", "temperature", ("temperature",),
+            lambda t: _bucketize(t, TEMP_CATEGORY_EDGES, TEMP_CATEGORY_LABELS)),
+    Feature("temp_comfort", "temperature", ("temperature",), lambda t: 20 - np.abs(t - 20)),
+    Feature("temp_extreme", "temperature", ("temperature",), lambda t: _flag((t < 0) | (t > 30))),
+    Feature("heating_needed", "temperature", ("temperature",), lambda t: _flag(t < 10)),
+    Feature("cooling_needed", "temperature", ("temperature",), lambda t: _flag(t > 25)),
+    # 3. 대기질
+    Feature("pm10_grade", "air_quality", ("pm10",),
+            lambda p: _bucketize(p, PM10_GRADE_EDGES, PM10_GRADE_LABELS, right=True, missing=UNKNOWN)),
+    Feature("mask_needed", "air_quality", ("pm10",), lambda p: _flag(p > 50)),
+    Feature("outdoor_activity_ok", "air_quality", ("pm10",), lambda p: _flag(p <= 80)),
+    # 4. 지역
+    Feature("is_metro_area", "region", ("station_id",), lambda s: _flag(np.isin(s, METRO_STATIONS))),
+    Feature("is_coastal", "region", ("station_id",), lambda s: _flag(np.isin(s, COASTAL_STATIONS))),
+    Feature("region", "region", ("station_id",), _region),
+    # 5. 정답 (학습용)
+    Feature("comfort_score", "label", ("temperature", "pm10"), _comfort_score,
+            optional=("is_rush_hour", "is_weekend", "temp_extreme")),
+)
+
+FEATURE_GROUPS = ("time", "temperature", "air_quality", "region", "label")
+FEATURE_NAMES = tuple(feature.name for feature in FEATURES)
+
+# 시간 성분 중간 입력 → datetime 접근자 속성
+_TIME_PARTS = {"_hour": "hour", "_day_of_week": "dayofweek", "_month": "month"}
+
+
+class _Columns:
+    """입력 컬럼 → NumPy 배열 (필요할 때 한 번만 변환)"""
+
+    def __init__(self, df: pd.DataFrame, columns: Mapping[str, str]):
+        self._df = df
+        self._columns = columns
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def source(self, name: str) -> str:
+        if name in _TIME_PARTS:
+            return self._columns.get("datetime", "datetime")
+        return self._columns.get(name, name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._arrays or self.source(name) in self._df.columns
+
+    def set(self, name: str, values: np.ndarray):
+        self._arrays[name] = values
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self._arrays:
+            series = self._df[self.source(name)]
+            if name in _TIME_PARTS:
+                dt = pd.to_datetime(series, errors="coerce")
+                values = getattr(dt.dt, _TIME_PARTS[name]).to_numpy(dtype=np.float64, na_value=np.nan)
+            elif name == "station_id":
+                values = series.astype(str).to_numpy(dtype=str)
+            else:
+                values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            self._arrays[name] = values
+        return self._arrays[name]
+
+
+def compute_features(df: pd.DataFrame, include_labels: bool = False,
+                     groups: Optional[Iterable[str]] = None,
+                     columns: Optional[Mapping[str, str]] = None) -> pd.DataFrame:
+    """선언된 피처를 배치 계산해 컬럼으로 추가한 DataFrame 반환 (원본은 변경하지 않음)
+
+    Args:
+        df: station_id / datetime / temperature / pm10 등 기본 컬럼을 가진 DataFrame
+        include_labels: True면 정답(comfort_score)도 계산 (groups 미지정 시)
+        groups: 계산할 피처 그룹 (None이면 label을 제외한 전체, include_labels면 label 포함)
+        columns: 입력 이름 → 실제 컬럼명 (예: {"temperature": "TA"})
+
+    필수 입력이 없는 피처는 건너뛴다.
+    """
+    if groups is None:
+        groups = FEATURE_GROUPS if include_labels else FEATURE_GROUPS[:-1]
+    groups = set(groups)
+    unknown = groups - set(FEATURE_GROUPS)
+    if unknown:
+        raise ValueError(f"알 수 없는 피처 그룹: {sorted(unknown)}")
+
+    inputs = _Columns(df, columns or {})
+    outputs: Dict[str, object] = {}
+    n_rows = len(df)
+
+    for feature in FEATURES:
+        if feature.group not in groups or not all(name in inputs for name in feature.inputs):
+            continue
+        args = [inputs[name] for name in feature.inputs]
+        args += [inputs[name] if name in inputs else np.zeros(n_rows) for name in feature.optional]
+        values = feature.compute(*args)
+        inputs.set(feature.name, values)
+        outputs[feature.name] = feature.finalize(values) if feature.finalize else values
+
+    return df.assign(**outputs)
+
+
+# 피처 값에 영향을 주는 모듈 (엔진 + 원시 데이터 → 엔진 입력 변환/컬럼 병합)
+DEFINITION_MODULES = (__name__, "src.features.feature_builder")
+
+
+@lru_cache(maxsize=1)
+def definition_hash() -> str:
+    """피처 정의 버전 (DEFINITION_MODULES 소스의 해시). 정의가 바뀌면 저장된 피처를 다시 계산한다
+
+    feature_builder는 이 모듈을 import하므로 순환 import를 피하려고 호출 시점에 import한다.
+    """
+    digest = hashlib.sha256()
+    for module_name in DEFINITION_MODULES:
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        digest.update(inspect.getsource(module).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+__all__ = [
+    "Feature",
+    "FEATURES",
+    "FEATURE_GROUPS",
+    "FEATURE_NAMES",
+    "compute_features",
+    "definition_hash",
+]
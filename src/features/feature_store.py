@@ -0,0 +1,241 @@
+"""로컬 오프라인 피처 스토어 (키: station_id + 시각)
+
+시간별 수집, 주간 Rolling Window, 학습, 노트북에서 같은 관측소-시간의 피처를 반복 계산하지 않도록
+계산된 피처를 피처 정의 버전별로 일 단위 파티션 Parquet에 저장한다.
+
+레이아웃:
+    {root}/v={definition_hash}/dt=YYYY-MM-DD/part-{YYYYmmddTHHMMSSffffff}-{uuid8}.parquet
+
+- read: 날짜 범위의 파티션만 읽는 학습용 구간 조회
+- get / get_many: 파티션을 한 번 읽어 (station_id, datetime) → 행 dict 인덱스를 만든 뒤 O(1) 조회
+- get_or_compute: 현재 정의 버전에 없는 키만 피처 엔진으로 계산해 저장
+- 피처 정의(src/features/engine.py, feature_builder.py)가 바뀌면 버전 디렉토리가 바뀌므로 이전 피처는 재사용되지 않는다
+"""
+
+import os
+import shutil
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.features.engine import definition_hash
+from src.features.feature_builder import create_ml_dataset_from_frame
+from src.storage.partitioned_store import DateLike, _to_naive_datetime
+from src.utils.logger_config import configure_logger
+
+
+FEATURE_STORE_DIR = os.getenv("FEATURE_STORE_DIR", "data/feature_store")
+KEY_COLUMNS = ("station_id", "datetime")
+
+FeatureKey = Tuple[str, pd.Timestamp]
+
+
+def _normalize_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """station_id는 문자열, datetime은 tz 없는 정시(hour)로 정규화"""
+    df = df.copy()
+    df["station_id"] = df["station_id"].astype(str)
+    df["datetime"] = _to_naive_datetime(df["datetime"]).dt.floor("h")
+    return df.dropna(subset=["datetime"])
+
+
+def _key(station_id, when) -> FeatureKey:
+    when = pd.Timestamp(when)
+    if when.tzinfo is not None:
+        when = when.tz_localize(None)
+    return str(station_id), when.floor("h")
+
+
+class LocalFeatureStore:
+    """피처 정의 버전별 파티션 Parquet 피처 스토어 (로컬 디렉토리)"""
+
+    def __init__(self, root: str = FEATURE_STORE_DIR, version: Optional[str] = None):
+        self.root = root
+        self.version = version or definition_hash()
+        self.version_dir = os.path.join(root, f"v={self.version}")
+        self._partition_index: Dict[date, Dict[FeatureKey, Dict[str, Any]]] = {}
+        self._logger = configure_logger(self.__class__.__name__)
+
+    # ------------------------------------------------------------------
+    # 경로 유틸
+    # ------------------------------------------------------------------
+    def partition_dir(self, partition: date) -> str:
+        return os.path.join(self.version_dir, f"dt={partition.isoformat()}")
+
+    def list_partitions(self) -> Dict[date, List[str]]:
+        """파티션 날짜 → 파일 경로 목록 (이름순 = 작성 순서)"""
+        if not os.path.isdir(self.version_dir):
+            return {}
+        partitions = {}
+        for name in sorted(os.listdir(self.version_dir)):
+            if not name.startswith("dt="):
+                continue
+            try:
+                partition = date.fromisoformat(name[3:])
+            except ValueError:
+                continue
+            files = self.partition_files(partition)
+            if files:
+                partitions[partition] = files
+        return partitions
+
+    def partition_files(self, partition: date) -> List[str]:
+        """한 파티션의 파일 경로 목록 (이름순 = 작성 순서)"""
+        directory = self.partition_dir(partition)
+        if not os.path.isdir(directory):
+            return []
+        return [os.path.join(directory, f) for f in sorted(os.listdir(directory)) if f.endswith(".parquet")]
+
+    def list_versions(self) -> List[str]:
+        """저장된 피처 정의 버전 목록"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name[2:] for name in os.listdir(self.root) if name.startswith("v="))
+
+    def drop_stale_versions(self) -> List[str]:
+        """현재 정의 버전이 아닌 피처 디렉토리 삭제"""
+        stale = [v for v in self.list_versions() if v != self.version]
+        for version in stale:
+            shutil.rmtree(os.path.join(self.root, f"v={version}"), ignore_errors=True)
+        if stale:
+            self._logger.info(f"이전 피처 버전 삭제: {stale}")
+        return stale
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def write(self, features: pd.DataFrame) -> List[str]:
+        """피처 행을 파티션별 파일로 추가 (같은 키는 나중에 쓴 값이 우선)
+
+        Returns:
+            작성된 파일 경로 목록
+        """
+        if features.empty:
+            return []
+
+        features = _normalize_keys(features).drop_duplicates(subset=list(KEY_COLUMNS), keep="last")
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+
+        written = []
+        for partition, part_df in features.groupby(features["datetime"].dt.date, sort=True):
+            directory = self.partition_dir(partition)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"part-{stamp}-{uuid.uuid4().hex[:8]}.parquet")
+            part_df.reset_index(drop=True).to_parquet(path, index=False)
+            self._partition_index.pop(partition, None)
+            written.append(path)
+
+        self._logger.info(f"피처 저장: {len(features):,} 행, 파일 {len(written)}개 (v={self.version})")
+        return written
+
+    # ------------------------------------------------------------------
+    # 구간 조회 (학습)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _read_files(paths: Sequence[str], columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        frames = [pq.read_table(path, columns=list(columns) if columns else None).to_pandas() for path in paths]
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=list(columns) if columns else None)
+        return pd.concat(frames, ignore_index=True)
+
+    def read(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None,
+             stations: Optional[Iterable[str]] = None,
+             columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """[start, end) 구간 피처 로드 (범위 밖 파티션은 읽지 않음, 키 중복은 마지막 값)"""
+        start_ts = pd.Timestamp(start) if start is not None else None
+        end_ts = pd.Timestamp(end) if end is not None else None
+
+        paths = [
+            path
+            for partition, files in self.list_partitions().items()
+            if (start_ts is None or partition >= start_ts.date())
+            and (end_ts is None or partition <= end_ts.date())
+            for path in files
+        ]
+        if columns is not None:
+            columns = list(KEY_COLUMNS) + [c for c in columns if c not in KEY_COLUMNS]
+
+        df = self._read_files(paths, columns=columns)
+        if df.empty:
+            return df
+
+        if start_ts is not None:
+            df = df[df["datetime"] >= start_ts]
+        if end_ts is not None:
+            df = df[df["datetime"] < end_ts]
+        if stations is not None:
+            df = df[df["station_id"].isin([str(s) for s in stations])]
+        df = df.drop_duplicates(subset=list(KEY_COLUMNS), keep="last")
+        return df.sort_values(["datetime", "station_id"]).reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # 포인트 조회 (온라인 스코어링)
+    # ------------------------------------------------------------------
+    def _index(self, partition: date) -> Dict[FeatureKey, Dict[str, Any]]:
+        """파티션 → (station_id, datetime) 키 인덱스 (처음 조회할 때 한 번만 생성)"""
+        index = self._partition_index.get(partition)
+        if index is None:
+            df = self._read_files(self.partition_files(partition))
+            index = {}
+            for record in df.to_dict("records"):  # 나중 파일의 같은 키가 덮어씀
+                index[(record["station_id"], pd.Timestamp(record["datetime"]))] = record
+            self._partition_index[partition] = index
+        return index
+
+    def get(self, station_id, when) -> Optional[Dict[str, Any]]:
+        """(station_id, 시각) 피처 한 행 (없으면 None)"""
+        key = _key(station_id, when)
+        return self._index(key[1].date()).get(key)
+
+    def get_many(self, keys: Iterable[Tuple[Any, Any]]) -> Dict[FeatureKey, Optional[Dict[str, Any]]]:
+        """여러 키 조회 → {정규화된 키: 행 또는 None}"""
+        result = {}
+        for station_id, when in keys:
+            key = _key(station_id, when)
+            result[key] = self._index(key[1].date()).get(key)
+        return result
+
+    # ------------------------------------------------------------------
+    # 없는 키만 계산
+    # ------------------------------------------------------------------
+    def get_or_compute(self, rows: pd.DataFrame, include_labels: bool = False) -> pd.DataFrame:
+        """관측 행(마스터 데이터셋 형식)의 피처 반환. 현재 버전에 없는 키만 계산해 저장
+
+        Args:
+            rows: STN/station_id, datetime, 기상 관측값 컬럼을 가진 DataFrame
+            include_labels: comfort_score 포함 여부 (저장된 행에 없으면 다시 계산)
+
+        Returns:
+            요청한 키의 피처 DataFrame (datetime, station_id 순 정렬)
+        """
+        if rows.empty:
+            return pd.DataFrame()
+
+        station = rows["STN"] if "STN" in rows.columns else rows["station_id"]
+        keys = _normalize_keys(pd.DataFrame({"station_id": station, "datetime": rows["datetime"]}))
+        found = self.get_many(zip(keys["station_id"], keys["datetime"]))
+
+        def usable(record):
+            return record is not None and (not include_labels or pd.notna(record.get("comfort_score")))
+
+        missing = [key for key, record in found.items() if not usable(record)]
+        if missing:
+            missing_index = pd.MultiIndex.from_tuples(missing)
+            is_missing = pd.MultiIndex.from_frame(keys[list(KEY_COLUMNS)]).isin(missing_index)
+            computed = create_ml_dataset_from_frame(rows.loc[keys.index[is_missing]],
+                                                    include_labels=include_labels)
+            if not computed.empty:
+                self.write(computed)
+                found.update(self.get_many(missing))
+
+        self._logger.info(f"피처 조회: {len(found)} 키 (계산 {len(missing)}, 재사용 {len(found) - len(missing)})")
+        records = [record for record in found.values() if record is not None]
+        if not records:
+            return pd.DataFrame()
+        return pd.DataFrame.from_records(records).sort_values(["datetime", "station_id"]).reset_index(drop=True)
+
+
+__all__ = ["LocalFeatureStore", "FEATURE_STORE_DIR"]
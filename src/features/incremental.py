@@ -0,0 +1,120 @@
+"""시간별 피처 테이블 증분 갱신
+
+feature_builder의 엔지니어링 피처는 모두 행 단위(row-local) 계산이므로, 새로 들어온
+(station_id, datetime) 행의 피처만 계산해 피처 테이블에 추가해도 전체를 다시 계산한
+결과와 같다. 시간당 비용은 O(새 행 수)이다.
+
+이미 있는 키가 다시 들어오면(재시도, 늦게 도착한 PM10 등 값 보정) 새 값으로 덮어쓴다.
+마스터 데이터셋과 같이 파일을 추가만 하고, 읽기(deduplicate=True)와 병합(compact) 시
+같은 키는 나중에 쓴 값(keep="last")이 남는다.
+
+레이아웃 (PartitionedParquetStore):
+    ml_dataset/features_hourly/dt=YYYY-MM-DD/part-*.parquet
+"""
+
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from src.features.feature_builder import ASOS_FIELD_ALIASES, create_ml_dataset_from_frame
+from src.storage.partitioned_store import PartitionedParquetStore, _to_naive_datetime
+from src.utils.logger_config import configure_logger
+
+
+FEATURE_DATASET_PREFIX = "ml_dataset/features_hourly"
+FEATURE_KEY_COLUMNS = ("datetime", "station_id")
+
+_logger = configure_logger("incremental_features")
+
+
+def feature_store(s3_client, prefix: str = FEATURE_DATASET_PREFIX) -> PartitionedParquetStore:
+    """피처 테이블 저장소 (키: datetime + station_id)"""
+    return PartitionedParquetStore(s3_client, prefix=prefix, key_columns=FEATURE_KEY_COLUMNS)
+
+
+def master_rows_to_raw_data(df: pd.DataFrame) -> Dict[str, List[Dict[str, Any]]]:
+    """마스터 데이터셋 행 → feature_builder 레코드 입력 형식 ({"asos": [...], "pm10": [...]})
+
+    새 필드명(temperature 등) 값이 없으면 원본 KMA 컬럼(TA 등) 값을 사용한다.
+    피처 계산에는 행 단위 변환 없이 create_ml_dataset_from_frame을 사용한다.
+    """
+    asos_records = []
+    pm10_records = []
+
+    for _, row in df.iterrows():
+        station_id = str(row.get('STN', row.get('station_id', 'unknown')))
+        observed_at = row.get('datetime')
+
+        asos_record = {"station_id": station_id, "observed_at": observed_at, "category": "asos"}
+        for field, kma_column in ASOS_FIELD_ALIASES.items():
+            value = row.get(field)
+            asos_record[field] = value if pd.notna(value) else row.get(kma_column)
+
+        # 하나라도 데이터가 있으면 추가
+        if any(pd.notna(asos_record[field]) for field in ASOS_FIELD_ALIASES):
+            asos_records.append(asos_record)
+
+        # PM10 데이터
+        if pd.notna(row.get('pm10')) or pd.notna(row.get('PM10')):
+            pm10_records.append({
+                "station_id": station_id,
+                "observed_at": observed_at,
+                "category": "pm10",
+                "value": row.get('pm10') or row.get('PM10'),
+                "unit": "μg/m³"
+            })
+
+    return {"asos": asos_records, "pm10": pm10_records}
+
+
+def _key_frame(df: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame({
+        "datetime": _to_naive_datetime(df["datetime"]),
+        "station_id": df["station_id"].astype(str),
+    })
+
+
+def append_new_features(store: PartitionedParquetStore, new_rows: pd.DataFrame,
+                        include_labels: bool = True) -> Dict[str, Any]:
+    """새 마스터 행의 피처를 계산해 피처 테이블에 추가 (이미 있는 키는 새 값으로 덮어씀)
+
+    덮어쓴 키 수 확인은 새 행이 속한 날짜 파티션의 키 컬럼만 읽는다.
+
+    Returns:
+        dict: {"rows_computed", "rows_appended", "keys_overwritten", "written_keys"}
+    """
+    result = {"rows_computed": 0, "rows_appended": 0, "keys_overwritten": 0, "written_keys": []}
+    if new_rows.empty:
+        return result
+
+    features = create_ml_dataset_from_frame(new_rows, include_labels=include_labels)
+    if features.empty:
+        return result
+    result["rows_computed"] = len(features)
+
+    # 같은 키가 배치 안에 여러 번 있으면 마지막 값 사용
+    keys = _key_frame(features)
+    unique = ~keys.duplicated(keep="last").to_numpy()
+    features, keys = features[unique], keys[unique]
+
+    first_day = keys["datetime"].min().normalize()
+    last_day = keys["datetime"].max().normalize() + pd.Timedelta(days=1)
+    existing = store.read(start=first_day, end=last_day, columns=["station_id"])
+    if not existing.empty:
+        existing_index = pd.MultiIndex.from_frame(_key_frame(existing))
+        result["keys_overwritten"] = int(pd.MultiIndex.from_frame(keys).isin(existing_index).sum())
+
+    # 기존 키도 추가 작성 → 읽기/병합 시 나중 값(keep="last")이 우선
+    result["written_keys"] = store.append(features)
+    result["rows_appended"] = len(features)
+    _logger.info(f"피처 테이블 증분 추가: {result['rows_appended']} 행 "
+                 f"(계산 {result['rows_computed']}, 덮어쓴 기존 키 {result['keys_overwritten']})")
+    return result
+
+
+__all__ = [
+    "FEATURE_DATASET_PREFIX",
+    "feature_store",
+    "master_rows_to_raw_data",
+    "append_new_features",
+]
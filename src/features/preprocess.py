@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from src.features.schema import MISSING_SENTINELS, MODEL_EXCLUDE_COLUMNS, encode_categoricals
+from src.utils.logger_config import configure_logger
+
+
+# 온라인 스코어링(/score) 마이크로배치마다 호출되므로 진행 로그는 debug로만 남긴다
+_logger = configure_logger("preprocess")
+
+
+def preprocess_for_prediction(df, feature_columns, fill_values=None):
+    """피처 DataFrame → 학습 시 컬럼 순서의 모델 입력 (행 단위 처리)
+
+    입력 피처는 학습과 같은 피처 엔진(src.features.engine)으로 만들어지고, 원핫인코딩도
+    학습과 같은 schema.encode_categoricals를 쓴다. 배치 통계(배치 평균, 배치 결측 비율)를
+    쓰지 않으므로 같은 행은 혼자 오든 다른 행과 함께 오든 항상 같은 입력이 된다.
+
+    Args:
+        df: 피처 DataFrame
+        feature_columns: 학습 시 피처 컬럼 순서 (없는 컬럼은 0)
+        fill_values: 컬럼 → 결측치 대체값 (학습 세트 평균, ModelBundle.fill_values). 없으면 0
+    """
+    _logger.debug(f"전처리 시작: {df.shape}")
+
+    # 타겟/키 제외 + 결측 표기값 변환 (학습 split.load_feature_matrix와 같은 스키마 상수)
+    feature_cols = [col for col in df.columns if col not in MODEL_EXCLUDE_COLUMNS]
+
+    X = df[feature_cols].copy()
+    X = X.replace(MISSING_SENTINELS, np.nan)
+
+    # 원핫인코딩 (학습과 같은 고정 어휘) + 학습 시 컬럼 순서로 보정 (없는 컬럼은 0)
+    X = encode_categoricals(X, feature_columns).astype(np.float64)
+
+    # 결측치는 학습 세트 평균으로 대체 (남은 결측치는 0)
+    if fill_values:
+        X = X.fillna(value={col: value for col, value in fill_values.items() if col in X.columns})
+    X = X.fillna(0)
+
+    _logger.debug(f"전처리 완료: {X.shape}")
+    return X
@@ -0,0 +1,139 @@
+"""학습용 피처 데이터셋 dtype 스키마
+
+`src/data/data_cleaning.py`가 만드는 처리 데이터셋의 모든 컬럼에 대해 저장/로드/학습 시
+사용할 dtype을 정의한다.
+
+- 측정값/연속형 피처: float32
+- 시간 성분(hour/day_of_week/month), 0/1 플래그: uint8
+- 범주형: 고정 어휘의 category (어휘 밖의 값은 NaN)
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+DATETIME_COLUMN = "datetime"
+STATION_COLUMN = "station_id"
+TARGET_COLUMN = "comfort_score"
+
+FLOAT_COLUMNS = [
+    "temperature", "pm10", "wind_speed", "humidity", "pressure", "rainfall",
+    "wind_direction", "dew_point", "cloud_amount", "visibility", "sunshine",
+    "temp_comfort", TARGET_COLUMN,
+]
+
+SMALL_INT_COLUMNS = ["hour", "day_of_week", "month"]
+
+FLAG_COLUMNS = [
+    "is_morning_rush", "is_evening_rush", "is_rush_hour", "is_weekday", "is_weekend",
+    "temp_extreme", "heating_needed", "cooling_needed",
+    "mask_needed", "outdoor_activity_ok",
+    "is_metro_area", "is_coastal",
+]
+
+# 범주형 컬럼 → 고정 어휘 (피처 엔진 src/features/engine.py 기준)
+CATEGORY_VOCABULARIES: Dict[str, List[str]] = {
+    "season": ["winter", "spring", "summer", "autumn"],
+    "temp_category": ["very_cold", "cold", "mild", "warm", "hot"],
+    "pm10_grade": ["good", "moderate", "bad", "very_bad", "unknown"],
+    "region": ["central", "southern", "eastern", "western", "unknown"],
+}
+
+# 원핫 인코딩 대상 범주형 컬럼 (encode_categoricals)
+CATEGORICAL_FEATURES = list(CATEGORY_VOCABULARIES)
+
+# 모델 입력에서 제외하는 컬럼 (타겟, 타겟 계산에 쓰인 pm10, 키)
+MODEL_EXCLUDE_COLUMNS = [TARGET_COLUMN, "pm10", DATETIME_COLUMN, STATION_COLUMN]
+
+# 원천 데이터의 결측 표기값 (모델 입력 전 NaN으로 변환)
+MISSING_SENTINELS = [-99, -9]
+
+
+def feature_dtypes() -> Dict[str, object]:
+    """컬럼 → dtype 매핑 (station_id는 열린 어휘 category)"""
+    dtypes: Dict[str, object] = {DATETIME_COLUMN: "datetime64[ns]", STATION_COLUMN: "category"}
+    dtypes.update({col: np.float32 for col in FLOAT_COLUMNS})
+    dtypes.update({col: np.uint8 for col in SMALL_INT_COLUMNS + FLAG_COLUMNS})
+    dtypes.update({
+        col: pd.CategoricalDtype(categories=vocab)
+        for col, vocab in CATEGORY_VOCABULARIES.items()
+    })
+    return dtypes
+
+
+def apply_feature_schema(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+    """스키마에 정의된 컬럼만 dtype 변환 (없는 컬럼은 무시, 정의 밖의 float64는 float32로)
+
+    결측치가 있는 정수형 컬럼은 uint8 대신 float32로 둔다.
+    """
+    if copy:
+        df = df.copy()
+
+    for col, dtype in feature_dtypes().items():
+        if col not in df.columns:
+            continue
+        series = df[col]
+        if col == DATETIME_COLUMN:
+            if not pd.api.types.is_datetime64_any_dtype(series):
+                df[col] = pd.to_datetime(series, errors="coerce")
+        elif col == STATION_COLUMN:
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                df[col] = series.astype(str).where(series.notna()).astype("category")
+        elif isinstance(dtype, pd.CategoricalDtype):
+            if series.dtype != dtype:
+                df[col] = series.astype(object).astype(dtype)
+        elif dtype is np.uint8:
+            numeric = pd.to_numeric(series, errors="coerce")
+            df[col] = numeric.astype(np.float32) if numeric.isna().any() else numeric.astype(np.uint8)
+        elif series.dtype != dtype:
+            df[col] = pd.to_numeric(series, errors="coerce").astype(dtype)
+
+    extra_floats = df.select_dtypes(include=["float64"]).columns
+    if len(extra_floats):
+        df[extra_floats] = df[extra_floats].astype(np.float32)
+    return df
+
+
+def encode_categoricals(df: pd.DataFrame, feature_columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """범주형 컬럼 원핫인코딩 (학습 split.py와 추론 preprocess.py 공용)
+
+    고정 어휘(CATEGORY_VOCABULARIES) 순서로 category를 맞춘 뒤 첫 범주를 drop하므로
+    배치에 어떤 범주가 들어 있든 같은 값은 항상 같은 더미 벡터가 된다.
+    feature_columns를 주면 그 컬럼 순서로 맞추고 없는 컬럼은 0으로 채운다.
+    """
+    categorical_cols = [col for col in CATEGORICAL_FEATURES if col in df.columns]
+    if categorical_cols:
+        df = df.copy()
+        for col in categorical_cols:
+            dtype = pd.CategoricalDtype(CATEGORY_VOCABULARIES[col])
+            if df[col].dtype != dtype:
+                df[col] = df[col].astype(object).astype(dtype)
+        df = pd.get_dummies(df, columns=categorical_cols, drop_first=True, dtype=np.uint8)
+    if feature_columns is not None:
+        df = df.reindex(columns=list(feature_columns), fill_value=0)
+    return df
+
+
+def frame_memory_mb(df: pd.DataFrame) -> float:
+    """DataFrame 메모리 사용량 (MB, object 내용 포함)"""
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+__all__ = [
+    "DATETIME_COLUMN",
+    "STATION_COLUMN",
+    "TARGET_COLUMN",
+    "FLOAT_COLUMNS",
+    "SMALL_INT_COLUMNS",
+    "FLAG_COLUMNS",
+    "CATEGORY_VOCABULARIES",
+    "CATEGORICAL_FEATURES",
+    "MODEL_EXCLUDE_COLUMNS",
+    "MISSING_SENTINELS",
+    "feature_dtypes",
+    "apply_feature_schema",
+    "encode_categoricals",
+    "frame_memory_mb",
+]
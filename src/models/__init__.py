@@ -1,4 +1,32 @@
-from .split import *
-from .train import *
+"""모델 학습 패키지
 
-__all__ = []  # 필요한 함수들 추가
\ No newline at end of file
+하위 모듈(split/train/tune)은 import 비용이 크므로 패키지 import 시점에 로드하지 않고,
+`from src.models import train_models`처럼 속성에 처음 접근할 때 해당 모듈을 import한다.
+"""
+
+import importlib
+
+# 패키지 속성 → 정의된 하위 모듈
+_LAZY_ATTRIBUTES = {
+    'split_and_scale_data': 'split',
+    'load_feature_matrix': 'split',
+    'random_split_indices': 'split',
+    'time_split_ranges': 'split',
+    'train_models': 'train',
+    'fit_and_evaluate': 'train',
+    'fit_models_parallel': 'train',
+    'tune_hyperparameters': 'tune',
+    'EvaluationPolicy': 'evaluation',
+    'ModelBundle': 'predictor',
+    'load_model_bundle': 'predictor',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f'{__name__}.{_LAZY_ATTRIBUTES[name]}')
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_LAZY_ATTRIBUTES)
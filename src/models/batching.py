@@ -0,0 +1,225 @@
+"""동시 스코어링 요청 마이크로배칭 (asyncio)
+
+요청마다 model.predict를 한 행씩 호출하면 트리 앙상블은 호출당 고정 비용이 행당 비용보다 훨씬 크다.
+MicroBatcher는 최대 max_batch_rows 행 또는 max_wait_ms 밀리초 동안 들어온 요청을 모아
+predict_fn을 한 번 호출하고, 결과를 요청별로 나눠 돌려준다.
+predict_fn은 행 단위로 독립이어야 한다 (ModelBundle.predict_observations처럼 배치 통계를 쓰지 않음).
+그래야 요청 결과가 함께 배치된 다른 요청과 무관하다.
+
+설정 (환경변수, MicroBatcher.from_env):
+    SCORE_BATCH_MAX_ROWS     한 번에 predict할 최대 행 수 (기본 256)
+    SCORE_BATCH_MAX_WAIT_MS  첫 요청 이후 더 기다리는 최대 시간 (기본 5ms)
+    SCORE_BATCH_MAX_QUEUE    대기 가능한 최대 요청 수, 넘으면 BatcherOverloaded (기본 1000)
+
+지표 (stats()): 요청 대기 시간, predict 시간, 요청 전체 시간 히스토그램(ms) + 배치 행 수 히스토그램
+
+사용:
+    batcher = MicroBatcher(lambda df: bundle.predict_observations(df))
+    await batcher.start()
+    scores = await batcher.submit(observations_df)   # np.ndarray (요청 행 수만큼)
+    await batcher.stop()
+"""
+
+import asyncio
+import bisect
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utils.logger_config import configure_logger
+
+
+PredictFn = Callable[[pd.DataFrame], np.ndarray]
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+BATCH_ROWS_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+class BatcherOverloaded(RuntimeError):
+    """대기 중인 요청이 max_queue_size를 넘음"""
+
+
+class Histogram:
+    """고정 구간 히스토그램 (구간별 개수 + 합계, 분위수는 구간 상한으로 추정)"""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수가 속한 구간의 상한 (+Inf 구간이면 마지막 경계)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return self.bounds[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets, cumulative = {}, 0
+        for bound, count in zip(list(self.bounds) + ["+Inf"], self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,  # 상한 이하 누적 개수 (Prometheus le 형식)
+        }
+
+
+class MicroBatcher:
+    """요청 DataFrame들을 모아 predict_fn 한 번으로 처리"""
+
+    def __init__(self, predict_fn: PredictFn, max_batch_rows: int = 256, max_wait_ms: float = 5.0,
+                 max_queue_size: int = 1000):
+        self.predict_fn = predict_fn
+        self.max_batch_rows = max_batch_rows
+        self.max_wait_ms = max_wait_ms
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._logger = configure_logger(self.__class__.__name__)
+        self.reset_stats()
+
+    @classmethod
+    def from_env(cls, predict_fn: PredictFn) -> "MicroBatcher":
+        return cls(
+            predict_fn,
+            max_batch_rows=int(os.getenv("SCORE_BATCH_MAX_ROWS", "256")),
+            max_wait_ms=float(os.getenv("SCORE_BATCH_MAX_WAIT_MS", "5")),
+            max_queue_size=int(os.getenv("SCORE_BATCH_MAX_QUEUE", "1000")),
+        )
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+    def reset_stats(self):
+        self.histograms = {
+            "queue_wait_ms": Histogram(LATENCY_BUCKETS_MS),
+            "predict_ms": Histogram(LATENCY_BUCKETS_MS),
+            "request_ms": Histogram(LATENCY_BUCKETS_MS),
+            "batch_rows": Histogram(BATCH_ROWS_BUCKETS),
+        }
+        self.counters = {"requests": 0, "batches": 0, "errors": 0, "rejected": 0}
+
+    def stats(self) -> Dict[str, Any]:
+        """설정 + 카운터 + 히스토그램 스냅샷"""
+        return {
+            "config": {
+                "max_batch_rows": self.max_batch_rows,
+                "max_wait_ms": self.max_wait_ms,
+                "max_queue_size": self.max_queue_size,
+            },
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            **self.counters,
+            **{name: histogram.snapshot() for name, histogram in self.histograms.items()},
+        }
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    async def start(self):
+        if self._worker is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, rows: pd.DataFrame) -> np.ndarray:
+        """rows를 다음 배치에 넣고 해당 행들의 예측값을 기다림
+
+        Raises:
+            BatcherOverloaded: 대기 중인 요청이 max_queue_size만큼 차 있음
+        """
+        if self._worker is None:
+            await self.start()
+        submitted_at = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((rows, future, submitted_at))
+        except asyncio.QueueFull:
+            self.counters["rejected"] += 1
+            raise BatcherOverloaded(f"스코어링 대기 요청이 {self.max_queue_size}건을 넘었습니다.")
+        try:
+            return await future
+        finally:
+            self.counters["requests"] += 1
+            self.histograms["request_ms"].observe((time.perf_counter() - submitted_at) * 1000)
+
+    async def _collect(self) -> List[Tuple[pd.DataFrame, asyncio.Future, float]]:
+        """첫 요청 이후 max_wait_ms 또는 max_batch_rows까지 요청 수집"""
+        batch = [await self._queue.get()]
+        n_rows = len(batch[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_wait_ms / 1000
+
+        while n_rows < self.max_batch_rows:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            n_rows += len(item[0])
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            batch = [item for item in batch if not item[1].cancelled()]
+            if not batch:
+                continue
+
+            started_at = time.perf_counter()
+            for _, _, submitted_at in batch:
+                self.histograms["queue_wait_ms"].observe((started_at - submitted_at) * 1000)
+
+            frames = [rows for rows, _, _ in batch]
+            combined = pd.concat(frames, ignore_index=True)
+            self.counters["batches"] += 1
+            self.histograms["batch_rows"].observe(len(combined))
+            try:
+                # 전처리 + scaler.transform + predict는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+                predictions = await asyncio.to_thread(self.predict_fn, combined)
+            except Exception as e:
+                self.counters["errors"] += 1
+                self._logger.error(f"배치 예측 실패 ({len(batch)} 요청): {e}")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                self.histograms["predict_ms"].observe((time.perf_counter() - started_at) * 1000)
+
+            offsets = np.cumsum([0] + [len(rows) for rows in frames])
+            for (_, future, _), start, end in zip(batch, offsets[:-1], offsets[1:]):
+                if not future.done():
+                    future.set_result(predictions[start:end])
+
+
+__all__ = ["MicroBatcher", "BatcherOverloaded", "Histogram"]
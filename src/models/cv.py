@@ -0,0 +1,122 @@
+"""시계열 순서를 지키는 교차검증 분할과 fold 행렬 캐시
+
+- TimeBlockedSplit: datetime 기준으로 시간 블록을 나누고, 각 fold는 과거 블록으로 학습해
+  바로 다음 블록으로 검증 (같은 시각의 행은 항상 같은 블록)
+- build_cached_folds: fold 인덱스와 fold별 스케일링된 행렬을 한 번만 만들어 두고,
+  모든 하이퍼파라미터 후보가 재사용하도록 하나의 행렬 + 인덱스 목록으로 제공
+"""
+
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+
+class TimeBlockedSplit:
+    """시간 순서 기반 expanding-window 분할 (sklearn cv 호환)
+
+    고유 시각을 n_splits + 1개의 연속 블록으로 나누고, k번째 fold는
+    블록 0..k로 학습, 블록 k+1로 검증한다. gap_hours를 주면 검증 블록 직전
+    gap_hours 시간의 학습 행은 제외한다 (시차 피처 누수 방지).
+    """
+
+    def __init__(self, timestamps, n_splits: int = 3, gap_hours: int = 0):
+        if n_splits < 2:
+            raise ValueError("n_splits는 2 이상이어야 합니다.")
+        self.timestamps = np.asarray(timestamps, dtype="datetime64[ns]")
+        self.n_splits = n_splits
+        self.gap_hours = gap_hours
+
+    def get_n_splits(self, X=None, y=None, groups=None) -> int:
+        return self.n_splits
+
+    def split(self, X=None, y=None, groups=None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        unique_times = np.unique(self.timestamps)
+        if len(unique_times) < self.n_splits + 1:
+            raise ValueError(f"고유 시각 {len(unique_times)}개로는 {self.n_splits}개 fold를 만들 수 없습니다.")
+
+        # 행 → 시간 블록 번호
+        block_edges = np.array_split(unique_times, self.n_splits + 1)
+        block_starts = np.array([block[0] for block in block_edges])
+        row_blocks = np.searchsorted(block_starts, self.timestamps, side="right") - 1
+
+        gap = np.timedelta64(self.gap_hours, "h")
+        for k in range(self.n_splits):
+            val_mask = row_blocks == k + 1
+            train_mask = row_blocks <= k
+            if self.gap_hours:
+                train_mask &= self.timestamps < block_starts[k + 1] - gap
+            yield np.flatnonzero(train_mask), np.flatnonzero(val_mask)
+
+
+@dataclass
+class CachedFolds:
+    """fold별로 스케일링된 행렬을 이어 붙인 검색용 데이터
+
+    X/y는 [fold0 train, fold0 val, fold1 train, ...] 순서로 이어 붙인 배열이고,
+    cv는 그 위의 (train_idx, val_idx) 목록이다. 탐색기는 인덱스로 슬라이스만 하므로
+    후보마다 다시 분할하거나 스케일링하지 않는다.
+    """
+
+    X: np.ndarray
+    y: np.ndarray
+    cv: List[Tuple[np.ndarray, np.ndarray]]
+    fold_indices: List[Tuple[np.ndarray, np.ndarray]]
+
+    @property
+    def n_splits(self) -> int:
+        return len(self.cv)
+
+
+def build_cached_folds(X: np.ndarray, y, splitter, dtype=np.float32,
+                       scale: bool = True) -> CachedFolds:
+    """splitter의 fold 인덱스를 한 번만 계산하고, fold별 학습 구간으로 스케일러를 맞춰 행렬 캐시
+
+    Args:
+        X: 스케일링 전 피처 행렬
+        y: 타겟 (배열 또는 Series)
+        splitter: split(X)로 (train_idx, val_idx)를 내는 분할기 (예: TimeBlockedSplit)
+        scale: fold별 StandardScaler 적용 여부
+
+    Returns:
+        CachedFolds
+    """
+    y = np.asarray(y)
+    fold_indices = [(train_idx, val_idx) for train_idx, val_idx in splitter.split(X)]
+
+    total = sum(len(train_idx) + len(val_idx) for train_idx, val_idx in fold_indices)
+    X_cached = np.empty((total, X.shape[1]), dtype=dtype)
+    y_cached = np.empty(total, dtype=y.dtype)
+
+    cv = []
+    offset = 0
+    for train_idx, val_idx in fold_indices:
+        X_train, X_val = X[train_idx], X[val_idx]
+        if scale:
+            scaler = StandardScaler().fit(X_train)
+            X_train = scaler.transform(X_train, copy=False)
+            X_val = scaler.transform(X_val, copy=False)
+
+        train_slice = np.arange(offset, offset + len(train_idx))
+        offset += len(train_idx)
+        val_slice = np.arange(offset, offset + len(val_idx))
+        offset += len(val_idx)
+
+        X_cached[train_slice] = X_train
+        X_cached[val_slice] = X_val
+        y_cached[train_slice] = y[train_idx]
+        y_cached[val_slice] = y[val_idx]
+        cv.append((train_slice, val_slice))
+
+    return CachedFolds(X=X_cached, y=y_cached, cv=cv, fold_indices=fold_indices)
+
+
+def time_ordered_folds(X: np.ndarray, y, timestamps, n_splits: int = 3,
+                       gap_hours: int = 0, scale: bool = True) -> CachedFolds:
+    """TimeBlockedSplit + build_cached_folds"""
+    return build_cached_folds(X, y, TimeBlockedSplit(timestamps, n_splits=n_splits, gap_hours=gap_hours),
+                              scale=scale)
+
+
+__all__ = ["TimeBlockedSplit", "CachedFolds", "build_cached_folds", "time_ordered_folds"]
@@ -0,0 +1,113 @@
+"""학습된 모델의 split별 평가 지표 계산 정책
+
+- train 지표는 기본적으로 전체 train 세트로 계산하며, 끌 수도 있다
+- train_sample_size를 주면 train 세트 일부만 표본 추출해 추정한다 (RF/CatBoost는 전체 train
+  예측이 학습만큼 오래 걸림). 추정치는 정확한 지표와 섞이지 않도록 train_rmse_est/train_mae_est
+  키로 기록하고 표본 크기(train_sample_size)를 함께 남긴다
+- predict는 split별로 호출해 미리 할당한 예측 버퍼 한 개에 채운다. X는 합치지 않으므로
+  병렬 학습(loky memmap) 입력도 워커별 사본 없이 그대로 읽는다
+- batched=True면 RMSE/MAE를 구간별 합(np.add.reduceat) 한 번으로 계산
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+
+# train 표본 추정을 켤 때 권장 크기 (기본 정책은 전체 train 사용)
+DEFAULT_TRAIN_SAMPLE_SIZE = 20_000
+
+
+@dataclass
+class EvaluationPolicy:
+    """평가 정책
+
+    Attributes:
+        train_metrics: train 지표 계산 여부
+        train_sample_size: train 지표 추정에 쓸 최대 행 수 (기본 None/0이면 전체 train 사용)
+        batched: 모든 split 지표를 한 번의 구간별 합으로 계산 (False면 split별 계산)
+        random_state: train 표본 추출 시드
+    """
+
+    train_metrics: bool = True
+    train_sample_size: Optional[int] = None
+    batched: bool = True
+    random_state: int = 42
+
+    @classmethod
+    def from_value(cls, value=None) -> "EvaluationPolicy":
+        """None / dict(CLI 인자) / EvaluationPolicy를 정책으로 변환"""
+        if value is None:
+            return cls()
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        raise TypeError(f"EvaluationPolicy로 변환할 수 없는 값: {value!r}")
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def _train_rows(self, n_samples: int) -> Optional[np.ndarray]:
+        """train 표본 행 인덱스 (전체 사용이면 None)"""
+        if not self.train_sample_size or n_samples <= self.train_sample_size:
+            return None
+        rng = np.random.default_rng(self.random_state)
+        return np.sort(rng.choice(n_samples, size=self.train_sample_size, replace=False))
+
+    def evaluate(self, model, splits: Dict[str, tuple]) -> Dict[str, float]:
+        """split별 RMSE/MAE 계산
+
+        Args:
+            model: predict를 가진 학습된 모델
+            splits: split 이름 → (X, y). "train"은 정책에 따라 생략/표본 추출
+
+        Returns:
+            dict: {"<split>_rmse": ..., "<split>_mae": ...} (계산한 split만).
+                train을 표본으로 추정했으면 train_rmse_est/train_mae_est + train_sample_size
+        """
+        prepared = []
+        result = {}
+        for name, (X, y) in splits.items():
+            y = np.asarray(y)
+            if name == "train":
+                if not self.train_metrics:
+                    continue
+                rows = self._train_rows(len(y))
+                if rows is not None:
+                    X, y = X[rows], y[rows]
+                    result["train_sample_size"] = len(rows)
+            if len(y):
+                prepared.append((name, X, y))
+
+        if not prepared:
+            return {}
+
+        names = [name for name, _, _ in prepared]
+        y_all = np.concatenate([y for _, _, y in prepared]).astype(np.float64, copy=False)
+        lengths = np.array([len(y) for _, _, y in prepared])
+
+        # split별 predict → 하나의 예측 버퍼 (X 행렬은 복사하지 않음)
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        pred_all = np.empty(len(y_all), dtype=np.float64)
+        for (_, X, _), start, end in zip(prepared, starts, ends):
+            pred_all[start:end] = np.asarray(model.predict(X), dtype=np.float64).ravel()
+
+        errors = pred_all - y_all
+        if self.batched:
+            squared_sums = np.add.reduceat(errors ** 2, starts)
+            absolute_sums = np.add.reduceat(np.abs(errors), starts)
+        else:
+            squared_sums = [np.sum(errors[start:end] ** 2) for start, end in zip(starts, ends)]
+            absolute_sums = [np.sum(np.abs(errors[start:end])) for start, end in zip(starts, ends)]
+
+        for name, squared_sum, absolute_sum, length in zip(names, squared_sums, absolute_sums, lengths):
+            suffix = "_est" if name == "train" and "train_sample_size" in result else ""
+            result[f"{name}_rmse{suffix}"] = float(np.sqrt(squared_sum / length))
+            result[f"{name}_mae{suffix}"] = float(absolute_sum / length)
+        return result
+
+
+__all__ = ["EvaluationPolicy", "DEFAULT_TRAIN_SAMPLE_SIZE"]
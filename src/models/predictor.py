@@ -0,0 +1,136 @@
+"""챔피언 모델 번들 로드 및 원시 관측값 스코어링
+
+배치 추론(batch.jobs.load_model)과 API 온라인 스코어링이 같은 로더/전처리를 사용한다.
+
+S3 레이아웃:
+    models/{experiment}/model_artifact/model.pkl, scaler.pkl
+    models/{experiment}/config/train_config.json, feature_columns.json
+"""
+
+import json
+import os
+import pickle
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.features.feature_builder import create_scoring_features
+from src.features.preprocess import preprocess_for_prediction
+from src.utils.logger_config import configure_logger
+from src.utils.s3_factory import get_env_s3_client
+
+
+_logger = configure_logger("predictor")
+
+
+def _model_prefix(experiment_name: str) -> str:
+    return f"models/{experiment_name}"
+
+
+@dataclass
+class ModelBundle:
+    """학습된 모델 + 스케일러 + 학습 설정 + 피처 컬럼 순서
+
+    fill_values는 추론 시 결측치 대체값(학습 세트 피처 평균)이다. 주지 않으면 train 구간에
+    fit된 스케일러의 mean_에서 만든다.
+    """
+
+    model: Any
+    scaler: Any
+    config: Dict[str, Any]
+    feature_columns: List[str]
+    experiment_name: str = "unknown"
+    etag: Optional[str] = None
+    loaded_at: datetime = field(default_factory=datetime.now)
+    fill_values: Optional[Dict[str, float]] = None
+
+    def __post_init__(self):
+        if self.fill_values is None:
+            means = getattr(self.scaler, "mean_", None)
+            if means is not None and len(means) == len(self.feature_columns):
+                self.fill_values = dict(zip(self.feature_columns, np.asarray(means, dtype=float).tolist()))
+
+    def __iter__(self):
+        # 기존 (model, scaler, config, feature_columns) 튜플 언패킹 호환
+        return iter((self.model, self.scaler, self.config, self.feature_columns))
+
+    @property
+    def model_name(self) -> str:
+        return self.config.get("model_name", "unknown")
+
+    def predict_features(self, features: pd.DataFrame) -> np.ndarray:
+        """피처 DataFrame → 전처리 + 스케일링 + predict 한 번"""
+        X = preprocess_for_prediction(features, self.feature_columns, self.fill_values)
+        return np.asarray(self.model.predict(self.scaler.transform(X)), dtype=np.float64)
+
+    def predict_observations(self, observations: pd.DataFrame) -> np.ndarray:
+        """원시 관측값(station_id, datetime, 기상/pm10 컬럼) → 쾌적지수 (입력 행 순서 유지)"""
+        if observations.empty:
+            return np.empty(0)
+        return self.predict_features(create_scoring_features(observations))
+
+
+def model_etag(experiment_name: Optional[str] = None, bucket: Optional[str] = None, s3_client=None) -> str:
+    """모델 파일 ETag (변경 여부 확인용, 본문은 받지 않음)"""
+    experiment_name = experiment_name or os.getenv("CHAMPION_MODEL", "default_experiment")
+    bucket = bucket or os.getenv("S3_BUCKET")
+    s3_client = s3_client or get_env_s3_client()
+    head = s3_client.head_object(Bucket=bucket, Key=f"{_model_prefix(experiment_name)}/model_artifact/model.pkl")
+    return head["ETag"].strip('"')
+
+
+def load_model_bundle(experiment_name: Optional[str] = None, bucket: Optional[str] = None,
+                      s3_client=None) -> ModelBundle:
+    """S3에서 모델, 스케일러, config, feature_columns 로드"""
+    experiment_name = experiment_name or os.getenv("CHAMPION_MODEL", "default_experiment")
+    bucket = bucket or os.getenv("S3_BUCKET")
+    s3_client = s3_client or get_env_s3_client()
+    prefix = _model_prefix(experiment_name)
+
+    def get(key):
+        return s3_client.get_object(Bucket=bucket, Key=f"{prefix}/{key}")
+
+    model_obj = get("model_artifact/model.pkl")
+    model = pickle.load(BytesIO(model_obj["Body"].read()))
+    scaler = pickle.load(BytesIO(get("model_artifact/scaler.pkl")["Body"].read()))
+    config = json.load(get("config/train_config.json")["Body"])
+    feature_columns = json.load(get("config/feature_columns.json")["Body"])
+
+    bundle = ModelBundle(
+        model=model, scaler=scaler, config=config, feature_columns=feature_columns,
+        experiment_name=experiment_name, etag=model_obj.get("ETag", "").strip('"') or None,
+    )
+    _logger.info(f"모델 로드: {experiment_name} ({bundle.model_name}, etag={bundle.etag})")
+    return bundle
+
+
+class ModelBundleHolder:
+    """서비스 프로세스가 공유하는 현재 모델 번들 (백그라운드 갱신 시 교체)"""
+
+    def __init__(self, experiment_name: Optional[str] = None, bucket: Optional[str] = None):
+        self.experiment_name = experiment_name
+        self.bucket = bucket
+        self._bundle: Optional[ModelBundle] = None
+        self._lock = threading.Lock()
+
+    @property
+    def bundle(self) -> Optional[ModelBundle]:
+        return self._bundle
+
+    def refresh(self, force: bool = False) -> bool:
+        """S3 모델 ETag가 바뀌었을 때만 다시 로드. 교체했으면 True"""
+        with self._lock:
+            current = self._bundle
+            if current is not None and not force and current.etag:
+                if model_etag(self.experiment_name, self.bucket) == current.etag:
+                    return False
+            self._bundle = load_model_bundle(self.experiment_name, self.bucket)
+            return True
+
+
+__all__ = ["ModelBundle", "ModelBundleHolder", "load_model_bundle", "model_etag"]
@@ -7,44 +7,48 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from src.data.s3_pull_processed import get_processed_data
+from src.features.schema import (
+    CATEGORICAL_FEATURES, FLOAT_COLUMNS, MISSING_SENTINELS, MODEL_EXCLUDE_COLUMNS, TARGET_COLUMN,
+    apply_feature_schema, encode_categoricals,
+)
 from src.utils.utils import set_seed
 
-def split_and_scale_data(test_size=0.2, val_size=0.2, random_state=42):
+def load_feature_matrix(df=None):
     """
-    S3에서 데이터 로드 후 train/val/test 분할 및 스케일링
+    처리 데이터셋 → 스케일링 전 피처 행렬 (결측치 처리 + 원핫인코딩)
+
+    피처 스키마(src/features/schema.py) dtype(float32/uint8/category)을 유지한 채
+    처리하며, datetime은 피처에서 제외하고 행별 시각으로 따로 반환합니다.
     
     Args:
-        test_size: 테스트 데이터 비율
-        val_size: 검증 데이터 비율 
-        random_state: 랜덤 시드
+        df: 이미 로드된 처리 데이터셋 (None이면 S3에서 로드)
         
     Returns:
-        tuple: (X_train, X_val, X_test, y_train, y_val, y_test, scaler)
+        tuple: (X float32 배열, y, feature_columns, timestamps)
     """
     print("🔄 S3에서 데이터 로드 중...")
     
-    # 시드 고정
-    set_seed(random_state)
-    
     # S3에서 피처 엔지니어링된 데이터 로드
-    df = get_processed_data()
+    if df is None:
+        df = get_processed_data()
+    else:
+        df = apply_feature_schema(df)
     print(f"데이터 로드 완료: {df.shape}")
     
     # 타겟 변수 설정 (쾌적지수 예측)
-    target_col = "comfort_score"
-    exclude_cols = [target_col, "pm10", "datetime", "station_id"]  # pm10도 제외
+    target_col = TARGET_COLUMN
+    exclude_cols = MODEL_EXCLUDE_COLUMNS  # pm10도 제외
     feature_cols = [col for col in df.columns if col not in exclude_cols]
     
-    # 결측치 처리 (-99, -9를 NaN으로 변환)
-    X = df[feature_cols].copy()
-    X = X.replace([-99, -9], np.nan)
+    # 결측치 처리 (-99, -9를 NaN으로 변환, 측정값 컬럼만 대상)
+    X = df.drop(columns=[col for col in exclude_cols if col in df.columns])
+    # 컬럼 단위로 처리해 프레임 전체 임시 사본을 만들지 않음
+    for col in [col for col in X.columns if col in FLOAT_COLUMNS]:
+        X[col] = X[col].mask(X[col].isin(MISSING_SENTINELS))
     
     # 결측치 비율이 높은 컬럼 제거 (50% 이상)
-    high_missing_cols = []
-    for col in X.columns:
-        missing_ratio = X[col].isnull().sum() / len(X)
-        if missing_ratio > 0.5:  # 50% 이상 결측치면 제거
-            high_missing_cols.append(col)
+    missing_ratio = X.isnull().mean()
+    high_missing_cols = list(missing_ratio[missing_ratio > 0.5].index)  # 50% 이상 결측치면 제거
     
     if high_missing_cols:
         print(f"결측치 많은 컬럼 제거: {high_missing_cols}")
@@ -53,45 +57,170 @@ def split_and_scale_data(test_size=0.2, val_size=0.2, random_state=42):
     
     # 나머지 결측치는 평균값으로 대체 (수치형만)
     numeric_cols = X.select_dtypes(include=[np.number]).columns
-    X[numeric_cols] = X[numeric_cols].fillna(X[numeric_cols].mean())
+    for col in numeric_cols[X[numeric_cols].isnull().any().to_numpy()]:
+        X[col] = X[col].fillna(X[col].mean())
     
-    # 범주형 변수 원핫인코딩
-    categorical_cols = ['season', 'temp_category', 'pm10_grade', 'region']
-    categorical_cols = [col for col in categorical_cols if col in X.columns]
+    # 범주형 변수 원핫인코딩 (추론과 같은 schema.encode_categoricals, 고정 어휘 → uint8)
+    categorical_cols = [col for col in CATEGORICAL_FEATURES if col in X.columns]
     
     if categorical_cols:
         print(f"원핫인코딩 적용: {categorical_cols}")
-        X = pd.get_dummies(X, columns=categorical_cols, drop_first=True)
+        X = encode_categoricals(X)
     
     y = df[target_col].fillna(df[target_col].mean())
+    timestamps = pd.to_datetime(df["datetime"]).to_numpy() if "datetime" in df.columns else None
+    del df  # 원본 프레임은 더 이상 필요 없음 (피크 메모리 감소)
     
     print(f"피처: {len(feature_cols)}개, 샘플: {len(X)}개")
     
+    # 원핫인코딩 후 피처 컬럼 목록 저장
+    feature_columns = list(X.columns)
+    
+    # float32 배열로 한 번만 변환 (분할은 인덱스로 처리)
+    X = X.to_numpy(dtype=np.float32)
+    
+    return X, y, feature_columns, timestamps
+
+
+def random_split_indices(n_samples, test_size=0.2, val_size=0.2, random_state=42):
+    """
+    train/val/test 무작위 분할 인덱스 (split_and_scale_data와 동일한 분할)
+    
+    Returns:
+        tuple: (train_idx, val_idx, test_idx)
+    """
+    indices = np.arange(n_samples)
+    
     # Train/Test 분할
-    X_temp, X_test, y_temp, y_test = train_test_split(
-        X, y, test_size=test_size, random_state=random_state
-    )
+    temp_idx, test_idx = train_test_split(indices, test_size=test_size, random_state=random_state)
     
     # Train/Val 분할
     val_ratio = val_size / (1 - test_size)
-    X_train, X_val, y_train, y_val = train_test_split(
-        X_temp, y_temp, test_size=val_ratio, random_state=random_state
-    )
+    train_idx, val_idx = train_test_split(temp_idx, test_size=val_ratio, random_state=random_state)
+    
+    return train_idx, val_idx, test_idx
+
+
+def time_split_ranges(timestamps, test_size=0.2, val_size=0.2):
+    """
+    시간순 train/val/test 분할 범위
+
+    datetime 기준으로 한 번만 정렬하고, 정렬된 순서에서 앞쪽부터 train → val → test
+    연속 구간을 나눈다. 같은 시각의 행이 두 구간에 걸치지 않도록 경계를 시각 단위로 맞춘다.
+    
+    Returns:
+        tuple: (order, train_range, val_range, test_range)
+            order: 정렬 순서 인덱스 (이미 정렬되어 있으면 None)
+            *_range: 정렬된 배열 기준 slice
+    
+    Raises:
+        ValueError: datetime이 없거나, 분할 결과 train/val/test 중 빈 구간이 생김
+            (행 수가 적거나 고유 시각이 적어 경계가 한 시각에 몰리는 경우)
+    """
+    if timestamps is None:
+        raise ValueError("시간순 분할에는 datetime 컬럼이 필요합니다.")
+    
+    timestamps = np.asarray(timestamps)
+    n_samples = len(timestamps)
+    if n_samples == 0:
+        raise ValueError("시간순 분할할 행이 없습니다 (0행).")
+    
+    order = None
+    if n_samples and np.any(timestamps[1:] < timestamps[:-1]):
+        order = np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[order]
+    
+    def boundary(fraction):
+        position = min(int(round(n_samples * fraction)), n_samples - 1)
+        return int(np.searchsorted(timestamps, timestamps[position], side="left"))
+    
+    val_start = boundary(1 - test_size - val_size)
+    test_start = boundary(1 - test_size)
+    
+    counts = {"train": val_start, "val": test_start - val_start, "test": n_samples - test_start}
+    if not all(counts.values()):
+        raise ValueError(
+            f"시간순 분할에 빈 구간이 있습니다: train {counts['train']}행, val {counts['val']}행, "
+            f"test {counts['test']}행 (전체 {n_samples}행, 고유 시각 {len(np.unique(timestamps))}개)"
+        )
+    
+    return order, slice(0, val_start), slice(val_start, test_start), slice(test_start, n_samples)
+
+
+def split_and_scale_data(test_size=0.2, val_size=0.2, random_state=42, df=None,
+                         split_strategy="random", return_indices=False):
+    """
+    S3에서 데이터 로드 후 train/val/test 분할 및 스케일링
+
+    피처 스키마(src/features/schema.py) dtype(float32/uint8/category)을 유지한 채
+    원핫인코딩/스케일링까지 진행하므로 반환 배열은 float32입니다.
+    
+    Args:
+        test_size: 테스트 데이터 비율
+        val_size: 검증 데이터 비율 
+        random_state: 랜덤 시드
+        df: 이미 로드된 처리 데이터셋 (None이면 S3에서 로드)
+        split_strategy: "random"(무작위 분할) 또는 "time"(datetime 순 과거→미래 분할)
+        return_indices: True면 분할 인덱스 dict를 마지막 원소로 함께 반환
+            random: {"train"/"val"/"test": 원본 행 인덱스 배열}
+            time: {"order": 정렬 순서(이미 정렬이면 None), "train"/"val"/"test": 정렬 기준 slice}
+        
+    Returns:
+        tuple: (X_train, X_val, X_test, y_train, y_val, y_test, scaler, feature_columns[, indices])
+    """
+    # 시드 고정
+    set_seed(random_state)
+    
+    X, y, feature_columns, timestamps = load_feature_matrix(df)
+    
+    if split_strategy == "time":
+        return _time_split_and_scale(X, y, feature_columns, timestamps,
+                                     test_size, val_size, return_indices)
+    if split_strategy != "random":
+        raise ValueError(f"Unknown split_strategy: {split_strategy}")
+    
+    train_idx, val_idx, test_idx = random_split_indices(len(X), test_size, val_size, random_state)
+    X_train, X_val, X_test = X[train_idx], X[val_idx], X[test_idx]
+    y_train, y_val, y_test = y.iloc[train_idx], y.iloc[val_idx], y.iloc[test_idx]
+    del X
     
     print(f"Train: {X_train.shape}, Val: {X_val.shape}, Test: {X_test.shape}")
     
-    # 스케일링
+    # 스케일링 (float32 유지, 분할된 배열을 제자리에서 스케일링)
     scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_val_scaled = scaler.transform(X_val)
-    X_test_scaled = scaler.transform(X_test)
+    X_train_scaled = scaler.fit(X_train).transform(X_train, copy=False)
+    X_val_scaled = scaler.transform(X_val, copy=False)
+    X_test_scaled = scaler.transform(X_test, copy=False)
     
     print("✅ 데이터 분할 및 스케일링 완료")
     
-    # 원핫인코딩 후 피처 컬럼 목록 저장
-    feature_columns = list(X.columns)
+    result = (X_train_scaled, X_val_scaled, X_test_scaled, y_train, y_val, y_test, scaler, feature_columns)
+    if return_indices:
+        return result + ({"train": train_idx, "val": val_idx, "test": test_idx},)
+    return result
+
+
+def _time_split_and_scale(X, y, feature_columns, timestamps, test_size, val_size, return_indices):
+    """시간순 분할: 한 번 정렬 후 연속 구간 view로 나누고, 스케일러는 train 구간에만 fit"""
+    order, train_range, val_range, test_range = time_split_ranges(timestamps, test_size, val_size)
+    if order is not None:
+        X = X[order]
+        y = y.iloc[order]
+    
+    # 스케일링: train 구간으로 fit 후 전체 배열을 제자리 변환 → 각 구간은 같은 버퍼의 view
+    scaler = StandardScaler().fit(X[train_range])
+    X = scaler.transform(X, copy=False)
+    
+    X_train, X_val, X_test = X[train_range], X[val_range], X[test_range]
+    y_train, y_val, y_test = y.iloc[train_range], y.iloc[val_range], y.iloc[test_range]
+    
+    print(f"Train: {X_train.shape}, Val: {X_val.shape}, Test: {X_test.shape} (시간순 분할)")
+    print("✅ 데이터 분할 및 스케일링 완료")
     
-    return X_train_scaled, X_val_scaled, X_test_scaled, y_train, y_val, y_test, scaler, feature_columns
+    result = (X_train, X_val, X_test, y_train, y_val, y_test, scaler, feature_columns)
+    if return_indices:
+        return result + ({"order": order, "train": train_range, "val": val_range, "test": test_range},)
+    return result
 
 
 if __name__ == "__main__":
@@ -6,21 +6,79 @@ import pandas as pd
 import numpy as np
 import pickle
 import datetime
-from sklearn.metrics import mean_squared_error, mean_absolute_error
-from sklearn.linear_model import LinearRegression, Ridge, Lasso
-from sklearn.ensemble import RandomForestRegressor
-from lightgbm import LGBMRegressor
-from xgboost import XGBRegressor
-from catboost import CatBoostRegressor
 import fire
 import wandb
+from joblib import Parallel, delayed
 
+from src.models.evaluation import EvaluationPolicy
 from src.models.split import split_and_scale_data
 from src.utils.utils import set_seed, auto_increment_run_suffix, save_model_to_s3
 from src.utils.wandb_utils import get_latest_run_name, get_requirements
-from src.utils.model_utils import get_model
+from src.utils.model_utils import (
+    EARLY_STOPPING_ROUNDS,
+    fit_model,
+    get_best_iteration,
+    get_model,
+    thread_params,
+)
 
 
+def fit_and_evaluate(model_name, X_train, X_val, X_test, y_train, y_val, y_test,
+                     random_state=42, n_threads=None, early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+                     evaluation=None):
+    """단일 모델 학습 및 train/val/test 지표 계산
+
+    부스팅 모델(lgbm/xgb/cat)은 검증 세트 기준 early stopping을 적용한다.
+    train 지표는 평가 정책(EvaluationPolicy)에 따라 전체/생략/표본 추정(train_*_est)으로 계산한다.
+
+    Returns:
+        tuple: (학습된 모델, 지표 dict)
+    """
+    evaluation = EvaluationPolicy.from_value(evaluation)
+
+    # 모델 생성
+    model = get_model(model_name, params=thread_params(model_name, n_threads),
+                      random_state=random_state)
+    
+    # 학습 (부스팅 모델은 X_val 기준 early stopping)
+    model = fit_model(model, model_name, X_train, y_train, X_val, y_val,
+                      early_stopping_rounds=early_stopping_rounds)
+    
+    # 예측 및 평가 지표 계산
+    result = evaluation.evaluate(model, {
+        'train': (X_train, y_train),
+        'val': (X_val, y_val),
+        'test': (X_test, y_test),
+    })
+    return model, result
+
+
+def fit_models_parallel(model_names, X_train, X_val, X_test, y_train, y_val, y_test,
+                        random_state=42, n_workers=None, early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+                        evaluation=None):
+    """여러 모델을 프로세스 풀에서 동시에 학습
+
+    스케일된 배열은 joblib이 임시 memmap 파일로 한 번만 덤프하고 워커는 읽기 전용으로
+    매핑하므로, 워커마다 배열을 pickle로 복사하지 않는다. CPU 코어는 워커 수로 나눠
+    모델별 스레드 수(n_jobs/thread_count)로 지정한다.
+
+    Returns:
+        dict: 모델명 → (학습된 모델, 지표 dict)
+    """
+    cpu_count = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers or cpu_count, len(model_names)))
+    n_threads = max(1, cpu_count // n_workers)
+    print(f"⚡ 병렬 학습: 워커 {n_workers}개 × 스레드 {n_threads}개")
+
+    fitted = Parallel(n_jobs=n_workers, backend='loky', max_nbytes='1M', mmap_mode='r')(
+        delayed(fit_and_evaluate)(
+            model_name, X_train, X_val, X_test, y_train, y_val, y_test,
+            random_state=random_state, n_threads=n_threads,
+            early_stopping_rounds=early_stopping_rounds, evaluation=evaluation,
+        )
+        for model_name in model_names
+    )
+    return dict(zip(model_names, fitted))
 
 
 def train_models(
@@ -28,7 +86,12 @@ def train_models(
     test_size=0.2,
     val_size=0.2,
     random_state=42,
-    wandb_project=None
+    wandb_project=None,
+    parallel=False,
+    n_workers=None,
+    early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+    split_strategy="random",
+    evaluation=None
 ):
     """
     여러 모델 학습 및 평가 후 베스트 모델 S3 저장
@@ -39,9 +102,15 @@ def train_models(
         val_size: 검증 데이터 비율
         random_state: 랜덤 시드
         wandb_project: wandb 프로젝트명
+        parallel: True면 모델들을 프로세스 풀에서 동시에 학습
+        n_workers: 병렬 학습 워커 수 (기본: min(CPU 수, 모델 수))
+        early_stopping_rounds: 부스팅 모델 early stopping patience (0/None이면 미적용)
+        split_strategy: "random" 또는 "time"(datetime 순 과거→미래 분할)
+        evaluation: 평가 정책 (EvaluationPolicy 또는 dict, 예: '{"train_metrics": false}')
     """
     # 시드 고정
     set_seed(random_state)
+    evaluation = EvaluationPolicy.from_value(evaluation)
     
     # wandb 초기화 (최신 실험명 기반)
     entity = os.getenv('WANDB_ENTITY') or 'realtheai-insight-'
@@ -62,59 +131,45 @@ def train_models(
 
     X_train, X_val, X_test, y_train, y_val, y_test, scaler, feature_columns = split_and_scale_data(
 
-        test_size=test_size, val_size=val_size, random_state=random_state
+        test_size=test_size, val_size=val_size, random_state=random_state,
+        split_strategy=split_strategy
     )
     
     # 2. 모델별 학습 및 평가 (models_plan.md 참조)
     results = {}
     models = {}
     
+    if parallel:
+        fitted = fit_models_parallel(
+            model_names, X_train, X_val, X_test, y_train, y_val, y_test,
+            random_state=random_state, n_workers=n_workers,
+            early_stopping_rounds=early_stopping_rounds, evaluation=evaluation
+        )
+    
     for model_name in model_names:
-        print(f"\n📊 {model_name.upper()} 모델 학습 중...")
-        
-        # 모델 생성
-        model = get_model(model_name, random_state=random_state)
-        
-        # 학습
-        model.fit(X_train, y_train)
-        
-        # 예측
-        train_pred = model.predict(X_train)
-        val_pred = model.predict(X_val)
-        test_pred = model.predict(X_test)
-        
-        # 평가 지표 계산
-        train_rmse = np.sqrt(mean_squared_error(y_train, train_pred))
-        val_rmse = np.sqrt(mean_squared_error(y_val, val_pred))
-        test_rmse = np.sqrt(mean_squared_error(y_test, test_pred))
-        
-        train_mae = mean_absolute_error(y_train, train_pred)
-        val_mae = mean_absolute_error(y_val, val_pred)
-        test_mae = mean_absolute_error(y_test, test_pred)
+        if parallel:
+            model, result = fitted[model_name]
+        else:
+            print(f"\n📊 {model_name.upper()} 모델 학습 중...")
+            model, result = fit_and_evaluate(
+                model_name, X_train, X_val, X_test, y_train, y_val, y_test,
+                random_state=random_state, early_stopping_rounds=early_stopping_rounds,
+                evaluation=evaluation
+            )
         
         # 결과 저장
-        result = {
-            'train_rmse': train_rmse,
-            'val_rmse': val_rmse,
-            'test_rmse': test_rmse,
-            'train_mae': train_mae,
-            'val_mae': val_mae,
-            'test_mae': test_mae
-        }
         results[model_name] = result
         models[model_name] = model
         
-        # wandb 로깅
-        wandb.log({
-            f"{model_name}_train_rmse": train_rmse,
-            f"{model_name}_val_rmse": val_rmse,
-            f"{model_name}_test_rmse": test_rmse,
-            f"{model_name}_train_mae": train_mae,
-            f"{model_name}_val_mae": val_mae,
-            f"{model_name}_test_mae": test_mae
-        })
+        # wandb 로깅 (병렬 모드도 부모 프로세스에서 기록)
+        log_dict = {f"{model_name}_{metric}": value for metric, value in result.items()}
+        best_iteration = get_best_iteration(model, model_name)
+        if best_iteration is not None:
+            log_dict[f"{model_name}_best_iteration"] = best_iteration
+            print(f"   best iteration: {best_iteration}")
+        wandb.log(log_dict)
         
-        print(f"✅ {model_name}: Val RMSE={val_rmse:.4f}, Test RMSE={test_rmse:.4f}")
+        print(f"✅ {model_name}: Val RMSE={result['val_rmse']:.4f}, Test RMSE={result['test_rmse']:.4f}")
     
     # 3. 베스트 모델 선택 (Validation RMSE 기준)
     best_model_name = min(results.keys(), key=lambda x: results[x]['val_rmse'])
@@ -140,6 +195,12 @@ def train_models(
     if hasattr(best_model, 'get_params'):
         hyperparameters = best_model.get_params()
     
+    # early stopping 결과 (train_config.json에 함께 저장)
+    best_iteration = get_best_iteration(best_model, best_model_name)
+    if best_iteration is not None:
+        hyperparameters['best_iteration'] = best_iteration
+        hyperparameters['early_stopping_rounds'] = early_stopping_rounds
+    
     model_data = {
         "model": best_model,
         "scaler": scaler,
@@ -156,7 +217,9 @@ def train_models(
             "train_samples": len(y_train),
             "val_samples": len(y_val),
             "test_samples": len(y_test),
-            "features": X_train.shape[1]
+            "features": X_train.shape[1],
+            "split_strategy": split_strategy,
+            "evaluation": evaluation.to_dict()
         },
         "requirements": get_requirements()
     }
@@ -5,17 +5,74 @@ sys.path.append('/app')
 import numpy as np
 import yaml
 import datetime
-from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
-from sklearn.metrics import mean_squared_error, mean_absolute_error
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.base import clone
+from sklearn.model_selection import GridSearchCV, RandomizedSearchCV, HalvingRandomSearchCV, ParameterSampler
+from sklearn.preprocessing import StandardScaler
 import fire
 import wandb
 
-from src.models.split import split_and_scale_data
+from src.models.cv import time_ordered_folds
+from src.models.evaluation import EvaluationPolicy
+from src.models.split import load_feature_matrix, random_split_indices, time_split_ranges
 from src.utils.utils import set_seed, save_model_to_s3, auto_increment_run_suffix
 from src.utils.model_utils import get_model
 from src.utils.wandb_utils import get_latest_run_name, get_requirements
 
 
+# successive halving에서 자원(resource)으로 쓸 파라미터 (트리 수). 없으면 학습 샘플 수
+HALVING_RESOURCES = {
+    'rf': 'n_estimators',
+    'lgbm': 'n_estimators',
+    'xgb': 'n_estimators',
+    'cat': 'iterations',
+}
+
+
+def build_halving_search(model_name, base_model, param_space, n_iter, cv,
+                         random_state, factor=3, refit=True, n_samples=None):
+    """HalvingRandomSearchCV 구성
+
+    트리 모델은 hyperparams.yml의 트리 수 후보 최댓값을 최대 자원으로 두고
+    적은 트리 수로 많은 후보를 평가한 뒤 상위 1/factor만 다음 단계로 올린다.
+    선형 모델은 학습 샘플 수를 자원으로 사용한다 (n_samples를 주면 마지막 단계가 전체 샘플).
+
+    단계 수는 n_iter가 아니라 실제 후보 수(탐색 공간 크기로 제한된 ParameterSampler 길이)로 정한다.
+    n_iter가 공간보다 크면 sklearn은 후보가 적어 일찍 멈추므로, n_iter 기준으로 시작 자원을 잡으면
+    마지막 단계가 최대 자원에 못 미친다. 시작 자원은 max // factor**(단계 수 - 1)이므로 마지막 단계
+    자원은 최대 자원보다 최대 factor**(단계 수 - 1) - 1 작을 수 있다 (최종 모델은 tune에서 최댓값으로 학습).
+    """
+    param_space = dict(param_space)
+    resource = HALVING_RESOURCES.get(model_name, 'n_samples')
+    if resource not in param_space:
+        resource = 'n_samples'
+
+    # 마지막 단계가 최대 자원에서 끝나도록 실제 후보 수로 단계 수/시작 자원 결정
+    search_space = {k: v for k, v in param_space.items() if k != resource}
+    n_candidates = len(ParameterSampler(search_space, n_iter=max(n_iter, 1), random_state=random_state))
+    n_rounds = 1 + int(np.floor(np.log(n_candidates) / np.log(factor) + 1e-9))
+
+    halving_kwargs = {}
+    if resource != 'n_samples':
+        max_resources = int(max(param_space.pop(resource)))
+        halving_kwargs = {
+            'max_resources': max_resources,
+            'min_resources': max(10, max_resources // factor ** (n_rounds - 1)),
+        }
+    elif n_samples:
+        halving_kwargs = {
+            'max_resources': int(n_samples),
+            'min_resources': max(100, int(n_samples) // factor ** (n_rounds - 1)),
+        }
+
+    return HalvingRandomSearchCV(
+        base_model, param_space,
+        n_candidates=n_iter, factor=factor, resource=resource, cv=cv,
+        scoring='neg_mean_squared_error', n_jobs=-1, verbose=1,
+        random_state=random_state, refit=refit, **halving_kwargs
+    )
+
+
 def tune_hyperparameters(
     model_name="rf",
     search_type="grid",
@@ -24,22 +81,45 @@ def tune_hyperparameters(
     test_size=0.2,
     val_size=0.2,
     random_state=42,
-    config_path="/app/src/config/hyperparams.yml"
+    config_path="/app/src/config/hyperparams.yml",
+    cv_strategy="kfold",
+    split_strategy="random",
+    evaluation=None
 ):
     """
     하이퍼파라미터 튜닝
     
+    search_type:
+        grid: GridSearchCV (grid 공간)
+        random: RandomizedSearchCV (random 공간, n_iter개)
+        halving: HalvingRandomSearchCV (random 공간, n_iter개 후보로 시작해 단계마다 1/3만 남김)
+    cv_strategy:
+        kfold: 기존 무작위 KFold (기본)
+        time: datetime 순서 기반 blocked CV (과거 블록으로 학습 → 다음 블록으로 검증, 선택).
+              fold 인덱스와 fold별 스케일링 행렬을 한 번만 만들어 모든 후보가 재사용한다.
+              이어 붙인 fold 행렬(학습 데이터의 약 2.25배)을 메모리에 두고, 검색 후 최적 모델은
+              전체 학습 데이터로 직접 다시 학습한다
+    split_strategy:
+        random: split_and_scale_data와 같은 무작위 train/val/test 분할
+        time: datetime 순 분할 (가장 최근 구간을 test로 사용)
+    evaluation:
+        평가 정책 (EvaluationPolicy 또는 dict). 기본은 전체 train 지표, train_sample_size를 주면 표본 추정(*_est)
+    
     Example:
         python tune_hyperparameters.py --model_name=rf --search_type=grid
         python tune_hyperparameters.py --model_name=lgbm --search_type=random --n_iter=50
+        python tune_hyperparameters.py --model_name=lgbm --search_type=halving --n_iter=50
+        python tune_hyperparameters.py --model_name=lgbm --search_type=random --cv_strategy=time
     """
     set_seed(random_state)
+    evaluation = EvaluationPolicy.from_value(evaluation)
     
-    # 1. YAML에서 파라미터 로드
+    # 1. YAML에서 파라미터 로드 (halving은 random 공간 사용)
     with open(config_path, 'r') as f:
         all_params = yaml.safe_load(f)
     
-    param_space = all_params[model_name][search_type]
+    space_key = "random" if search_type == "halving" else search_type
+    param_space = all_params[model_name][space_key]
     
     # 2. WandB 초기화
     entity = os.getenv('WANDB_ENTITY', 'realtheai-insight-')
@@ -52,37 +132,59 @@ def tune_hyperparameters(
     wandb.init(entity=entity, project=project, name=exp_name)
     print(f"🚀 [{model_name.upper()}] 튜닝 시작: {exp_name} ({search_type})")
     
-    # 3. 데이터 로드 및 결합
-    (
-        X_train,
-        X_val,
-        X_test,
-        y_train,
-        y_val,
-        y_test,
-        scaler,
-        feature_columns,
-    ) = split_and_scale_data(
-        test_size=test_size,
-        val_size=val_size,
-        random_state=random_state,
-    )
-    X_train_full = np.vstack([X_train, X_val])
-    y_train_full = np.hstack([y_train, y_val])
+    # 3. 데이터 로드 및 결합 (split_and_scale_data와 같은 분할/스케일러)
+    X, y, feature_columns, timestamps = load_feature_matrix()
+    if split_strategy == "time":
+        order, train_range, val_range, test_range = time_split_ranges(timestamps, test_size, val_size)
+        order = np.arange(len(X)) if order is None else order
+        train_idx, val_idx, test_idx = order[train_range], order[val_range], order[test_range]
+    else:
+        train_idx, val_idx, test_idx = random_split_indices(len(X), test_size, val_size, random_state)
+    train_full_idx = np.concatenate([train_idx, val_idx])
+    y = y.to_numpy()
+    
+    scaler = StandardScaler().fit(X[train_idx])
+    X_train_full = scaler.transform(X[train_full_idx])
+    y_train_full = y[train_full_idx]
+    X_test = scaler.transform(X[test_idx])
+    y_test = y[test_idx]
+    
+    # CV 데이터: time이면 fold별 스케일링 행렬을 미리 만들어 캐시
+    if cv_strategy == "time":
+        folds = time_ordered_folds(X[train_full_idx], y_train_full, timestamps[train_full_idx],
+                                   n_splits=cv_folds)
+        X_search, y_search, cv = folds.X, folds.y, folds.cv
+        print(f"⏱️ 시간 순서 CV: {folds.n_splits} folds, 캐시 행렬 {folds.X.shape}")
+    else:
+        X_search, y_search, cv = X_train_full, y_train_full, cv_folds
+    del X
     
-    # 4. 모델 튜닝
+    # 4. 모델 튜닝 (time CV는 이어 붙인 fold 행렬이므로 검색 후 전체 학습 데이터로 직접 refit.
+    #    halving은 최종 모델을 자원 후보 최댓값으로 학습해야 하므로 항상 직접 refit)
     base_model = get_model(model_name, random_state=random_state)
+    refit = cv_strategy != "time" and search_type != "halving"
     
     if search_type == "grid":
-        search = GridSearchCV(base_model, param_space, cv=cv_folds, 
+        search = GridSearchCV(base_model, param_space, cv=cv, refit=refit,
                             scoring='neg_mean_squared_error', n_jobs=-1, verbose=1)
+    elif search_type == "halving":
+        search = build_halving_search(model_name, base_model, param_space, n_iter,
+                                      cv, random_state, refit=refit, n_samples=len(y_search))
     else:
-        search = RandomizedSearchCV(base_model, param_space, n_iter=n_iter, cv=cv_folds,
+        search = RandomizedSearchCV(base_model, param_space, n_iter=n_iter, cv=cv, refit=refit,
                                    scoring='neg_mean_squared_error', n_jobs=-1, 
                                    verbose=1, random_state=random_state)
     
-    search.fit(X_train_full, y_train_full)
-    best_model = search.best_estimator_
+    search.fit(X_search, y_search)
+    best_params = dict(search.best_params_)
+    if search_type == "halving" and search.resource != 'n_samples':
+        # 마지막 단계 자원(정수 나눗셈으로 최댓값보다 작을 수 있음) 대신 후보 최댓값 사용
+        best_params[search.resource] = int(search.max_resources_)
+    if refit:
+        best_model = search.best_estimator_
+    else:
+        best_model = clone(base_model).set_params(**best_params)
+        best_model.fit(X_train_full, y_train_full)
     
     # 🆕 각 하이퍼파라미터 조합의 CV 결과를 WandB에 로깅
     print("\n📊 각 조합의 성능을 WandB에 로깅 중...")
@@ -99,6 +201,9 @@ def tune_hyperparameters(
             "cv_rmse": cv_rmse_iter,
             "cv_std": cv_std_iter,
         }
+        if search_type == "halving":
+            log_dict["halving_iter"] = int(search.cv_results_['iter'][i])
+            log_dict["n_resources"] = int(search.cv_results_['n_resources'][i])
         
         # 각 파라미터를 개별적으로 로깅
         for param_name, param_value in params.items():
@@ -108,28 +213,25 @@ def tune_hyperparameters(
     
     print(f"✅ {len(search.cv_results_['params'])}개 조합 로깅 완료!")
     
-    # 5. 평가
-    train_pred = best_model.predict(X_train_full)
-    test_pred = best_model.predict(X_test)
-    
+    # 5. 평가 (train 지표는 평가 정책에 따라 생략/표본 추정)
     cv_rmse = np.sqrt(-search.best_score_)
-    train_rmse = np.sqrt(mean_squared_error(y_train_full, train_pred))
-    test_rmse = np.sqrt(mean_squared_error(y_test, test_pred))
-    train_mae = mean_absolute_error(y_train_full, train_pred)
-    test_mae = mean_absolute_error(y_test, test_pred)
+    metrics = {
+        "cv_rmse": cv_rmse,
+        **evaluation.evaluate(best_model, {
+            "train": (X_train_full, y_train_full),
+            "test": (X_test, y_test),
+        }),
+    }
+    test_rmse = metrics["test_rmse"]
     
     # 6. 결과 출력
-    print(f"\n🏆 최적 파라미터: {search.best_params_}")
+    print(f"\n🏆 최적 파라미터: {best_params}")
     print(f"📊 CV RMSE: {cv_rmse:.4f} | Test RMSE: {test_rmse:.4f}")
     
     # 7. 최종 결과 로깅 (Summary로 기록)
     wandb.run.summary.update({
-        "best_cv_rmse": cv_rmse,
-        "best_train_rmse": train_rmse,
-        "best_test_rmse": test_rmse,
-        "best_train_mae": train_mae,
-        "best_test_mae": test_mae,
-        **{f"best_{k}": v for k, v in search.best_params_.items()}
+        **{f"best_{k}": v for k, v in metrics.items()},
+        **{f"best_{k}": v for k, v in best_params.items()}
     })
     
     # 8. S3 저장
@@ -137,22 +239,23 @@ def tune_hyperparameters(
         "model": best_model,
         "scaler": scaler,
         "model_name": f"{model_name}_tuned",
-        "metrics": {
-            "cv_rmse": cv_rmse,
-            "train_rmse": train_rmse,
-            "test_rmse": test_rmse,
-            "train_mae": train_mae,
-            "test_mae": test_mae,
-        },
+        "metrics": metrics,
         "experiment_name": exp_name,
         "wandb_project": project,
         "timestamp": datetime.datetime.now().strftime("%y%m%d_%H%M%S"),
-        "hyperparameters": search.best_params_,
+        "hyperparameters": best_params,
         "tuning_info": {
             "search_type": search_type,
             "cv_folds": cv_folds,
+            "cv_strategy": cv_strategy,
+            "split_strategy": split_strategy,
             "param_space": param_space,
-            "n_iter": search.n_iter if search_type == "random" else "all_combinations",
+            "n_iter": n_iter if search_type in ("random", "halving") else "all_combinations",
+            **({
+                "resource": search.resource,
+                "n_candidates": [int(n) for n in search.n_candidates_],
+                "n_resources": [int(n) for n in search.n_resources_],
+            } if search_type == "halving" else {}),
         },
         "data_info": {
             "target": "comfort_score",
@@ -160,6 +263,7 @@ def tune_hyperparameters(
             "train_samples": len(y_train_full),
             "test_samples": len(y_test),
             "features": len(feature_columns),
+            "evaluation": evaluation.to_dict(),
         },
         "requirements": get_requirements(),
     }
@@ -174,14 +278,8 @@ def tune_hyperparameters(
         "run_path": run_path,
         "run_id": exp_name,
         "model_name": f"{model_name}_tuned",
-        "metrics": {
-            "cv_rmse": cv_rmse,
-            "train_rmse": train_rmse,
-            "test_rmse": test_rmse,
-            "train_mae": train_mae,
-            "test_mae": test_mae,
-        },
-        "best_params": search.best_params_,
+        "metrics": metrics,
+        "best_params": best_params,
     }
 
 
@@ -0,0 +1,289 @@
+"""일 단위로 파티셔닝된 Parquet 마스터 데이터셋 (S3)"""
+
+import io
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from src.utils.logger_config import configure_logger
+
+
+MASTER_DATASET_PREFIX = "master/weather_pm10"
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+
+def _to_naive_datetime(values: pd.Series) -> pd.Series:
+    """datetime 컬럼 정규화 (tz 정보가 있으면 벽시계 시간만 남김)"""
+    converted = pd.to_datetime(values, errors="coerce")
+    if getattr(converted.dt, "tz", None) is not None:
+        converted = converted.dt.tz_localize(None)
+    return converted
+
+
+class PartitionedParquetStore:
+    """시간 파티션 Parquet 데이터셋 저장소
+
+    레이아웃:
+        {prefix}/dt=YYYY-MM-DD/part-{YYYYmmddTHHMMSSffffff}-{uuid8}.parquet
+
+    - append: 새 행이 속한 파티션마다 작은 파일 하나만 추가 (기존 데이터는 읽지 않음)
+    - read: 날짜 범위에 해당하는 파티션만 읽어 전체/구간 데이터셋 반환
+    - compact: 파일이 여러 개인 파티션을 하나로 병합 (중복 제거 + 정렬)
+    - apply_retention: 보존 기간이 지난 파티션을 통째로 삭제 (행 단위 필터링 없음)
+    """
+
+    def __init__(self, s3_client, prefix: str = MASTER_DATASET_PREFIX,
+                 time_column: str = "datetime",
+                 key_columns: Sequence[str] = ("datetime", "STN")):
+        self.s3_client = s3_client
+        self.prefix = prefix.rstrip("/")
+        self.time_column = time_column
+        self.key_columns = list(key_columns)
+        self._logger = configure_logger(self.__class__.__name__)
+
+    # ------------------------------------------------------------------
+    # 경로 유틸
+    # ------------------------------------------------------------------
+    def partition_prefix(self, partition: date) -> str:
+        return f"{self.prefix}/dt={partition.isoformat()}/"
+
+    @staticmethod
+    def partition_of_key(key: str) -> Optional[date]:
+        """S3 키에서 파티션 날짜 추출 (dt=YYYY-MM-DD)"""
+        for part in key.split("/"):
+            if part.startswith("dt="):
+                try:
+                    return date.fromisoformat(part[3:])
+                except ValueError:
+                    return None
+        return None
+
+    def list_partitions(self) -> Dict[date, List[str]]:
+        """파티션 날짜 → 파일 키 목록 (이름순 = 작성 순서)"""
+        partitions: Dict[date, List[str]] = defaultdict(list)
+        for key in self.s3_client.list_objects(prefix=f"{self.prefix}/"):
+            if not key.endswith(".parquet"):
+                continue
+            partition = self.partition_of_key(key)
+            if partition is not None:
+                partitions[partition].append(key)
+        return {p: sorted(keys) for p, keys in sorted(partitions.items())}
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def _write_file(self, partition: date, df: pd.DataFrame, stamp: Optional[str] = None,
+                    suffix: Optional[str] = None) -> str:
+        stamp = stamp or datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        suffix = suffix or uuid.uuid4().hex[:8]
+        key = f"{self.partition_prefix(partition)}part-{stamp}-{suffix}.parquet"
+
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        self.s3_client.put_object(key, buffer.getvalue(), content_type="application/octet-stream")
+        return key
+
+    def append(self, df: pd.DataFrame) -> List[str]:
+        """새 행을 파티션별 작은 파일로 추가 (비용: O(새 행 수))
+
+        Returns:
+            작성된 S3 키 목록
+        """
+        if df.empty:
+            return []
+
+        df = df.copy()
+        df[self.time_column] = _to_naive_datetime(df[self.time_column])
+        df = df.dropna(subset=[self.time_column])
+
+        written = []
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        for partition, part_df in df.groupby(df[self.time_column].dt.date, sort=True):
+            key = self._write_file(partition, part_df.reset_index(drop=True), stamp=stamp)
+            written.append(key)
+            self._logger.info(f"파티션 append: {key} ({len(part_df)} 레코드)")
+        return written
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    def _read_keys(self, keys: Sequence[str], columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        frames = []
+        for key in keys:
+            content = self.s3_client.get_object(key)
+            frames.append(pd.read_parquet(io.BytesIO(content), columns=list(columns) if columns else None))
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=list(columns) if columns else None)
+        return pd.concat(frames, ignore_index=True)
+
+    def read(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None,
+             columns: Optional[Sequence[str]] = None, deduplicate: bool = False) -> pd.DataFrame:
+        """전체 또는 [start, end) 구간 데이터셋 로드
+
+        날짜 범위 밖의 파티션은 다운로드하지 않습니다.
+        """
+        start_ts = pd.Timestamp(start) if start is not None else None
+        end_ts = pd.Timestamp(end) if end is not None else None
+
+        keys = []
+        for partition, partition_keys in self.list_partitions().items():
+            if start_ts is not None and partition < start_ts.date():
+                continue
+            if end_ts is not None and partition > end_ts.date():
+                continue
+            keys.extend(partition_keys)
+
+        if columns is not None and self.time_column not in columns:
+            columns = [self.time_column, *columns]
+
+        df = self._read_keys(keys, columns=columns)
+        if df.empty:
+            return df
+
+        df[self.time_column] = _to_naive_datetime(df[self.time_column])
+        if start_ts is not None:
+            df = df[df[self.time_column] >= start_ts]
+        if end_ts is not None:
+            df = df[df[self.time_column] < end_ts]
+        if deduplicate:
+            df = self._dedup_and_sort(df)
+        return df.reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+    def _dedup_and_sort(self, df: pd.DataFrame) -> pd.DataFrame:
+        keys = [c for c in self.key_columns if c in df.columns]
+        if keys:
+            df = df.drop_duplicates(subset=keys, keep="last")
+            df = df.sort_values(keys)
+        return df.reset_index(drop=True)
+
+    def compact_partition(self, partition: date, keys: Sequence[str]) -> Dict[str, int]:
+        """한 파티션의 파일들을 하나로 병합 후 기존 파일 삭제"""
+        df = self._read_keys(keys)
+        rows_before = len(df)
+        if not df.empty:
+            df[self.time_column] = _to_naive_datetime(df[self.time_column])
+            df = self._dedup_and_sort(df)
+
+        # 병합 파일은 마지막 입력 파일과 같은 stamp를 사용해 이후 append보다 앞에 정렬되도록 한다
+        last_stamp = keys[-1].rsplit("/", 1)[-1].split("-")[1]
+        compacted_key = self._write_file(partition, df, stamp=last_stamp, suffix="00000000")
+
+        self._delete_keys([key for key in keys if key != compacted_key])
+
+        return {"files_merged": len(keys), "rows_before": rows_before, "rows_after": len(df)}
+
+    def compact(self, min_files: int = 2,
+                partitions: Optional[Dict[date, List[str]]] = None) -> Dict[str, Dict[str, int]]:
+        """파일 수가 min_files 이상인 파티션만 병합
+
+        병합된 파티션은 파일이 하나뿐이므로, 늦게 도착했거나 중복된 쓰기가 있었던
+        파티션만 다시 읽고 정렬하게 된다.
+
+        Returns:
+            파티션(ISO 날짜) → 병합 통계
+        """
+        if partitions is None:
+            partitions = self.list_partitions()
+
+        results = {}
+        for partition, keys in partitions.items():
+            if len(keys) < min_files:
+                continue
+            results[partition.isoformat()] = self.compact_partition(partition, keys)
+            self._logger.info(f"파티션 병합: dt={partition} {results[partition.isoformat()]}")
+        return results
+
+    # ------------------------------------------------------------------
+    # Retention (Rolling Window)
+    # ------------------------------------------------------------------
+    def _delete_keys(self, keys: Sequence[str]) -> None:
+        if not keys:
+            return
+        if hasattr(self.s3_client, "delete_objects"):
+            self.s3_client.delete_objects(list(keys))
+        else:
+            for key in keys:
+                self.s3_client.delete_object(key)
+
+    def drop_partitions_before(self, cutoff: DateLike,
+                               partitions: Optional[Dict[date, List[str]]] = None) -> List[date]:
+        """cutoff 날짜 이전의 파티션 전체 삭제
+
+        cutoff가 속한 날짜의 파티션은 통째로 유지된다 (최대 하루치 추가 보존).
+        """
+        if partitions is None:
+            partitions = self.list_partitions()
+
+        cutoff_date = pd.Timestamp(cutoff).date()
+        expired = [p for p in partitions if p < cutoff_date]
+        self._delete_keys([key for p in expired for key in partitions[p]])
+        return expired
+
+    def apply_retention(self, retention_days: int = 630, now: Optional[datetime] = None,
+                        compact: bool = True, compact_min_files: int = 2) -> Dict[str, object]:
+        """Rolling Window 적용: 만료 파티션 삭제 + 변경된 파티션만 병합
+
+        객체 목록은 한 번만 조회하며, 유지되는 파티션 중 파일 수가 compact_min_files
+        미만인 파티션은 다운로드하지 않는다. 시간별 갱신처럼 매번 같은 파티션에 파일이
+        하나씩 추가되는 경우 compact_min_files를 크게 두면 파일이 충분히 쌓였을 때만 병합한다.
+        """
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=retention_days)
+
+        partitions = self.list_partitions()
+        expired = self.drop_partitions_before(cutoff, partitions=partitions)
+        retained = {p: keys for p, keys in partitions.items() if p not in set(expired)}
+
+        compacted = self.compact(min_files=compact_min_files, partitions=retained) if compact else {}
+
+        result = {
+            "retention_cutoff": cutoff.isoformat(),
+            "partitions_before": len(partitions),
+            "partitions_dropped": len(expired),
+            "files_dropped": sum(len(partitions[p]) for p in expired),
+            "partitions_after": len(retained),
+            "partitions_compacted": len(compacted),
+            "rows_deduplicated": sum(s["rows_before"] - s["rows_after"] for s in compacted.values()),
+            "oldest_partition": min(retained).isoformat() if retained else None,
+            "newest_partition": max(retained).isoformat() if retained else None,
+        }
+        self._logger.info(f"Rolling Window 적용: {result}")
+        return result
+
+
+def main():
+    """기존 마스터 CSV → 파티션 Parquet 데이터셋 1회 마이그레이션"""
+    from src.utils.config import S3Config
+    from src.storage.s3_client import S3StorageClient, WeatherDataS3Handler
+
+    s3_config = S3Config.from_env()
+    s3_client = S3StorageClient(
+        bucket_name=s3_config.bucket_name,
+        aws_access_key_id=s3_config.aws_access_key_id,
+        aws_secret_access_key=s3_config.aws_secret_access_key,
+        region_name=s3_config.region_name,
+        endpoint_url=s3_config.endpoint_url,
+    )
+    weather_handler = WeatherDataS3Handler(s3_client)
+    store = PartitionedParquetStore(s3_client)
+
+    master_df = weather_handler.load_csv_from_s3("weather_pm10_integrated_full.csv")
+    print(f"📂 마스터 CSV 로드: {len(master_df):,} 레코드")
+
+    written = store.append(master_df)
+    print(f"✅ 파티션 {len(written)}개 작성: s3://{s3_client.bucket_name}/{store.prefix}/")
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["PartitionedParquetStore", "MASTER_DATASET_PREFIX"]
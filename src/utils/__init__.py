@@ -12,7 +12,8 @@ from .utils import (
     
 )
 from .model_utils import (
-    get_model
+    get_model,
+    get_model_class,
 )
 
 from .wandb_utils import (
@@ -34,7 +35,8 @@ __all__ = [
     'save_model_to_s3',
     'get_runs',
     'get_latest_run_name',
-    'get_requirements'
-    'get_model'
+    'get_requirements',
+    'get_model',
+    'get_model_class',
         
 ]
\ No newline at end of file
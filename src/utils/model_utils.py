@@ -1,39 +1,96 @@
-from sklearn.linear_model import LinearRegression, Ridge, Lasso
-from sklearn.ensemble import RandomForestRegressor
-from lightgbm import LGBMRegressor
-from xgboost import XGBRegressor
-from catboost import CatBoostRegressor
+"""모델 팩토리와 학습 보조 함수
+
+모델 라이브러리(sklearn ensemble, lightgbm, xgboost, catboost)는 import 비용이 크므로
+모듈 로드 시점이 아니라 get_model에서 해당 모델이 처음 요청될 때 import한다.
+"""
+
+import importlib
+
+# 모델명 → (모듈, 클래스명, 기본 인자)
+MODEL_REGISTRY = {
+    'linear': ('sklearn.linear_model', 'LinearRegression', {}),
+    'ridge': ('sklearn.linear_model', 'Ridge', {}),
+    'lasso': ('sklearn.linear_model', 'Lasso', {}),
+    'rf': ('sklearn.ensemble', 'RandomForestRegressor', {}),
+    'lgbm': ('lightgbm', 'LGBMRegressor', {'verbose': -1}),
+    'xgb': ('xgboost', 'XGBRegressor', {}),
+    # CatBoost는 verbose/logging_level/silent 중 하나만 허용하므로 verbose만 사용한다.
+    'cat': ('catboost', 'CatBoostRegressor',
+            {'verbose': False, 'train_dir': None, 'allow_writing_files': False}),
+}
+
+# random_state를 받지 않는 모델
+_NO_RANDOM_STATE = ('linear',)
+
+
+def get_model_class(name):
+    """모델 클래스 반환 (해당 백엔드 모듈은 이때 처음 import)"""
+    if name not in MODEL_REGISTRY:
+        raise ValueError(f"Unknown model: {name}")
+    module_name, class_name, _ = MODEL_REGISTRY[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 def get_model(name, params=None, random_state=42):
     """모델 팩토리 함수"""
     if params is None:
         params = {}
     
-    if name == 'linear':
-        return LinearRegression(**params)
-    elif name == 'ridge':
-        return Ridge(random_state=random_state,
-                      **params)
-    elif name == 'lasso':
-        return Lasso(random_state=random_state,
-                      **params)
-    elif name == 'rf':
-        return RandomForestRegressor(random_state=random_state,
-                                      **params)
-    elif name == 'lgbm':
-        return LGBMRegressor(random_state=random_state,
-                              verbose=-1,
-                                **params)
+    model_class = get_model_class(name)
+    kwargs = dict(MODEL_REGISTRY[name][2])
+    if name not in _NO_RANDOM_STATE:
+        kwargs['random_state'] = random_state
+    kwargs.update(params)
+    return model_class(**kwargs)
+
+
+def thread_params(name, n_threads):
+    """모델별 CPU 스레드 수 파라미터 (병렬 학습 시 워커별 스레드 분배용)"""
+    if n_threads is None:
+        return {}
+    if name in ('rf', 'lgbm', 'xgb'):
+        return {'n_jobs': n_threads}
+    if name == 'cat':
+        return {'thread_count': n_threads}
+    return {}
+
+
+# eval set 기반 early stopping을 지원하는 부스팅 모델
+BOOSTED_MODELS = ('lgbm', 'xgb', 'cat')
+EARLY_STOPPING_ROUNDS = 50
+
+
+def fit_model(model, name, X_train, y_train, X_val=None, y_val=None,
+              early_stopping_rounds=EARLY_STOPPING_ROUNDS):
+    """모델 학습. 부스팅 모델은 검증 세트가 주어지면 early stopping 적용
+
+    early stopping 후 predict는 best iteration까지만 사용한다.
+    """
+    if X_val is None or y_val is None or not early_stopping_rounds or name not in BOOSTED_MODELS:
+        model.fit(X_train, y_train)
+        return model
+
+    if name == 'lgbm':
+        import lightgbm
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)],
+                  callbacks=[lightgbm.early_stopping(early_stopping_rounds, verbose=False)])
     elif name == 'xgb':
-        return XGBRegressor(random_state=random_state,
-                             **params)
+        model.set_params(early_stopping_rounds=early_stopping_rounds)
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], verbose=False)
     elif name == 'cat':
+        model.fit(X_train, y_train, eval_set=(X_val, y_val),
+                  early_stopping_rounds=early_stopping_rounds, use_best_model=True)
+    return model
+
 
-        # CatBoost는 verbose/logging_level/silent 중 하나만 허용하므로 verbose만 사용한다.
-        return CatBoostRegressor(random_state=random_state,
-                                  verbose=False,
-                                  train_dir=None,
-                                  allow_writing_files=False,
-                                  **params)
+def get_best_iteration(model, name):
+    """early stopping으로 선택된 best iteration (해당 없으면 None)"""
+    if name == 'lgbm':
+        best = getattr(model, 'best_iteration_', None)
+    elif name == 'xgb':
+        best = getattr(model, 'best_iteration', None)
+    elif name == 'cat':
+        best = model.get_best_iteration() if hasattr(model, 'get_best_iteration') else None
     else:
-        raise ValueError(f"Unknown model: {name}")
+        best = None
+    return int(best) if best is not None and best > 0 else None
@@ -18,6 +18,39 @@ def query_prediction_by_datetime(prediction_datetime: datetime, station_id: str
     finally:
         conn.close()
 
+def query_predictions_for_hour(prediction_datetime: datetime, station_ids=None, conn=None):
+    """한 시간대의 전체(또는 지정 관측소) 예측 결과를 쿼리 한 번으로 조회
+
+    uk_prediction (prediction_datetime, station_id) 인덱스를 사용한다.
+
+    Args:
+        prediction_datetime: 조회할 시간 (정시)
+        station_ids: 관측소 ID 목록 (None이면 전체)
+        conn: 재사용할 MySQL 연결 (None이면 새로 연결 후 닫음)
+
+    Returns:
+        list of dict (관측소 ID 순)
+    """
+    sql = "SELECT * FROM weather_predictions WHERE prediction_datetime = %s"
+    params = [prediction_datetime]
+    if station_ids is not None:
+        station_ids = [str(s) for s in station_ids]
+        if not station_ids:
+            return []
+        sql += f" AND station_id IN ({', '.join(['%s'] * len(station_ids))})"
+        params.extend(station_ids)
+    sql += " ORDER BY station_id"
+
+    owns_connection = conn is None
+    conn = conn or get_mysql_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return list(cursor.fetchall())
+    finally:
+        if owns_connection:
+            conn.close()
+
 def get_mysql_connection():
     """MySQL 연결"""
     return pymysql.connect(
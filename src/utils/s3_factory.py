@@ -0,0 +1,80 @@
+"""프로세스 단위로 공유하는 boto3 S3 클라이언트
+
+boto3 클라이언트는 생성 비용(세션/엔드포인트 해석)이 크고 스레드 안전하므로,
+같은 자격 증명/엔드포인트 조합에 대해 프로세스당 하나만 만들어 재사용한다.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+
+# 커넥션 풀/재시도 기본값 (환경변수로 조정 가능)
+DEFAULT_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+DEFAULT_MAX_RETRY_ATTEMPTS = int(os.getenv("S3_MAX_RETRY_ATTEMPTS", "5"))
+
+_clients: Dict[Tuple[Optional[str], ...], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def s3_botocore_config(max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+                       max_retry_attempts: int = DEFAULT_MAX_RETRY_ATTEMPTS) -> Config:
+    """S3용 botocore 설정 (커넥션 풀, standard 재시도, TCP keep-alive)"""
+    return Config(
+        max_pool_connections=max_pool_connections,
+        retries={"max_attempts": max_retry_attempts, "mode": "standard"},
+        tcp_keepalive=True,
+        connect_timeout=10,
+        read_timeout=60,
+    )
+
+
+def get_shared_s3_client(aws_access_key_id: Optional[str] = None,
+                         aws_secret_access_key: Optional[str] = None,
+                         region_name: Optional[str] = None,
+                         endpoint_url: Optional[str] = None):
+    """(자격 증명, 리전, 엔드포인트) 조합별로 한 번만 생성되는 S3 클라이언트 반환"""
+    cache_key = (aws_access_key_id, aws_secret_access_key, region_name, endpoint_url)
+    client = _clients.get(cache_key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            client = boto3.client(
+                "s3",
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=s3_botocore_config(),
+            )
+            _clients[cache_key] = client
+    return client
+
+
+def get_env_s3_client():
+    """환경변수(AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION) 기반 공유 클라이언트"""
+    return get_shared_s3_client(
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        region_name=os.getenv("AWS_REGION"),
+    )
+
+
+def clear_s3_clients() -> None:
+    """공유 클라이언트 캐시 초기화 (자격 증명 교체/테스트용)"""
+    with _clients_lock:
+        _clients.clear()
+
+
+__all__ = [
+    "get_shared_s3_client",
+    "get_env_s3_client",
+    "s3_botocore_config",
+    "clear_s3_clients",
+]
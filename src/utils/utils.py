@@ -1,14 +1,17 @@
 import os
 import random
+import tempfile
 
 import numpy as np
-import boto3
-from io import StringIO
+from boto3.s3.transfer import TransferConfig
+from io import TextIOWrapper
 
 # .env 파일 로드 (S3 환경변수 자동 인식용)
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.utils.s3_factory import get_env_s3_client
+
 def set_seed(seed: int = 42):
     """
     모든 랜덤 시드 고정
@@ -143,37 +146,37 @@ def get_latest_model_version(model_name: str):
 
 
 
-def save_to_s3(df, bucket, key, sep=","):
-    """DataFrame을 CSV로 변환 후 S3에 업로드"""
-    # 1️⃣ DataFrame → CSV 문자열 변환
-    csv_buffer = StringIO()
-    df.to_csv(csv_buffer, index=False, sep=sep, encoding="utf-8")
+def save_to_s3(df, bucket, key, sep=",", part_size_mb=8, max_concurrency=4):
+    """DataFrame을 CSV로 변환 후 S3에 업로드
 
-    # 2️⃣ S3 클라이언트 생성
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-        region_name=os.getenv("AWS_REGION")
-    )
+    CSV 전체 문자열을 메모리에 만들지 않고 임시 파일에 쓴 뒤 멀티파트로 업로드한다.
+    """
+    # 1️⃣ S3 클라이언트 (프로세스 공유)
+    s3_client = get_s3_client()
 
-    # 3️⃣ 업로드 실행
-    s3_client.put_object(
-        Bucket=bucket,
-        Key=key,
-        Body=csv_buffer.getvalue()
+    part_size = part_size_mb * 1024 * 1024
+    transfer_config = TransferConfig(
+        multipart_threshold=part_size,
+        multipart_chunksize=part_size,
+        max_concurrency=max_concurrency,
     )
+
+    with tempfile.TemporaryFile() as spool:
+        # 2️⃣ DataFrame → CSV 임시 파일 (청크 단위)
+        writer = TextIOWrapper(spool, encoding="utf-8", newline="")
+        df.to_csv(writer, index=False, sep=sep, chunksize=100_000)
+        writer.flush()
+        writer.detach()
+        spool.seek(0)
+
+        # 3️⃣ 업로드 실행 (멀티파트)
+        s3_client.upload_fileobj(spool, bucket, key, Config=transfer_config)
     print(f"✅ S3 업로드 완료: s3://{bucket}/{key}")
 
 
 def get_s3_client():
-    """S3 클라이언트 생성 (중복 제거용)"""
-    return boto3.client(
-        "s3",
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-        region_name=os.getenv("AWS_REGION")
-    )
+    """S3 클라이언트 반환 (프로세스당 한 번만 생성되는 공유 클라이언트)"""
+    return get_env_s3_client()
 
 def save_model_to_s3(model_data, bucket, base_path):
     """모델을 체계적인 구조로 S3에 저장"""
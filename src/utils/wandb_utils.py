@@ -1,8 +1,7 @@
-import wandb
-
-
 def get_runs(entity, project):
     """WANDB 프로젝트의 모든 실행 조회"""
+    import wandb  # wandb는 import 비용이 커서 실제 조회 시점에 로드
+
     return wandb.Api().runs(path=f"{entity}/{project}", order="-created_at")
 
 
@@ -0,0 +1,63 @@
+"""
+테스트 공용 대역/데이터 (pytest fixture + 스크립트 실행용 함수)
+
+tests/는 패키지가 아니므로 테스트 모듈끼리 import하지 않고 여기서 공유한다.
+스크립트로 실행할 때는 `from conftest import ...`로 같은 함수를 쓴다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+
+class InMemoryS3Client:
+    """S3StorageClient와 같은 인터페이스의 메모리 저장소 (테스트용)"""
+
+    def __init__(self):
+        self.bucket_name = "test-bucket"
+        self.objects = {}
+
+    def put_object(self, key, body, content_type="application/octet-stream"):
+        self.objects[key] = body
+        return key
+
+    def get_object(self, key):
+        return self.objects[key]
+
+    def list_objects(self, prefix=""):
+        return sorted(k for k in self.objects if k.startswith(prefix))
+
+    def delete_object(self, key):
+        self.objects.pop(key, None)
+
+    def delete_objects(self, keys):
+        for key in keys:
+            self.objects.pop(key, None)
+        return len(keys)
+
+
+def make_master_rows(hours, stations=("108", "112", "201")):
+    """마스터 데이터셋 형식(datetime, STN, 기상/pm10)의 관측 행 (시간 수 기준 고정 시드)"""
+    rng = np.random.default_rng(len(hours))
+    index = pd.MultiIndex.from_product([pd.to_datetime(hours), stations], names=["datetime", "STN"])
+    df = index.to_frame(index=False)
+    df["temperature"] = rng.normal(15, 8, len(df)).round(1)
+    df["humidity"] = rng.uniform(20, 90, len(df)).round(0)
+    df["pm10"] = rng.gamma(2.0, 20.0, len(df)).round(0)
+    return df
+
+
+@pytest.fixture
+def s3_client():
+    return InMemoryS3Client()
+
+
+@pytest.fixture
+def master_rows():
+    return make_master_rows
@@ -0,0 +1,58 @@
+"""
+테스트: Airflow 태스크 간 Parquet 산출물 전달 (로컬 경로)
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, "services"))
+
+from batch.jobs.artifacts import ArtifactStore
+
+
+def test_frame_roundtrip_keeps_dtypes():
+    """DataFrame 참조는 작고, 다시 읽으면 dtype이 유지됨"""
+    store = ArtifactStore(local_dir=tempfile.mkdtemp())
+    df = pd.DataFrame({
+        "datetime": pd.date_range("2025-01-01", periods=3, freq="h"),
+        "station_id": pd.Categorical(["108", "108", "112"]),
+        "comfort_score": pd.Series([50.5, 61.0, 70.25], dtype="float32"),
+    })
+
+    ref = store.write_frame(df, "batch_inference/run_1", "predictions")
+    loaded = store.read_frame(ref)
+
+    print(f"참조: {ref}")
+    assert set(ref) == {"uri", "rows", "schema_hash"} and ref["rows"] == 3
+    pd.testing.assert_frame_equal(loaded, df)
+    assert store.delete_run("batch_inference/run_1") == 1
+
+
+def test_records_roundtrip_restores_none():
+    """data_type별 레코드 목록 전달 (결측값은 None, 빈 목록 유지)"""
+    store = ArtifactStore(local_dir=tempfile.mkdtemp())
+    observed_at = datetime(2025, 1, 1, 9, tzinfo=timezone.utc)
+    records = {
+        "asos": [{"observed_at": observed_at, "station_id": "108", "temperature": 1.5, "rainfall": None}],
+        "pm10": [],
+    }
+
+    refs = store.write_records(records, "weather/run_1", "parsed")
+    loaded = store.read_records(refs)
+
+    assert loaded["pm10"] == []
+    record = loaded["asos"][0]
+    assert record["observed_at"] == observed_at
+    assert record["temperature"] == 1.5 and record["rainfall"] is None
+
+
+if __name__ == "__main__":
+    test_frame_roundtrip_keeps_dtypes()
+    test_records_roundtrip_restores_none()
+    print("✅ 산출물 전달 테스트 통과")
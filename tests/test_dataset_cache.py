@@ -0,0 +1,151 @@
+"""
+테스트: S3 CSV → 로컬 Parquet 스냅샷 캐시, 타입 보존 처리 데이터셋
+"""
+
+import hashlib
+import io
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data.dataset_cache import load_csv_snapshot
+from src.data.processed_dataset import load_processed_dataset, save_processed_dataset
+from src.data.s3_pull_processed import get_processed_data
+
+
+class FakeBoto3S3:
+    """head_object/get_object만 지원하는 boto3 S3 클라이언트 대역 (테스트용)"""
+
+    def __init__(self, body: bytes, etag: str = '"etag-1"'):
+        self.body = body
+        self.etag = etag
+        self.get_calls = 0
+
+    def head_object(self, Bucket, Key):
+        return {"ETag": self.etag}
+
+    def get_object(self, Bucket, Key):
+        self.get_calls += 1
+        return {"Body": io.BytesIO(self.body)}
+
+
+def test_snapshot_reused_until_etag_changes():
+    """같은 ETag면 CSV를 다시 받지 않고, ETag가 바뀌면 스냅샷을 새로 만듦"""
+    csv = pd.DataFrame({
+        "station_id": ["108", "112"],
+        "temperature": [20.5, 18.0],
+        "comfort_score": [70.0, 65.0],
+    }).to_csv(index=False).encode("utf-8")
+    client = FakeBoto3S3(csv)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first = load_csv_snapshot("bucket", "ml_dataset/features.csv", dtypes={"station_id": "str"},
+                                  cache_dir=cache_dir, s3_client=client)
+        second = load_csv_snapshot("bucket", "ml_dataset/features.csv", columns=["temperature"],
+                                   cache_dir=cache_dir, s3_client=client)
+
+        assert client.get_calls == 1
+        assert first["station_id"].tolist() == ["108", "112"]
+        assert list(second.columns) == ["temperature"]
+
+        client.etag = '"etag-2"'
+        load_csv_snapshot("bucket", "ml_dataset/features.csv", cache_dir=cache_dir, s3_client=client)
+
+        assert client.get_calls == 2
+        assert len(os.listdir(cache_dir)) == 1
+
+
+class FakeBoto3Bucket:
+    """put/delete/list/download만 지원하는 boto3 S3 클라이언트 대역 (테스트용)"""
+
+    def __init__(self):
+        self.objects = {}
+        self.downloads = []
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self.objects[Key] = Body
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def download_file(self, Bucket, Key, Filename):
+        self.downloads.append(Key)
+        with open(Filename, "wb") as f:
+            f.write(self.objects[Key])
+
+    def get_paginator(self, name):
+        objects = self.objects
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix):
+                yield {"Contents": [
+                    {"Key": k, "ETag": f'"{hashlib.md5(v).hexdigest()}"'}
+                    for k, v in sorted(objects.items()) if k.startswith(Prefix)
+                ]}
+
+        return Paginator()
+
+
+def test_processed_dataset_typed_and_pruned():
+    """월 파티션으로 저장하고, 구간 로드 시 해당 월만 내려받음"""
+    hours = pd.date_range("2024-01-30", "2024-03-02", freq="12h")
+    df = pd.DataFrame({
+        "datetime": hours.astype(str),
+        "station_id": ["108"] * len(hours),
+        "temperature": [20.0] * len(hours),
+        "season": ["winter"] * len(hours),
+    })
+    client = FakeBoto3Bucket()
+
+    keys = save_processed_dataset(df, "bucket", s3_client=client)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        window = load_processed_dataset("bucket", start="2024-02-10", end="2024-02-20",
+                                        cache_dir=cache_dir, s3_client=client)
+
+    print(f"파티션: {keys}")
+
+    assert [k.split("/", 2)[-1] for k in keys] == [
+        "year=2024/month=01/data.parquet",
+        "year=2024/month=02/data.parquet",
+        "year=2024/month=03/data.parquet",
+    ]
+    assert client.downloads == [keys[1]]
+    assert len(window) == 20
+    assert str(window["season"].dtype) == "category"
+    assert str(window["temperature"].dtype) == "float32"
+    assert str(window["datetime"].dtype).startswith("datetime64")
+
+
+def test_csv_fallback_filters_range_without_datetime_column():
+    """Parquet 데이터셋이 없을 때 CSV 경로: columns에 datetime이 없어도 구간 필터 후 제거"""
+    csv = pd.DataFrame({
+        "datetime": ["2024-02-01 00:00", "2024-02-15 00:00", "2024-03-01 00:00"],
+        "station_id": ["108", "108", "112"],
+        "temperature": [1.0, 2.0, 3.0],
+    }).to_csv(index=False).encode("utf-8")
+    client = FakeBoto3S3(csv)
+    client.get_paginator = lambda name: FakeBoto3Bucket().get_paginator(name)  # 파티션 없음
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        window = get_processed_data(columns=["temperature"], start="2024-02-10", end="2024-03-01",
+                                    cache_dir=cache_dir, s3_client=client)
+        with_datetime = get_processed_data(columns=["datetime", "temperature"], start="2024-02-10",
+                                           cache_dir=cache_dir, s3_client=client)
+
+    assert list(window.columns) == ["temperature"]
+    assert window["temperature"].tolist() == [2.0]
+    assert list(with_datetime.columns) == ["datetime", "temperature"]
+    assert with_datetime["temperature"].tolist() == [2.0, 3.0]
+
+
+if __name__ == "__main__":
+    test_snapshot_reused_until_etag_changes()
+    test_processed_dataset_typed_and_pruned()
+    test_csv_fallback_filters_range_without_datetime_column()
+    print("✅ 데이터셋 캐시/처리 데이터셋 테스트 통과")
@@ -0,0 +1,72 @@
+"""
+테스트: 평가 정책 (train 표본 추정, 배치 지표 계산)
+"""
+
+import os
+import sys
+
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_absolute_error, mean_squared_error
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.models.evaluation import EvaluationPolicy
+
+
+def _fitted_model(n_samples=3000):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n_samples, 4)).astype(np.float32)
+    y = X @ np.array([1.0, -2.0, 0.5, 0.0]) + rng.normal(scale=0.3, size=n_samples)
+    return LinearRegression().fit(X, y), X, y
+
+
+def test_batched_metrics_match_per_split():
+    """split별 predict + 한 번의 구간별 합으로 계산한 지표가 split별 개별 계산과 같음"""
+    model, X, y = _fitted_model()
+    splits = {"train": (X[:2000], y[:2000]), "val": (X[2000:2500], y[2000:2500]),
+              "test": (X[2500:], y[2500:])}
+
+    predicted_rows = []
+
+    class RecordingModel:
+        """predict 입력 크기를 기록 (X를 합치지 않고 split별로 호출하는지 확인)"""
+        def predict(self, X):
+            predicted_rows.append(len(X))
+            return model.predict(X)
+
+    result = EvaluationPolicy().evaluate(RecordingModel(), splits)
+    per_split = EvaluationPolicy(batched=False).evaluate(model, splits)
+
+    assert predicted_rows == [2000, 500, 500]
+    for name, (X_split, y_split) in splits.items():
+        pred = model.predict(X_split)
+        assert np.isclose(result[f"{name}_rmse"], np.sqrt(mean_squared_error(y_split, pred)))
+        assert np.isclose(result[f"{name}_mae"], mean_absolute_error(y_split, pred))
+        assert np.isclose(per_split[f"{name}_rmse"], result[f"{name}_rmse"])
+
+
+def test_train_metrics_sampled_or_skipped():
+    """train 지표는 기본 전체 계산, 표본 추정은 별도 키(_est)로 기록, 또는 생략"""
+    model, X, y = _fitted_model()
+    splits = {"train": (X, y), "test": (X[:100], y[:100])}
+
+    full = EvaluationPolicy().evaluate(model, splits)
+    sampled = EvaluationPolicy(train_sample_size=500).evaluate(model, splits)
+    skipped = EvaluationPolicy.from_value({"train_metrics": False}).evaluate(model, splits)
+
+    assert np.isclose(full["train_rmse"], np.sqrt(mean_squared_error(y, model.predict(X))))
+    assert "train_sample_size" not in full
+
+    print(f"표본 train RMSE: {sampled['train_rmse_est']:.4f}")
+    assert abs(sampled["train_rmse_est"] - 0.3) < 0.05
+    assert sampled["train_sample_size"] == 500
+    assert "train_rmse" not in sampled and "train_mae_est" in sampled
+    assert "train_rmse" not in skipped and "test_rmse" in skipped
+
+
+if __name__ == "__main__":
+    test_batched_metrics_match_per_split()
+    test_train_metrics_sampled_or_skipped()
+    print("✅ 평가 정책 테스트 통과")
@@ -0,0 +1,57 @@
+"""
+테스트: 학습(data_cleaning)과 추론(feature_builder) 경로가 같은 피처 엔진 결과를 만드는지 확인
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data import data_cleaning
+from src.features.engine import FEATURE_NAMES
+from src.features.feature_builder import create_ml_dataset_from_frame
+
+
+def _raw_frame():
+    return pd.DataFrame({
+        "STN": [108, 159, 90, 201, 305],
+        "datetime": ["2025-01-06 08:00", "2025-07-12 14:00", "2025-10-01 19:00",
+                     "2025-04-05 12:00", "2025-12-24 18:00"],
+        "TA": [-3.2, 31.5, 18.0, np.nan, 10.0], "PM10": [25, 160, np.nan, 80, 30.5],
+        "WS": [1.2, 3.4, 2.0, 1.0, 0.5], "HM": [40, 80, 60, 55, 70], "PS": [1020.1, 1005.3, 1012.0, 1010.0, 1018.0],
+        "RN": [0.0, 0.5, 0.0, 0.0, 0.0], "WD": [270, 90, 180, 0, 45], "TD": [-10.0, 24.0, 10.0, 5.0, 2.0],
+        "CA": [0, 8, 5, 3, 1], "VS": [2000, 1500, 1800, 1900, 2000], "SS": [0.5, 0.0, 0.2, 0.4, 0.1],
+    })
+
+
+def test_training_and_inference_features_match():
+    """같은 관측값 → 학습/추론 피처 값과 범주 이름이 동일"""
+    raw = _raw_frame()
+
+    training = data_cleaning.clean_weather_data(raw.copy())
+    training = data_cleaning.add_time_features(training)
+    training = data_cleaning.add_temp_features(training)
+    training = data_cleaning.add_air_quality_features(training)
+    training = data_cleaning.add_region_features(training)
+    training = data_cleaning.add_comfort_score(training)
+
+    inference = create_ml_dataset_from_frame(raw, include_labels=True)
+    training = training.sort_values("datetime", kind="stable")  # 추론 경로는 datetime 순 정렬
+
+    for col in FEATURE_NAMES:
+        left = training[col].reset_index(drop=True)
+        right = inference[col].reset_index(drop=True)
+        pd.testing.assert_series_equal(left, right, check_dtype=False, check_names=False)
+
+    assert training["region"].tolist() == ["central", "southern", "central", "unknown", "eastern"]
+    assert training["pm10_grade"].tolist() == ["good", "moderate", "very_bad", "unknown", "moderate"]
+    assert training["temp_category"].isna().tolist() == [False, True, False, False, False]
+
+
+if __name__ == "__main__":
+    test_training_and_inference_features_match()
+    print("✅ 피처 엔진 일관성 테스트 통과")
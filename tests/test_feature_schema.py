@@ -0,0 +1,76 @@
+"""
+테스트: 피처 dtype 스키마가 처리 데이터셋의 모든 컬럼을 다루는지 확인
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data import data_cleaning
+from src.features.preprocess import preprocess_for_prediction
+from src.features.schema import apply_feature_schema, feature_dtypes
+from src.models.split import load_feature_matrix
+
+
+def test_schema_covers_processed_columns():
+    """data_cleaning 결과의 모든 컬럼이 스키마에 정의되고 object/float64/int64가 남지 않음"""
+    raw_df = pd.DataFrame({
+        "STN": [108, 159, 90],
+        "datetime": ["2025-01-06 08:00", "2025-07-12 14:00", "2025-10-01 19:00"],
+        "TA": [-3.2, 31.5, 18.0], "PM10": [25, 160, -9],
+        "WS": [1.2, 3.4, 2.0], "HM": [40, 80, 60], "PS": [1020.1, 1005.3, 1012.0],
+        "RN": [-9, 0.5, 0.0], "WD": [270, 90, 180], "TD": [-10.0, 24.0, 10.0],
+        "CA": [0, 8, 5], "VS": [2000, 1500, 1800], "SS": [0.5, 0.0, 0.2],
+    })
+    df = data_cleaning.clean_weather_data(raw_df)
+    df = data_cleaning.add_time_features(df)
+    df = data_cleaning.add_temp_features(df)
+    df = data_cleaning.add_air_quality_features(df)
+    df = data_cleaning.add_region_features(df)
+    df = data_cleaning.add_comfort_score(df)
+
+    typed = apply_feature_schema(df)
+    dtypes = typed.dtypes.astype(str).to_dict()
+    print(f"dtype: {dtypes}")
+
+    assert set(df.columns) <= set(feature_dtypes())
+    assert not any(d in ("object", "float64", "int64", "Int64") for d in dtypes.values())
+    assert typed["is_rush_hour"].dtype == np.uint8
+    assert typed["temperature"].dtype == np.float32
+    assert typed["pm10_grade"].tolist() == ["good", "very_bad", "good"]
+
+
+def test_training_and_inference_encode_categories_identically():
+    """학습(load_feature_matrix)과 추론(preprocess_for_prediction)의 원핫 벡터가 같음"""
+    df = pd.DataFrame({
+        "datetime": pd.date_range("2025-01-01", periods=4, freq="h"),
+        "station_id": ["108"] * 4,
+        "temperature": [1.0, 2.0, 15.0, 16.0],
+        "season": ["winter", "winter", "autumn", "autumn"],
+        "region": ["central", "southern", "central", "southern"],
+        "comfort_score": [50.0, 55.0, 70.0, 75.0],
+    })
+    X_train, _, feature_columns, _ = load_feature_matrix(df)
+    X_infer = preprocess_for_prediction(df, feature_columns)
+
+    assert feature_columns == ["temperature", "season_spring", "season_summer", "season_autumn",
+                               "region_southern", "region_eastern", "region_western", "region_unknown"]
+    season_cols = [i for i, c in enumerate(feature_columns) if c.startswith("season_")]
+    assert X_train[:, season_cols].tolist() == [[0, 0, 0], [0, 0, 0], [0, 0, 1], [0, 0, 1]]
+    np.testing.assert_array_equal(X_infer.to_numpy(dtype=np.float32), X_train)
+
+    # 한 행씩 인코딩해도 같은 더미 벡터
+    for i in range(len(df)):
+        row = preprocess_for_prediction(df.iloc[[i]], feature_columns)
+        np.testing.assert_array_equal(row.to_numpy(dtype=np.float32)[0], X_train[i])
+
+
+if __name__ == "__main__":
+    test_schema_covers_processed_columns()
+    test_training_and_inference_encode_categories_identically()
+    print("✅ 피처 스키마 테스트 통과")
@@ -0,0 +1,68 @@
+"""
+테스트: 로컬 피처 스토어 (구간 조회, 포인트 조회, 없는 키만 계산, 정의 버전 분리)
+"""
+
+import hashlib
+import inspect
+import os
+import sys
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.features import engine, feature_builder
+from src.features.feature_store import LocalFeatureStore
+
+
+def test_feature_store_roundtrip(tmp_path, master_rows):
+    """두 번째 요청은 저장된 피처를 재사용하고, 정의 버전이 바뀌면 다시 계산"""
+    store = LocalFeatureStore(root=str(tmp_path), version="v1")
+    rows = master_rows(["2025-10-01 07:00", "2025-10-02 19:00"])
+
+    first = store.get_or_compute(rows, include_labels=True)
+    assert len(first) == 6
+    assert len(store.list_partitions()) == 2
+
+    more = pd.concat([rows, master_rows(["2025-10-02 20:00"])], ignore_index=True)
+    second = store.get_or_compute(more, include_labels=True)
+    assert len(second) == 9
+    assert sum(len(files) for files in store.list_partitions().values()) == 3  # 새 키 파일 1개만 추가
+
+    # 학습용 구간 조회 [start, end)
+    day2 = store.read(start="2025-10-02", end="2025-10-03", columns=["comfort_score"])
+    assert list(day2.columns) == ["station_id", "datetime", "comfort_score"]
+    assert len(day2) == 6
+
+    # 포인트 조회 (tz가 있는 시각도 같은 키)
+    row = store.get("108", pd.Timestamp("2025-10-01 07:00", tz="UTC"))
+    assert row is not None and row["is_rush_hour"] == 1
+    assert row["comfort_score"] == first.loc[
+        (first["station_id"] == "108") & (first["hour"] == 7), "comfort_score"].item()
+    assert store.get("999", "2025-10-01 07:00") is None
+
+    # 정의 버전이 바뀌면 기존 피처를 쓰지 않음
+    new_version = LocalFeatureStore(root=str(tmp_path), version="v2")
+    assert new_version.get("108", "2025-10-01 07:00") is None
+    assert new_version.drop_stale_versions() == ["v1"]
+    assert store.list_versions() == []
+
+
+def test_definition_version_covers_feature_builder():
+    """피처 정의 버전은 엔진과 feature_builder 소스를 모두 반영"""
+    digest = hashlib.sha256()
+    for module in (engine, feature_builder):
+        digest.update(inspect.getsource(module).encode("utf-8"))
+
+    assert engine.definition_hash() == digest.hexdigest()[:12]
+    assert engine.definition_hash() != hashlib.sha256(inspect.getsource(engine).encode("utf-8")).hexdigest()[:12]
+
+
+if __name__ == "__main__":
+    import tempfile
+    from conftest import make_master_rows
+    with tempfile.TemporaryDirectory() as tmp:
+        test_feature_store_roundtrip(tmp, make_master_rows)
+    test_definition_version_covers_feature_builder()
+    print("✅ 피처 스토어 테스트 통과")
@@ -0,0 +1,72 @@
+"""
+테스트: successive halving 탐색이 마지막 단계에서 자원(트리 수) 후보 최댓값까지 올라가는지 확인
+"""
+
+import os
+import sys
+
+import numpy as np
+import yaml
+from sklearn.base import BaseEstimator, RegressorMixin
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.models.tune import build_halving_search
+
+
+class MeanRegressor(BaseEstimator, RegressorMixin):
+    """트리 모델과 같은 파라미터 이름을 받는 빠른 대역 (평균 예측)"""
+
+    def __init__(self, n_estimators=100, max_depth=None, min_samples_split=2,
+                 min_samples_leaf=1, max_features=1.0):
+        self.n_estimators = n_estimators
+        self.max_depth = max_depth
+        self.min_samples_split = min_samples_split
+        self.min_samples_leaf = min_samples_leaf
+        self.max_features = max_features
+
+    def fit(self, X, y):
+        self.mean_ = float(np.mean(y))
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self.mean_)
+
+
+def _fit(param_space, n_iter):
+    rng = np.random.default_rng(0)
+    X, y = rng.normal(size=(90, 3)), rng.normal(size=90)
+    search = build_halving_search("rf", MeanRegressor(), param_space, n_iter, cv=3, random_state=42)
+    search.n_jobs = 1
+    return search.fit(X, y)
+
+
+def test_last_round_reaches_max_resources():
+    """n_iter가 탐색 공간보다 커도 마지막 단계 자원 = 트리 수 후보 최댓값"""
+    space = {"n_estimators": [10, 90], "max_depth": [5, 10], "min_samples_split": [2, 4],
+             "min_samples_leaf": [1, 2]}  # 후보 8개
+
+    search = _fit(space, n_iter=50)
+
+    assert search.n_candidates_[0] == 8
+    assert search.n_resources_[-1] == 90
+
+
+def test_rf_space_from_config_is_not_truncated():
+    """hyperparams.yml rf random 공간 (후보 16개, 최대 400 트리): 마지막 단계가 최댓값 근처"""
+    with open(os.path.join(project_root, "src", "config", "hyperparams.yml")) as f:
+        space = yaml.safe_load(f)["rf"]["random"]
+
+    search = _fit(space, n_iter=50)
+    max_trees = max(space["n_estimators"])
+
+    print(f"단계별 트리 수: {search.n_resources_}")
+    # 정수 나눗셈으로 인한 차이(< factor**(단계 수-1))만 허용 (기존: 126/400)
+    assert max_trees - search.n_resources_[-1] < 3 ** (len(search.n_resources_) - 1)
+
+
+if __name__ == "__main__":
+    test_last_round_reaches_max_resources()
+    test_rf_space_from_config_is_not_truncated()
+    print("✅ halving 탐색 테스트 통과")
@@ -0,0 +1,86 @@
+"""
+테스트: 시간별 피처 테이블 증분 갱신
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.features.feature_builder import create_ml_dataset, create_ml_dataset_from_frame
+from src.features.incremental import append_new_features, feature_store, master_rows_to_raw_data
+
+
+def test_incremental_matches_full_rebuild(s3_client, master_rows):
+    """시간별 증분 추가 결과 = 마스터 전체로 한 번에 계산한 결과 (같은 값 재수집도 동일)"""
+    store = feature_store(s3_client)
+    batches = [master_rows(["2025-10-01 07:00"]), master_rows(["2025-10-01 08:00", "2025-10-02 19:00"])]
+
+    for batch in batches:
+        append_new_features(store, batch)
+    repeated = append_new_features(store, batches[0])
+
+    incremental = store.read(deduplicate=True)
+    full = create_ml_dataset(master_rows_to_raw_data(pd.concat(batches)), include_labels=True)
+    full["datetime"] = full["datetime"].dt.tz_localize(None)
+
+    print(f"증분 {len(incremental)} 행 / 전체 재계산 {len(full)} 행")
+    assert repeated["rows_appended"] == 3 and repeated["keys_overwritten"] == 3
+    assert len(incremental) == len(full) == 9
+    pd.testing.assert_series_equal(
+        incremental.sort_values(["datetime", "station_id"])["comfort_score"].reset_index(drop=True),
+        full.sort_values(["datetime", "station_id"])["comfort_score"].reset_index(drop=True),
+        check_names=False,
+    )
+
+
+def test_reingested_key_overwrites_stale_features(s3_client, master_rows):
+    """같은 시간을 보정된 값으로 다시 수집하면 피처 테이블도 새 값 (마스터와 같이 keep="last")"""
+    store = feature_store(s3_client)
+    first = master_rows(["2025-10-01 07:00"])
+    append_new_features(store, first)
+
+    corrected = first.copy()
+    corrected.loc[0, "pm10"] = 180.0  # 늦게 도착한 PM10 보정값
+    corrected.loc[1, "temperature"] += 10
+    result = append_new_features(store, corrected)
+
+    expected = create_ml_dataset_from_frame(corrected, include_labels=True)
+    expected["datetime"] = expected["datetime"].dt.tz_localize(None)
+    expected = expected.sort_values(["datetime", "station_id"]).reset_index(drop=True)
+
+    assert result["keys_overwritten"] == 3
+    for table in (store.read(deduplicate=True), (store.compact(), store.read())[1]):
+        table = table.sort_values(["datetime", "station_id"]).reset_index(drop=True)
+        assert len(table) == 3
+        assert table["pm10_grade"].tolist() == expected["pm10_grade"].tolist()
+        assert np.allclose(table["temperature"], expected["temperature"])
+        assert np.allclose(table["comfort_score"], expected["comfort_score"])
+
+
+def test_frame_path_matches_record_path(master_rows):
+    """DataFrame 경로(combine_first) = 레코드 목록 경로 (TA→temperature, PM10→pm10 보정 포함)"""
+    master = master_rows(["2025-10-01 07:00", "2025-10-01 18:00"])
+    master["TA"] = master["temperature"] + 1
+    master.loc[::2, "temperature"] = np.nan
+    master = master.rename(columns={"pm10": "PM10"})
+    master.loc[0, ["temperature", "TA", "humidity"]] = np.nan
+
+    from_records = create_ml_dataset(master_rows_to_raw_data(master), include_labels=True)
+    from_frame = create_ml_dataset_from_frame(master, include_labels=True)
+
+    assert list(from_frame.columns) == list(from_records.columns)
+    for col in ["temperature", "humidity", "pm10", "comfort_score"]:
+        assert np.allclose(from_frame[col].astype(float), from_records[col].astype(float), equal_nan=True)
+
+
+if __name__ == "__main__":
+    from conftest import InMemoryS3Client, make_master_rows
+    test_incremental_matches_full_rebuild(InMemoryS3Client(), make_master_rows)
+    test_reingested_key_overwrites_stale_features(InMemoryS3Client(), make_master_rows)
+    test_frame_path_matches_record_path(make_master_rows)
+    print("✅ 피처 증분 갱신 테스트 통과")
@@ -0,0 +1,39 @@
+"""
+테스트: 모델 라이브러리 지연 import
+"""
+
+import os
+import subprocess
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.utils.model_utils import MODEL_REGISTRY, get_model
+
+
+def test_model_backends_not_imported_on_load():
+    """model_utils / split import 시 부스팅 라이브러리와 wandb를 로드하지 않음"""
+    code = (
+        "import sys, src.utils.model_utils, src.models.split; "
+        "print(','.join(m for m in ('lightgbm', 'xgboost', 'catboost', 'wandb') if m in sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                          capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == ""
+
+
+def test_get_model_builds_registered_models():
+    """레지스트리의 모든 모델 생성 및 기본 인자 적용"""
+    for name, (_, class_name, _) in MODEL_REGISTRY.items():
+        model = get_model(name, random_state=7)
+        assert type(model).__name__ == class_name
+
+    assert get_model('lgbm').get_params()['verbose'] == -1
+    assert get_model('rf', params={'n_estimators': 5}).n_estimators == 5
+
+
+if __name__ == "__main__":
+    test_model_backends_not_imported_on_load()
+    test_get_model_builds_registered_models()
+    print("✅ 지연 import 테스트 통과")
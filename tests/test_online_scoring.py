@@ -0,0 +1,207 @@
+"""
+테스트: 원시 관측값 온라인 스코어링 (모델 번들 + 마이크로배칭 + /score)
+"""
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, "services"))
+
+from src.features.feature_builder import create_scoring_features
+from src.features.preprocess import preprocess_for_prediction
+from src.models.batching import BatcherOverloaded, Histogram, MicroBatcher
+from src.models.predictor import ModelBundle
+
+FEATURE_COLUMNS = ["temperature", "humidity", "pm10", "hour", "is_rush_hour", "temp_comfort"]
+ENCODED_FEATURE_COLUMNS = ["temperature", "humidity", "hour", "is_rush_hour",
+                           "season_summer", "season_autumn", "region_southern", "region_eastern"]
+
+
+def _observations(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "station_id": rng.choice(["108", "159", "201"], n),
+        "datetime": pd.Timestamp("2025-10-01") + pd.to_timedelta(rng.integers(0, 48, n), unit="h"),
+        "temperature": rng.normal(15, 8, n).round(1),
+        "humidity": rng.uniform(20, 90, n).round(0),
+        "pm10": rng.gamma(2.0, 20.0, n).round(0),
+    })
+
+
+def _fitted_bundle():
+    features = create_scoring_features(_observations(200))
+    X = features[FEATURE_COLUMNS].astype(float)
+    y = 100 - (X["temperature"] - 20).abs() - X["pm10"] * 0.2
+    scaler = StandardScaler().fit(X)
+    model = LinearRegression().fit(scaler.transform(X), y)
+    return ModelBundle(model=model, scaler=scaler, config={"model_name": "linear"},
+                       feature_columns=FEATURE_COLUMNS, experiment_name="test")
+
+
+def test_bundle_scores_in_input_order():
+    """한 번의 predict 결과 = 행별 predict 결과 (입력 순서 유지)"""
+    bundle = _fitted_bundle()
+    observations = _observations(10, seed=1)
+
+    batched = bundle.predict_observations(observations)
+    one_by_one = np.concatenate([bundle.predict_observations(observations.iloc[[i]]) for i in range(10)])
+    assert np.allclose(batched, one_by_one)
+
+    model, scaler, config, feature_columns = bundle  # 배치 추론 튜플 호환
+    X = preprocess_for_prediction(create_scoring_features(observations), feature_columns)
+    assert np.allclose(batched, model.predict(scaler.transform(X)))
+
+
+def _encoded_bundle():
+    """범주 더미 컬럼을 포함한 피처로 학습한 번들 (결측치 대체값은 학습 평균)"""
+    features = create_scoring_features(_observations(300))
+    X = preprocess_for_prediction(features, ENCODED_FEATURE_COLUMNS)
+    y = X["temperature"] - X["humidity"] * 0.1 + X["region_southern"] * 20 + X["season_autumn"] * 5
+    scaler = StandardScaler().fit(X)
+    model = LinearRegression().fit(scaler.transform(X), y)
+    return ModelBundle(model=model, scaler=scaler, config={"model_name": "linear"},
+                       feature_columns=ENCODED_FEATURE_COLUMNS, experiment_name="test")
+
+
+def test_single_row_prediction_matches_batch():
+    """같은 행은 혼자 예측하든 다른 행들과 함께 예측하든 같은 값 (범주 더미 + 결측치 포함)"""
+    bundle = _encoded_bundle()
+    assert set(bundle.fill_values) == set(ENCODED_FEATURE_COLUMNS)
+
+    observations = _observations(12, seed=3)
+    observations.loc[[0, 4, 5, 6, 7, 8, 9], "humidity"] = np.nan  # 배치 결측 비율 > 50%
+    observations.loc[1, "temperature"] = -99
+
+    batched = bundle.predict_observations(observations)
+    one_by_one = np.concatenate([bundle.predict_observations(observations.iloc[[i]]) for i in range(12)])
+    assert np.allclose(batched, one_by_one)
+
+    # 남부 관측소 한 행도 region_southern 더미가 1
+    southern = create_scoring_features(observations).query("region == 'southern'").head(1)
+    X = preprocess_for_prediction(southern, bundle.feature_columns, bundle.fill_values)
+    assert X["region_southern"].tolist() == [1]
+    # 결측 습도는 학습 평균으로 대체
+    X = preprocess_for_prediction(create_scoring_features(observations.iloc[[0]]),
+                                  bundle.feature_columns, bundle.fill_values)
+    assert np.isclose(X["humidity"].iloc[0], bundle.scaler.mean_[1])
+
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    """동시 요청 20건 → predict 호출 1번, 결과는 요청별로 분배"""
+    calls = []
+
+    def predict(rows):
+        calls.append(len(rows))
+        return rows["value"].to_numpy() * 2
+
+    async def run():
+        batcher = MicroBatcher(predict, max_batch_rows=100, max_wait_ms=50)
+        await batcher.start()
+        requests = [pd.DataFrame({"value": [i, i + 0.5]}) for i in range(20)]
+        results = await asyncio.gather(*(batcher.submit(r) for r in requests))
+        await batcher.stop()
+        return requests, results
+
+    requests, results = asyncio.run(run())
+    assert calls == [40]
+    for request, result in zip(requests, results):
+        assert np.allclose(result, request["value"] * 2)
+
+
+def test_micro_batcher_limits_and_histograms():
+    """max_batch_rows로 배치 분할, max_queue_size 초과는 거절, 지연/배치 크기 히스토그램 기록"""
+    calls = []
+
+    def predict(rows):
+        calls.append(len(rows))
+        return np.zeros(len(rows))
+
+    async def run():
+        batcher = MicroBatcher(predict, max_batch_rows=10, max_wait_ms=20, max_queue_size=8)
+        await batcher.start()
+        requests = [batcher.submit(pd.DataFrame({"value": range(4)})) for _ in range(8)]
+        tasks = [asyncio.ensure_future(r) for r in requests]
+        await asyncio.sleep(0)
+        try:
+            await batcher.submit(pd.DataFrame({"value": [0]}))
+            rejected = False
+        except BatcherOverloaded:
+            rejected = True
+        await asyncio.gather(*tasks)
+        await batcher.stop()
+        return batcher.stats(), rejected
+
+    stats, rejected = asyncio.run(run())
+    assert rejected and stats["rejected"] == 1
+    assert calls == [12, 12, 8]  # 10행을 넘는 순간 배치 마감 (요청 단위로는 나누지 않음)
+    assert stats["requests"] == 8 and stats["batches"] == 3
+    assert stats["request_ms"]["count"] == 8 and stats["queue_wait_ms"]["count"] == 8
+    assert stats["batch_rows"]["buckets"]["16"] == 3
+
+    histogram = Histogram([1, 5, 10])
+    for value in [0.5, 2, 3, 7, 50]:
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"1": 1, "5": 3, "10": 4, "+Inf": 5}
+    assert snapshot["p50"] == 5 and snapshot["p99"] == 10
+
+
+def test_micro_batcher_result_independent_of_batch():
+    """batcher.submit(row) 결과는 혼자 배치되든 다른 요청과 함께 배치되든 같음"""
+    bundle = _encoded_bundle()
+    observations = _observations(16, seed=5)
+    observations.loc[::3, "humidity"] = np.nan
+    row = observations.iloc[[0]]
+
+    async def run():
+        batcher = MicroBatcher(bundle.predict_observations, max_batch_rows=64, max_wait_ms=50)
+        alone = await batcher.submit(row)
+        results = await asyncio.gather(
+            batcher.submit(row),
+            *(batcher.submit(observations.iloc[[i]]) for i in range(1, 16)),
+        )
+        await batcher.stop()
+        return alone, results[0], batcher.stats()
+
+    alone, batched, stats = asyncio.run(run())
+    assert stats["batches"] == 2 and stats["batch_rows"]["count"] == 2
+    assert np.allclose(alone, batched)
+
+
+def test_score_endpoint():
+    """/score: 단건/다건 관측값을 모델로 바로 스코어링"""
+    import api.main as api
+
+    api.model_holder._bundle = _fitted_bundle()
+    single = api.Observation(station_id="159", datetime="2025-10-01T08:00:00+09:00", temperature=20, pm10=10)
+    batch = [single, api.Observation(station_id="108", temperature=35, humidity=90, pm10=150)]
+
+    async def run():
+        try:
+            return await api.score(single), await api.score(batch)
+        finally:
+            await api.score_batcher.stop()
+
+    one, many = asyncio.run(run())
+    assert one["count"] == 1 and one["predictions"][0]["prediction_time"] == "2025-10-01 08:00"
+    assert many["count"] == 2
+    assert many["predictions"][0]["score"] == one["predictions"][0]["score"]
+    assert many["predictions"][0]["score"] > many["predictions"][1]["score"]
+
+
+if __name__ == "__main__":
+    test_bundle_scores_in_input_order()
+    test_single_row_prediction_matches_batch()
+    test_micro_batcher_coalesces_concurrent_requests()
+    test_micro_batcher_limits_and_histograms()
+    test_micro_batcher_result_independent_of_batch()
+    test_score_endpoint()
+    print("✅ 온라인 스코어링 테스트 통과")
@@ -0,0 +1,130 @@
+"""
+테스트: 파티션 Parquet 마스터 데이터셋 (append → read → compact)
+"""
+
+import sys
+import os
+from datetime import date, datetime
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.storage.partitioned_store import PartitionedParquetStore
+
+
+def _hourly_rows(hour: str, stations=("108", "112"), temperature=20.0):
+    return pd.DataFrame({
+        "datetime": [hour] * len(stations),
+        "STN": list(stations),
+        "temperature": [temperature] * len(stations),
+    })
+
+
+def test_append_writes_only_new_rows(s3_client):
+    """append는 새 행만 파티션 파일로 작성"""
+    client = s3_client
+    store = PartitionedParquetStore(client)
+
+    store.append(_hourly_rows("2025-10-01 13:00"))
+    store.append(_hourly_rows("2025-10-01 14:00"))
+    keys = store.append(_hourly_rows("2025-10-02 00:00"))
+
+    partitions = store.list_partitions()
+    print(f"파티션: { {p.isoformat(): len(k) for p, k in partitions.items()} }")
+
+    assert len(keys) == 1
+    assert keys[0].startswith("master/weather_pm10/dt=2025-10-02/")
+    assert [len(k) for k in partitions.values()] == [2, 1]
+
+
+def test_read_full_and_window(s3_client):
+    """전체 및 구간 읽기"""
+    client = s3_client
+    store = PartitionedParquetStore(client)
+    for hour in ["2025-10-01 13:00", "2025-10-02 13:00", "2025-10-03 13:00"]:
+        store.append(_hourly_rows(hour))
+
+    full_df = store.read()
+    window_df = store.read(start="2025-10-02", end="2025-10-03")
+
+    assert len(full_df) == 6
+    assert len(window_df) == 2
+    assert window_df["datetime"].dt.date.astype(str).unique().tolist() == ["2025-10-02"]
+
+
+def test_compact_merges_and_deduplicates(s3_client):
+    """compact는 파티션 파일을 하나로 병합하고 최신 값을 유지"""
+    client = s3_client
+    store = PartitionedParquetStore(client)
+
+    store.append(_hourly_rows("2025-10-01 13:00", temperature=20.0))
+    store._write_file(pd.Timestamp("2025-10-01").date(),
+                      _hourly_rows("2025-10-01 13:00", temperature=25.0),
+                      stamp="99991231T235959")
+    store.append(_hourly_rows("2025-10-02 13:00"))
+
+    results = store.compact()
+    partitions = store.list_partitions()
+    compacted_df = store.read(start="2025-10-01", end="2025-10-02")
+
+    print(f"병합 결과: {results}")
+
+    assert list(results) == ["2025-10-01"]
+    assert results["2025-10-01"]["rows_before"] == 4
+    assert results["2025-10-01"]["rows_after"] == 2
+    assert all(len(keys) == 1 for keys in partitions.values())
+    assert compacted_df["temperature"].tolist() == [25.0, 25.0]
+
+
+def test_retention_drops_whole_partitions(s3_client):
+    """Rolling Window는 만료 파티션을 통째로 삭제하고 변경된 파티션만 병합"""
+    client = s3_client
+    store = PartitionedParquetStore(client)
+
+    for hour in ["2025-01-01 10:00", "2025-01-02 10:00", "2025-10-01 10:00"]:
+        store.append(_hourly_rows(hour))
+    store.append(_hourly_rows("2025-10-01 10:00", temperature=30.0))  # 늦게 도착한 중복 쓰기
+
+    read_keys = []
+    original_get = client.get_object
+    client.get_object = lambda key: read_keys.append(key) or original_get(key)
+
+    result = store.apply_retention(retention_days=30, now=datetime(2025, 10, 10))
+    print(f"Rolling Window 결과: {result}")
+
+    assert result["partitions_dropped"] == 2
+    assert result["partitions_compacted"] == 1
+    assert result["rows_deduplicated"] == 2
+    assert [p.isoformat() for p in store.list_partitions()] == ["2025-10-01"]
+    # 만료된 파티션은 다운로드하지 않음
+    assert all("dt=2025-10-01" in key for key in read_keys)
+
+
+def test_retention_compacts_only_past_file_threshold(s3_client):
+    """compact_min_files 미만 파티션은 시간별 갱신에서 다시 읽거나 쓰지 않음"""
+    client = s3_client
+    store = PartitionedParquetStore(client)
+    for hour in ["2025-10-01 10:00", "2025-10-01 11:00"]:
+        store.append(_hourly_rows(hour))
+
+    now = datetime(2025, 10, 2)
+    result = store.apply_retention(retention_days=30, now=now, compact_min_files=3)
+    assert result["partitions_compacted"] == 0
+    assert len(store.list_partitions()[date(2025, 10, 1)]) == 2
+
+    store.append(_hourly_rows("2025-10-01 12:00"))
+    result = store.apply_retention(retention_days=30, now=now, compact_min_files=3)
+    assert result["partitions_compacted"] == 1
+    assert len(store.list_partitions()[date(2025, 10, 1)]) == 1
+
+
+if __name__ == "__main__":
+    from conftest import InMemoryS3Client
+    test_append_writes_only_new_rows(InMemoryS3Client())
+    test_read_full_and_window(InMemoryS3Client())
+    test_compact_merges_and_deduplicates(InMemoryS3Client())
+    test_retention_drops_whole_partitions(InMemoryS3Client())
+    test_retention_compacts_only_past_file_threshold(InMemoryS3Client())
+    print("✅ 파티션 데이터셋 테스트 통과")
@@ -0,0 +1,108 @@
+"""
+테스트: 다중 관측소/권역/전국 예측 API가 시간당 스냅샷 한 번만 조회하는지 확인
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, "services"))
+
+import api.main as api
+from api.snapshot import PredictionSnapshotCache
+
+HOUR = datetime(2025, 10, 1, 8)
+
+
+def _rows(prediction_datetime):
+    stations = {"108": "central", "112": "central", "201": "southern", "301": "eastern"}
+    return [
+        {"station_id": station, "region": region, "comfort_score": 50.0 + i * 10, "temperature": 18.0,
+         "pm10": 30.0, "prediction_datetime": prediction_datetime}
+        for i, (station, region) in enumerate(stations.items())
+    ]
+
+
+def test_endpoints_share_one_query_per_hour():
+    """관측소 목록/권역/전국 요청이 같은 시간이면 DB 조회 1번"""
+    queried = []
+
+    def loader(prediction_datetime):
+        queried.append(prediction_datetime)
+        return _rows(prediction_datetime)
+
+    api.prediction_snapshots = PredictionSnapshotCache(loader, ttl_seconds=60)
+
+    stations = api.get_station_predictions(ids="108, 301,999", prediction_time=HOUR)
+    assert [p["station_id"] for p in stations["predictions"]] == ["108", "301"]
+    assert stations["missing"] == ["999"]
+
+    region = api.get_region_predictions("central", prediction_time=HOUR.replace(minute=30))
+    assert [p["station_id"] for p in region["predictions"]] == ["108", "112"]
+
+    nationwide = api.get_map_predictions(prediction_time=HOUR)
+    assert nationwide["count"] == 4
+    assert nationwide["regions"] == {"central": 2, "southern": 1, "eastern": 1}
+    assert nationwide["predictions"][2]["label"] == "good"
+
+    assert queried == [HOUR]
+    assert api.prediction_snapshots.stats == {"hits": 2, "loads": 1}
+
+
+def test_empty_hour_is_reloaded_sooner():
+    """예측이 없는 시간은 empty_ttl_seconds가 지나면 다시 조회"""
+    responses = [[], _rows(HOUR)]
+    cache = PredictionSnapshotCache(lambda dt: responses.pop(0), ttl_seconds=60, empty_ttl_seconds=0)
+
+    assert cache.get(HOUR).by_station == {}
+    assert len(cache.get(HOUR).by_station) == 4
+    assert cache.stats["loads"] == 2
+
+
+def test_slow_loads_do_not_block_other_hours():
+    """느린 조회는 전역 락 밖에서: 다른 시간 조회는 동시에 진행, 같은 시간 동시 미스는 조회 1번"""
+    other_hour = HOUR + timedelta(hours=1)
+    both_loading = threading.Barrier(2, timeout=2)  # 두 시간 조회가 동시에 진행 중이어야 통과
+    queried = []
+
+    def loader(prediction_datetime):
+        queried.append(prediction_datetime)
+        both_loading.wait()
+        time.sleep(0.1)
+        return _rows(prediction_datetime)
+
+    cache = PredictionSnapshotCache(loader, ttl_seconds=60)
+    results, errors = [], []
+
+    def request(hour):
+        try:
+            results.append(cache.get(hour))
+        except Exception as e:  # BrokenBarrierError: 조회가 직렬화됨
+            errors.append(e)
+
+    threads = [threading.Thread(target=request, args=(hour,)) for hour in [HOUR, other_hour] * 3]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert sorted(queried) == [HOUR, other_hour]
+    assert cache.stats == {"hits": 4, "loads": 2}
+    assert {snapshot.prediction_datetime for snapshot in results} == {HOUR, other_hour}
+
+    # 캐시 적중은 조회 없이 바로 반환
+    started = time.perf_counter()
+    assert len(cache.get(HOUR).by_station) == 4
+    assert time.perf_counter() - started < 0.05
+
+
+if __name__ == "__main__":
+    test_endpoints_share_one_query_per_hour()
+    test_empty_hour_is_reloaded_sooner()
+    test_slow_loads_do_not_block_other_hours()
+    print("✅ 예측 스냅샷 테스트 통과")
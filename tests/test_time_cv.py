@@ -0,0 +1,99 @@
+"""
+테스트: 시간 순서 blocked CV와 fold 행렬 캐시
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.models.cv import TimeBlockedSplit, time_ordered_folds
+from src.models.split import time_split_ranges
+
+
+def _hourly_timestamps(hours=40, stations=3):
+    times = pd.date_range("2025-01-01", periods=hours, freq="h")
+    return np.repeat(times.to_numpy(), stations)
+
+
+def test_validation_always_after_training():
+    """모든 fold에서 검증 시각은 학습 시각보다 뒤이고, 같은 시각은 한쪽에만 속함"""
+    timestamps = _hourly_timestamps()
+    rng = np.random.default_rng(0)
+    shuffled = rng.permutation(len(timestamps))
+    timestamps = timestamps[shuffled]
+
+    folds = list(TimeBlockedSplit(timestamps, n_splits=3).split())
+
+    assert len(folds) == 3
+    for train_idx, val_idx in folds:
+        assert timestamps[train_idx].max() < timestamps[val_idx].min()
+        assert not set(timestamps[train_idx]) & set(timestamps[val_idx])
+    # expanding window: 학습 구간이 fold마다 늘어남
+    assert [len(t) for t, _ in folds] == sorted(len(t) for t, _ in folds)
+
+
+def test_cached_folds_are_scaled_per_fold():
+    """캐시 행렬의 각 fold 학습 구간은 해당 구간 기준으로 표준화됨"""
+    timestamps = _hourly_timestamps()
+    X = np.arange(len(timestamps) * 2, dtype=np.float32).reshape(-1, 2)
+    y = np.arange(len(timestamps), dtype=np.float64)
+
+    folds = time_ordered_folds(X, y, timestamps, n_splits=3, gap_hours=2)
+
+    print(f"캐시 행렬: {folds.X.shape}, fold 크기: {[(len(t), len(v)) for t, v in folds.cv]}")
+
+    assert folds.X.shape[0] == sum(len(t) + len(v) for t, v in folds.cv)
+    for (train_slice, val_slice), (train_idx, val_idx) in zip(folds.cv, folds.fold_indices):
+        assert np.allclose(folds.X[train_slice].mean(axis=0), 0, atol=1e-4)
+        assert np.array_equal(folds.y[val_slice], y[val_idx])
+
+
+def test_time_split_ranges_are_chronological():
+    """시간순 분할: train < val < test 이고 같은 시각은 한 구간에만 속함"""
+    timestamps = _hourly_timestamps(hours=50)
+    shuffled = np.random.default_rng(1).permutation(len(timestamps))
+    timestamps = timestamps[shuffled]
+
+    order, train_range, val_range, test_range = time_split_ranges(timestamps, test_size=0.2, val_size=0.2)
+    ordered = timestamps[order]
+
+    assert ordered[train_range].max() < ordered[val_range].min()
+    assert ordered[val_range].max() < ordered[test_range].min()
+    assert test_range.stop == len(timestamps)
+    # 이미 정렬된 입력은 다시 정렬하지 않음
+    assert time_split_ranges(ordered)[0] is None
+
+
+def test_time_split_ranges_reject_empty_ranges():
+    """고유 시각이 적어 train/val/test 중 빈 구간이 생기면 행 수를 담은 ValueError"""
+    cases = [
+        _hourly_timestamps(hours=1, stations=10),  # 모든 행이 같은 시각 → train 0행
+        _hourly_timestamps(hours=2, stations=5),   # 경계가 두 시각에 몰림 → val 0행
+        _hourly_timestamps(hours=0),
+    ]
+    for timestamps in cases:
+        try:
+            time_split_ranges(timestamps, test_size=0.2, val_size=0.2)
+        except ValueError as e:
+            print(f"예상된 오류: {e}")
+            assert "행" in str(e)
+        else:
+            raise AssertionError(f"빈 구간 분할이 허용됨: {len(timestamps)}행")
+
+    # 고유 시각이 세 개면 각 구간에 한 시각씩
+    _, train_range, val_range, test_range = time_split_ranges(_hourly_timestamps(hours=3, stations=2),
+                                                              test_size=0.34, val_size=0.33)
+    assert (train_range.stop, val_range.stop, test_range.stop) == (2, 4, 6)
+
+
+if __name__ == "__main__":
+    test_validation_always_after_training()
+    test_cached_folds_are_scaled_per_fold()
+    test_time_split_ranges_are_chronological()
+    test_time_split_ranges_reject_empty_ranges()
+    print("✅ 시간 순서 CV 테스트 통과")